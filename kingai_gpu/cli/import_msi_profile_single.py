@@ -21,6 +21,7 @@ the MSI Afterburner Tools repo for VF curve manipulation.
 Usage (from CLI):
   kingai-gpu import-msi  path/to/VEN_10DE...cfg                # apply Startup
   kingai-gpu import-msi  path/to/VEN_10DE...cfg --section Profile3
+  kingai-gpu import-msi  path/to/VEN_10DE...cfg -S Profile1 -S Profile2 --save out.json
   kingai-gpu import-msi  path/to/VEN_10DE...cfg --save out.json  # convert only
   kingai-gpu import-msi  path/to/VEN_10DE...cfg --list           # list sections
 
@@ -33,8 +34,21 @@ from __future__ import annotations
 
 import json
 import os
-from datetime import datetime
+import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from time import localtime, strftime
+from types import SimpleNamespace
+from typing import Callable, Iterable
+
+# orjson is optional — noticeably faster than stdlib json when --save writes
+# many profiles, but nothing here depends on it.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # ── Auto-detect Afterburner install ─────────────────────────────────────
@@ -59,28 +73,41 @@ def find_afterburner_profiles() -> list[Path]:
 
     Checks standard install paths, then falls back to registry lookup.
     Returns a list of Path objects for per-GPU configs (VEN_* pattern).
+    The folder lookup is cached; the listing is re-read on every call.
     """
-    profiles_dir = None
-
-    # Check standard paths
-    for p in _STANDARD_PATHS:
-        if p.is_dir():
-            profiles_dir = p
-            break
-
-    # Try registry if standard paths don't exist
-    if profiles_dir is None:
-        profiles_dir = _find_via_registry()
-
+    profiles_dir = _detect_profiles_dir()
     if profiles_dir is None:
         return []
 
     # Per-GPU configs match VEN_xxxx&DEV_...cfg pattern
     # VEN_10DE = NVIDIA, VEN_1002 = AMD
-    cfgs = sorted(profiles_dir.glob("VEN_*.cfg"))
+    # scandir + plain prefix/suffix checks: no fnmatch regex per entry, and
+    # DirEntry.is_file() reuses the type info the directory listing returned.
+    with os.scandir(profiles_dir) as it:
+        cfgs = [
+            Path(e.path) for e in it
+            if e.name.startswith("VEN_") and e.name.endswith(".cfg") and e.is_file()
+        ]
+    cfgs.sort(key=lambda p: p.name)
     return cfgs
 
 
+@lru_cache(maxsize=1)
+def _detect_profiles_dir() -> Path | None:
+    """Locate the Afterburner Profiles folder (standard paths, then registry).
+
+    The install location doesn't change while we're running, so the stat
+    and registry traffic only happens once per process.
+    """
+    # Check standard paths
+    for p in _STANDARD_PATHS:
+        if p.is_dir():
+            return p
+
+    # Try registry if standard paths don't exist
+    return _find_via_registry()
+
+
 def _find_via_registry() -> Path | None:
     """Try to find Afterburner install path from Windows registry."""
     try:
@@ -108,36 +135,129 @@ def _find_via_registry() -> Path | None:
 # We don't use configparser because AB files have duplicate keys and
 # hex blobs that confuse Python's INI parser. Simple split is safer.
 
-def _parse_sections(text: str) -> dict[str, str]:
-    """Split INI text into {section_name: raw_body} dict."""
-    sections: dict[str, str] = {}
-    current: str | None = None
-    lines: list[str] = []
-    for line in text.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("[") and stripped.endswith("]"):
-            if current is not None:
-                sections[current] = "\n".join(lines)
-            current = stripped[1:-1]
-            lines = []
-        else:
-            lines.append(line)
-    if current is not None:
-        sections[current] = "\n".join(lines)
+# The only keys we ever read out of a section (see _FIELD_MAP plus the
+# FanMode / CoreVoltageBoost probes). Compiled once; matching a line against
+# it rejects VFCurve blobs, OSD layout etc. in C without splitting them.
+_KEY_RE = re.compile(
+    r"(CoreClkBoost|MemClkBoost|PowerLimit|ThermalLimit|FanMode|FanSpeed|CoreVoltageBoost)"
+    r"\s*=\s*(.*?)\s*$"
+)
+
+
+def _parse_sections(lines: Iterable[str]) -> dict[str, dict[str, str]]:
+    """Split INI lines into {section_name: {key: value}} in a single pass.
+
+    Accepts any iterable of lines (typically an open file handle), so the
+    .cfg is streamed instead of being read into memory and split first.
+    Only keys matching _KEY_RE are kept; every section still gets an entry
+    so "section not found" errors can list what's available.
+    AB files repeat some keys within a section — the first occurrence wins,
+    matching what a top-down line scan would find.
+    """
+    sections: dict[str, dict[str, str]] = {}
+    body: dict[str, str] = {}
+    for line in lines:
+        # Headers are rare — test the first char instead of stripping every
+        # line. Value lines need no pre-strip: _KEY_RE drops the newline.
+        if line.startswith("[") and (end := line.find("]")) != -1:
+            body = {}
+            sections[line[1:end].strip()] = body
+            continue
+        if m := _KEY_RE.match(line):
+            body.setdefault(m.group(1), m.group(2))
     return sections
 
 
-def _get_value(block: str, key: str) -> str | None:
-    """Read a key=value from an INI section body. Returns None if missing/empty."""
-    for line in block.splitlines():
-        if line.strip().startswith(key + "="):
-            val = line.split("=", 1)[1].strip()
-            return val if val else None
-    return None
+def _open_cfg(p: Path):
+    """Open a .cfg for streaming, raising FileNotFoundError with an absolute path.
+
+    The open() itself is the existence check — no separate stat, and the
+    path is only resolve()d when we need it for the error message.
+    """
+    try:
+        # AB configs are ASCII with CRLF line endings
+        return p.open("r", encoding="ascii", errors="replace", newline="")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {p.resolve()}") from None
+
+
+def _read_sections(p: Path) -> dict[str, dict[str, str]]:
+    """Open and parse a .cfg into {section_name: {key: value}}."""
+    with _open_cfg(p) as f:
+        return _parse_sections(f)
+
+
+def _scan_summary(p: Path) -> dict[str, dict[str, str]]:
+    """One pass over a .cfg collecting only the --list keys per profile section.
+
+    Returns {section_name: {key: value}} for every section except Defaults
+    and Settings, in file order. Bodies of the skipped sections are never
+    looked at.
+    """
+    rows: dict[str, dict[str, str]] = {}
+    row: dict[str, str] | None = None
+    with _open_cfg(p) as f:
+        for line in f:
+            if line.startswith("[") and (end := line.find("]")) != -1:
+                name = line[1:end].strip()
+                if name in ("Defaults", "Settings"):
+                    row = None
+                else:
+                    row = rows.setdefault(name, {})
+                continue
+            if row is not None and (m := _KEY_RE.match(line)):
+                row.setdefault(m.group(1), m.group(2))
+    return rows
 
 
 # ── Profile extraction ──────────────────────────────────────────────────
 
+@dataclass(slots=True)
+class ImportedProfile:
+    """OC settings extracted from one AB section.
+
+    Fields left as None weren't present (or weren't parseable) in the
+    section and are omitted from to_dict(), so a saved profile only
+    carries the settings AB actually had.
+    """
+
+    source_file: str
+    source_section: str
+    imported_at: str
+    core_offset_mhz: int | None = None
+    mem_offset_mhz: int | None = None
+    power_pct: int | None = None
+    thermal_c: int | None = None
+    fan_pct: int | None = None
+    fan_auto: bool | None = None
+    voltage_boost_mv: int | None = None   # informational, never applied
+
+    def to_dict(self) -> dict:
+        """KingAi JSON profile format (what --save writes, oc --load reads)."""
+        d: dict = {
+            "kingai_gpu_profile": "1.0",
+            "imported_from": "msi_afterburner",
+            "imported_at": self.imported_at,
+            "source_file": self.source_file,
+            "source_section": self.source_section,
+        }
+        for key in ("core_offset_mhz", "mem_offset_mhz", "power_pct",
+                    "thermal_c", "fan_pct", "fan_auto"):
+            val = getattr(self, key)
+            if val is not None:
+                d[key] = val
+        if self.voltage_boost_mv is not None:
+            d["_voltage_boost_mv"] = self.voltage_boost_mv
+            d["_note_voltage"] = "Voltage offset not applied (not yet supported)"
+        return d
+
+    def to_json(self) -> bytes:
+        """Serialize to_dict() as indented UTF-8 JSON (orjson when available)."""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2)
+        return json.dumps(self.to_dict(), indent=2).encode("utf-8")
+
+
 # These are the only keys we can map to NVAPI Set operations.
 # Everything else in the .cfg (VFCurve, shader clocks, voltage rails,
 # monitoring sources, OSD layout) is AB-specific and gets ignored.
@@ -151,10 +271,11 @@ _FIELD_MAP = {
 }
 
 
-def extract_profile(cfg_path: str, section: str = "Startup") -> dict:
+def extract_profile(cfg_path: str, section: str = "Startup") -> ImportedProfile:
     """Read a .cfg file and extract OC settings from the given section.
 
-    Returns a dict in KingAi profile format (same as --save produces):
+    Returns an ImportedProfile; its to_dict() is the KingAi profile format
+    (same as --save produces):
       {
         "kingai_gpu_profile": "1.0",
         "imported_from": "msi_afterburner",
@@ -165,52 +286,68 @@ def extract_profile(cfg_path: str, section: str = "Startup") -> dict:
         ...
       }
     """
-    p = Path(cfg_path).resolve()
-    if not p.exists():
-        raise FileNotFoundError(f"Config file not found: {p}")
+    p = Path(cfg_path)
+    return extract_profile_from_parsed(_read_sections(p), section, p.name)
 
-    # AB configs are ASCII with CRLF line endings
-    text = p.read_text(encoding="ascii", errors="replace")
-    sections = _parse_sections(text)
 
+def extract_profile_from_parsed(
+    sections: dict[str, dict[str, str]], section: str, source_file: str
+) -> ImportedProfile:
+    """Same as extract_profile(), but from an already-parsed .cfg.
+
+    Lets a batch import parse the file once and pull several sections out
+    of it. source_file is only used for the error message and the
+    "source_file" field.
+    """
     if section not in sections:
         available = [s for s in sections if s not in ("Defaults", "Settings")]
         raise KeyError(
-            f"Section [{section}] not found in {p.name}. "
+            f"Section [{section}] not found in {source_file}. "
             f"Available: {', '.join(available)}"
         )
 
     block = sections[section]
 
-    # Build profile dict from mapped fields
-    profile: dict = {
-        "kingai_gpu_profile": "1.0",
-        "imported_from": "msi_afterburner",
-        "imported_at": datetime.now().isoformat(timespec="seconds"),
-        "source_file": p.name,
-        "source_section": section,
-    }
-
-    for ab_key, (our_key, convert) in _FIELD_MAP.items():
-        raw = _get_value(block, ab_key)
-        if raw is not None:
-            try:
-                profile[our_key] = convert(raw)
-            except (ValueError, TypeError):
-                pass  # skip unparseable values silently
+    profile = ImportedProfile(
+        source_file=source_file,
+        source_section=section,
+        imported_at=strftime("%Y-%m-%dT%H:%M:%S", localtime()),
+    )
+
+    # One pass over the section; each line costs a single _FIELD_MAP probe.
+    # FanMode / CoreVoltageBoost aren't Set fields — capture them on the way
+    # past and apply them after the loop.
+    fan_mode = vboost = None
+    for ab_key, raw in block.items():
+        mapping = _FIELD_MAP.get(ab_key)
+        if mapping is None:
+            if ab_key == "FanMode":
+                fan_mode = raw
+            elif ab_key == "CoreVoltageBoost":
+                vboost = raw
+            continue
+        if not raw:
+            continue
+        our_key, convert = mapping
+        try:
+            setattr(profile, our_key, convert(raw))
+        except (ValueError, TypeError):
+            pass  # skip unparseable values silently
 
     # Fan mode: if FanMode=0 (auto), don't include fan_pct
     # (it would override the user's auto curve with a fixed speed)
-    fan_mode = _get_value(block, "FanMode")
     if fan_mode == "0":
-        profile.pop("fan_pct", None)
-        profile["fan_auto"] = True
+        profile.fan_pct = None
+        profile.fan_auto = True
 
     # Voltage boost (informational — we don't set this via NVAPI currently)
-    vboost = _get_value(block, "CoreVoltageBoost")
-    if vboost and int(vboost) != 0:
-        profile["_voltage_boost_mv"] = int(vboost)
-        profile["_note_voltage"] = "Voltage offset not applied (not yet supported)"
+    if vboost:
+        try:
+            mv = int(vboost)
+        except ValueError:
+            mv = 0  # unparseable — treat like "no boost", same as other fields
+        if mv != 0:
+            profile.voltage_boost_mv = mv
 
     return profile
 
@@ -220,24 +357,15 @@ def list_sections(cfg_path: str) -> list[dict]:
 
     Returns a list of dicts: [{"section": "Startup", "core": "+0", ...}, ...]
     """
-    p = Path(cfg_path).resolve()
-    if not p.exists():
-        raise FileNotFoundError(f"Config file not found: {p}")
-
-    text = p.read_text(encoding="ascii", errors="replace")
-    sections = _parse_sections(text)
-
     results = []
-    # Only show sections that contain OC data (skip Defaults, Settings)
-    for name, block in sections.items():
-        if name in ("Defaults", "Settings"):
-            continue
-        core_raw = _get_value(block, "CoreClkBoost")
-        mem_raw = _get_value(block, "MemClkBoost")
-        power = _get_value(block, "PowerLimit")
-        thermal = _get_value(block, "ThermalLimit")
-        fan_mode = _get_value(block, "FanMode")
-        fan_spd = _get_value(block, "FanSpeed")
+    # _scan_summary already drops the non-OC sections (Defaults, Settings)
+    for name, block in _scan_summary(Path(cfg_path)).items():
+        core_raw = block.get("CoreClkBoost")
+        mem_raw = block.get("MemClkBoost")
+        power = block.get("PowerLimit")
+        thermal = block.get("ThermalLimit")
+        fan_mode = block.get("FanMode")
+        fan_spd = block.get("FanSpeed")
 
         core_mhz = f"{int(core_raw) // 1000:+d}" if core_raw else "N/A"
         mem_mhz = f"{int(mem_raw) // 1000:+d}" if mem_raw else "N/A"
@@ -254,10 +382,51 @@ def list_sections(cfg_path: str) -> list[dict]:
     return results
 
 
+# NVAPI entry points used by the apply path, bound once on first use.
+# nvapi.py loads the DLL and resolves function pointers at import time, so
+# repeated applies in one process shouldn't go back through the import.
+_NVAPI: SimpleNamespace | None = None
+
+
+def _load_nvapi() -> SimpleNamespace:
+    """Return the cached NVAPI function bundle (raises ImportError off Windows)."""
+    global _NVAPI
+    if _NVAPI is None:
+        from kingai_gpu.lib.nvapi import (
+            NvApiError,
+            enable_oc,
+            set_core_offset,
+            set_fan_auto,
+            set_fan_speed,
+            set_mem_offset,
+            set_power_limit,
+            set_thermal_limit,
+        )
+        _NVAPI = SimpleNamespace(
+            NvApiError=NvApiError,
+            enable_oc=enable_oc,
+            set_core_offset=set_core_offset,
+            set_fan_auto=set_fan_auto,
+            set_fan_speed=set_fan_speed,
+            set_mem_offset=set_mem_offset,
+            set_power_limit=set_power_limit,
+            set_thermal_limit=set_thermal_limit,
+        )
+    return _NVAPI
+
+
 # ── CLI handler ─────────────────────────────────────────────────────────
 
+# Vendor filters for auto-detected per-GPU configs. The vendor ID always
+# leads the filename (VEN_10DE&DEV_...), so an anchored match is enough.
+_NV_CFG_RE = re.compile(r"VEN_10DE", re.IGNORECASE)
+_AMD_CFG_RE = re.compile(r"VEN_1002", re.IGNORECASE)
+
+
 def cmd_import_msi(args) -> int:
     """Handle the 'import-msi' subcommand."""
+    # Plain writes: no print() sep/end handling, still goes through the tee
+    write = sys.stdout.write
 
     cfg_path = args.cfg
 
@@ -267,50 +436,50 @@ def cmd_import_msi(args) -> int:
     if args.auto or cfg_path is None:
         found = find_afterburner_profiles()
         if not found:
-            print("Could not find MSI Afterburner Profiles folder.")
-            print("Checked:")
+            write("Could not find MSI Afterburner Profiles folder.\n")
+            write("Checked:\n")
             for p in _STANDARD_PATHS:
-                print(f"  {p}")
-            print("  Windows registry (HKLM\\SOFTWARE\\MSI\\Afterburner)")
-            print("\nProvide the .cfg path manually instead:")
-            print("  kingai-gpu import-msi path/to/VEN_10DE...cfg --list")
+                write(f"  {p}\n")
+            write("  Windows registry (HKLM\\SOFTWARE\\MSI\\Afterburner)\n")
+            write("\nProvide the .cfg path manually instead:\n")
+            write("  kingai-gpu import-msi path/to/VEN_10DE...cfg --list\n")
             return 1
 
         # Filter: show NVIDIA (VEN_10DE) configs. Flag AMD (VEN_1002) as unsupported.
-        nvidia_cfgs = [f for f in found if "VEN_10DE" in f.name.upper()]
-        amd_cfgs = [f for f in found if "VEN_1002" in f.name.upper()]
+        nvidia_cfgs = [f for f in found if _NV_CFG_RE.match(f.name)]
+        amd_cfgs = [f for f in found if _AMD_CFG_RE.match(f.name)]
 
         if not nvidia_cfgs and not amd_cfgs:
-            print(f"Found Profiles folder but no per-GPU configs: {found[0].parent}")
+            write(f"Found Profiles folder but no per-GPU configs: {found[0].parent}\n")
             return 1
 
         # If no specific cfg was given, just list what we found
         if cfg_path is None:
-            print(f"Found {len(nvidia_cfgs)} NVIDIA config(s) in {found[0].parent}:")
+            write(f"Found {len(nvidia_cfgs)} NVIDIA config(s) in {found[0].parent}:\n")
             for f in nvidia_cfgs:
-                print(f"  {f.name}")
+                write(f"  {f.name}\n")
             if amd_cfgs:
-                print(f"\nAlso found {len(amd_cfgs)} AMD config(s) (not yet supported):")
+                write(f"\nAlso found {len(amd_cfgs)} AMD config(s) (not yet supported):\n")
                 for f in amd_cfgs:
-                    print(f"  {f.name}")
+                    write(f"  {f.name}\n")
             # If exactly 1 NVIDIA config and --list or --section given, use it
             if len(nvidia_cfgs) == 1:
                 cfg_path = str(nvidia_cfgs[0])
-                print(f"\nAuto-selected: {nvidia_cfgs[0].name}")
+                write(f"\nAuto-selected: {nvidia_cfgs[0].name}\n")
             elif len(nvidia_cfgs) > 1:
-                print("\nMultiple configs found. Specify which one:")
-                print("  kingai-gpu import-msi <path> --list")
+                write("\nMultiple configs found. Specify which one:\n")
+                write("  kingai-gpu import-msi <path> --list\n")
                 if not args.list and not args.save:
                     return 0
             else:
-                print("\nNo NVIDIA configs found (AMD not yet supported).")
+                write("\nNo NVIDIA configs found (AMD not yet supported).\n")
                 return 1
 
         if cfg_path is None:
             return 0
 
     if cfg_path is None:
-        print("No config file specified. Use --auto or provide a path.")
+        write("No config file specified. Use --auto or provide a path.\n")
         return 1
 
     # List mode — just show what's in the file
@@ -318,25 +487,39 @@ def cmd_import_msi(args) -> int:
         try:
             profiles = list_sections(cfg_path)
         except (FileNotFoundError, OSError) as e:
-            print(f"Error: {e}")
+            write(f"Error: {e}\n")
             return 1
         if not profiles:
-            print("No profile sections found.")
+            write("No profile sections found.\n")
             return 1
-        print(f"Profiles in {Path(cfg_path).name}:")
-        print(f"  {'Section':<20} {'Core':>6} {'Mem':>6} {'Power':>7} {'Thermal':>8} {'Fan':>5}")
-        print(f"  {'─' * 20} {'─' * 6} {'─' * 6} {'─' * 7} {'─' * 8} {'─' * 5}")
-        for p in profiles:
-            print(f"  {p['section']:<20} {p['core']:>6} {p['mem']:>6} "
-                  f"{p['power']:>7} {p['thermal']:>8} {p['fan']:>5}")
+        # Build the whole table and write it once — one write per sink
+        # through the logging tee instead of one per row.
+        rows = [
+            f"Profiles in {Path(cfg_path).name}:",
+            f"  {'Section':<20} {'Core':>6} {'Mem':>6} {'Power':>7} {'Thermal':>8} {'Fan':>5}",
+            f"  {'─' * 20} {'─' * 6} {'─' * 6} {'─' * 7} {'─' * 8} {'─' * 5}",
+        ]
+        rows += [
+            f"  {p['section']:<20} {p['core']:>6} {p['mem']:>6} "
+            f"{p['power']:>7} {p['thermal']:>8} {p['fan']:>5}"
+            for p in profiles
+        ]
+        rows.append("")
+        write("\n".join(rows))
         return 0
 
-    # Extract the profile
-    section = args.section
+    # Extract the profile(s) — the .cfg is parsed once no matter how many
+    # --section flags were given.
+    section_names = args.section or ["Startup"]
+    cfg_name = Path(cfg_path).name
     try:
-        profile = extract_profile(cfg_path, section)
+        sections = _read_sections(Path(cfg_path))
+        profiles = [
+            (sec, extract_profile_from_parsed(sections, sec, cfg_name))
+            for sec in section_names
+        ]
     except (FileNotFoundError, KeyError, OSError) as e:
-        print(f"Error: {e}")
+        write(f"Error: {e}\n")
         return 1
 
     # Save-only mode — convert to KingAi JSON without applying
@@ -345,118 +528,131 @@ def cmd_import_msi(args) -> int:
         if save_path.suffix == "":
             save_path = save_path.with_suffix(".json")
         save_path.parent.mkdir(parents=True, exist_ok=True)
-        save_path.write_text(json.dumps(profile, indent=2), encoding="utf-8")
-        print(f"Converted [{section}] → {save_path}")
-        _print_profile_summary(profile)
+        for section, profile in profiles:
+            # Several sections → one file each, named <stem>_<section>.json
+            out = save_path if len(profiles) == 1 else save_path.with_stem(
+                f"{save_path.stem}_{section}")
+            out.write_bytes(profile.to_json())
+            write(f"Converted [{section}] → {out}\n")
+            _print_profile_summary(profile, write)
         return 0
 
     # Apply mode — import and apply to GPU via NVAPI
     try:
-        from kingai_gpu.lib.nvapi import (
-            NvApiError,
-            enable_oc,
-            set_core_offset,
-            set_fan_auto,
-            set_fan_speed,
-            set_mem_offset,
-            set_power_limit,
-            set_thermal_limit,
-        )
+        nv = _load_nvapi()
     except ImportError as e:
-        print(f"Error: {e}")
-        print("Applying OC settings requires Windows with NVIDIA drivers.")
-        print("Use --save to convert the profile without applying.")
+        write(f"Error: {e}\n")
+        write("Applying OC settings requires Windows with NVIDIA drivers.\n")
+        write("Use --save to convert the profile without applying.\n")
         return 1
 
     gpu = args.gpu
     try:
-        enable_oc(gpu)
-    except NvApiError as e:
-        print(f"Failed to initialize NVAPI: {e}")
+        nv.enable_oc(gpu)
+    except nv.NvApiError as e:
+        write(f"Failed to initialize NVAPI: {e}\n")
         return 1
 
-    print(f"Importing [{section}] from {Path(cfg_path).name} → GPU {gpu}...")
+    # Sections are applied in the order given; later ones override any
+    # setting an earlier one also touched.
+    for section, profile in profiles:
+        write(f"Importing [{section}] from {cfg_name} → GPU {gpu}...\n")
+
+        changes = _apply_profile(nv, profile, gpu, write)
+        if changes is None:
+            return 1
+
+        if profile.voltage_boost_mv is not None:
+            write(f"  ⚠ Voltage offset {profile.voltage_boost_mv}mV skipped "
+                  f"(not yet supported)\n")
+
+        if changes:
+            write(f"Applied to GPU {gpu}:\n")
+            write("".join(f"{c}\n" for c in changes))
+        else:
+            write("No applicable settings found in that profile section.\n")
+
+    return 0
+
+
+def _apply_profile(
+    nv: SimpleNamespace, profile: ImportedProfile, gpu: int, write: Callable[[str], object]
+) -> list[str] | None:
+    """Apply one extracted profile via NVAPI (OC must already be enabled).
 
+    Returns the human-readable change lines, or None if a Set call failed
+    (the error has already been written).
+    """
     changes = []
 
-    if "core_offset_mhz" in profile:
-        val = profile["core_offset_mhz"]
+    if profile.core_offset_mhz is not None:
+        val = profile.core_offset_mhz
         try:
-            set_core_offset(val, gpu)
+            nv.set_core_offset(val, gpu)
             changes.append(f"  Core offset:   {val:+d} MHz")
-        except NvApiError as e:
-            print(f"Failed to set core offset: {e}")
-            return 1
+        except nv.NvApiError as e:
+            write(f"Failed to set core offset: {e}\n")
+            return None
 
-    if "mem_offset_mhz" in profile:
-        val = profile["mem_offset_mhz"]
+    if profile.mem_offset_mhz is not None:
+        val = profile.mem_offset_mhz
         try:
-            set_mem_offset(val, gpu)
+            nv.set_mem_offset(val, gpu)
             changes.append(f"  Memory offset: {val:+d} MHz")
-        except NvApiError as e:
-            print(f"Failed to set memory offset: {e}")
-            return 1
+        except nv.NvApiError as e:
+            write(f"Failed to set memory offset: {e}\n")
+            return None
 
-    if "power_pct" in profile:
-        val = profile["power_pct"]
+    if profile.power_pct is not None:
+        val = profile.power_pct
         try:
-            set_power_limit(val, gpu)
+            nv.set_power_limit(val, gpu)
             changes.append(f"  Power limit:   {val}%")
-        except NvApiError as e:
-            print(f"Failed to set power limit: {e}")
-            return 1
+        except nv.NvApiError as e:
+            write(f"Failed to set power limit: {e}\n")
+            return None
 
-    if "thermal_c" in profile:
-        val = profile["thermal_c"]
+    if profile.thermal_c is not None:
+        val = profile.thermal_c
         try:
-            set_thermal_limit(val, gpu)
+            nv.set_thermal_limit(val, gpu)
             changes.append(f"  Thermal limit: {val}°C")
-        except NvApiError as e:
-            print(f"Failed to set thermal limit: {e}")
-            return 1
+        except nv.NvApiError as e:
+            write(f"Failed to set thermal limit: {e}\n")
+            return None
 
-    if profile.get("fan_auto"):
+    if profile.fan_auto:
         try:
-            set_fan_auto(gpu)
+            nv.set_fan_auto(gpu)
             changes.append(f"  Fan:           auto")
-        except NvApiError as e:
-            print(f"Failed to set fan auto: {e}")
-            return 1
-    elif "fan_pct" in profile:
-        val = profile["fan_pct"]
+        except nv.NvApiError as e:
+            write(f"Failed to set fan auto: {e}\n")
+            return None
+    elif profile.fan_pct is not None:
+        val = profile.fan_pct
         try:
-            set_fan_speed(val, gpu)
+            nv.set_fan_speed(val, gpu)
             changes.append(f"  Fan speed:     {val}%")
-        except NvApiError as e:
-            print(f"Failed to set fan speed: {e}")
-            return 1
+        except nv.NvApiError as e:
+            write(f"Failed to set fan speed: {e}\n")
+            return None
 
-    if "_voltage_boost_mv" in profile:
-        print(f"  ⚠ Voltage offset {profile['_voltage_boost_mv']}mV skipped (not yet supported)")
-
-    if changes:
-        print(f"Applied to GPU {gpu}:")
-        for c in changes:
-            print(c)
-    else:
-        print("No applicable settings found in that profile section.")
-
-    return 0
+    return changes
 
 
-def _print_profile_summary(profile: dict):
+def _print_profile_summary(profile: ImportedProfile, write: Callable[[str], object]):
     """Print a readable summary of extracted profile values."""
-    if "core_offset_mhz" in profile:
-        print(f"  Core offset:   {profile['core_offset_mhz']:+d} MHz")
-    if "mem_offset_mhz" in profile:
-        print(f"  Memory offset: {profile['mem_offset_mhz']:+d} MHz")
-    if "power_pct" in profile:
-        print(f"  Power limit:   {profile['power_pct']}%")
-    if "thermal_c" in profile:
-        print(f"  Thermal limit: {profile['thermal_c']}°C")
-    if profile.get("fan_auto"):
-        print(f"  Fan:           auto")
-    elif "fan_pct" in profile:
-        print(f"  Fan speed:     {profile['fan_pct']}%")
-    if "_voltage_boost_mv" in profile:
-        print(f"  Voltage boost: {profile['_voltage_boost_mv']}mV (not applied)")
\ No newline at end of file
+    if profile.core_offset_mhz is not None:
+        write(f"  Core offset:   {profile.core_offset_mhz:+d} MHz\n")
+    if profile.mem_offset_mhz is not None:
+        write(f"  Memory offset: {profile.mem_offset_mhz:+d} MHz\n")
+    if profile.power_pct is not None:
+        write(f"  Power limit:   {profile.power_pct}%\n")
+    if profile.thermal_c is not None:
+        write(f"  Thermal limit: {profile.thermal_c}°C\n")
+    if profile.fan_auto:
+        write(f"  Fan:           auto\n")
+    elif profile.fan_pct is not None:
+        write(f"  Fan speed:     {profile.fan_pct}%\n")
+    if profile.voltage_boost_mv is not None:
+        write(f"  Voltage boost: {profile.voltage_boost_mv}mV (not applied)\n")
\ No newline at end of file
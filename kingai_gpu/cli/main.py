@@ -16,8 +16,10 @@ Usage examples:
     kingai-gpu oc --save profile.json          # snapshot current settings
     kingai-gpu oc --load profile.json          # apply saved profile
     kingai-gpu memtest [--sweep] [--duration N]
+    kingai-gpu memtest --all-gpus              # pattern-test every GPU at once
     kingai-gpu import-msi path/to/VEN_10DE...cfg --list
     kingai-gpu import-msi path/to/VEN_10DE...cfg --section Profile3
+    kingai-gpu import-msi path/to/VEN_10DE...cfg -S Profile1 -S Profile2 --save out.json
     kingai-gpu info
 
 Design: Imports are deferred inside each branch so that:
@@ -31,7 +33,7 @@ from __future__ import annotations
 import argparse
 import os
 import sys
-from datetime import datetime
+from time import localtime, strftime
 
 
 # ── Logging tee ─────────────────────────────────────────────────────────────
@@ -45,6 +47,12 @@ class _Tee:
         self._stream.write(data)
         self._log.write(data)
 
+    def writelines(self, lines):
+        # Join once so a batch of fragments costs two writes, not 2×N
+        data = "".join(lines)
+        self._stream.write(data)
+        self._log.write(data)
+
     def flush(self):
         self._stream.flush()
         self._log.flush()
@@ -62,7 +70,7 @@ def _init_log(command: str) -> str:
     repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     logs_dir = os.path.join(repo_root, "logs")
     os.makedirs(logs_dir, exist_ok=True)
-    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    stamp = strftime("%Y%m%d_%H%M%S", localtime())
     log_path = os.path.join(logs_dir, f"{command}_{stamp}.log")
     log_file = open(log_path, "w", encoding="utf-8")
     sys.stdout = _Tee(sys.__stdout__, log_file)
@@ -70,18 +78,7 @@ def _init_log(command: str) -> str:
     return log_path
 
 
-def build_parser() -> argparse.ArgumentParser:
-    """Build the argument parser with all subcommands.
-
-    Each subcommand maps 1:1 to a handler function in its own module.
-    Aliases ('mon', 'm', 'mem') are provided for faster typing in terminal.
-    """
-    p = argparse.ArgumentParser(
-        prog="kingai-gpu",
-        description="KingAi GPU Overclocker — monitoring, OC control, and stability testing",
-    )
-    sub = p.add_subparsers(dest="command", help="Command to run")
-
+def _add_monitor(sub) -> None:
     # ── monitor ── Real-time GPU monitoring dashboard
     # Supports multiple output formats for different use cases:
     #   default = full box-drawing dashboard (human viewing)
@@ -96,6 +93,8 @@ def build_parser() -> argparse.ArgumentParser:
     mon.add_argument("--gpu", "-g", type=int, default=0, help="GPU index")
     mon.add_argument("--compact", "-c", action="store_true", help="Single-line compact output")
 
+
+def _add_oc(sub) -> None:
     # ── oc ── Overclock / undervolt control (Windows-only via NVAPI)
     # All values are offsets from stock (e.g., --core +150 = +150 MHz above base).
     # If no Set flags are given, shows current OC status (read-only).
@@ -108,12 +107,15 @@ def build_parser() -> argparse.ArgumentParser:
     oc.add_argument("--fan-auto", action="store_true", help="Reset fan to auto")
     oc.add_argument("--reset", action="store_true", help="Reset all to stock")
     oc.add_argument("--save", type=str, default=None, metavar="PATH",
-                    help="Save current OC settings to JSON profile")
+                    help="Save current OC settings to JSON profile "
+                         "(after applying any Set flags)")
     oc.add_argument("--load", type=str, default=None, metavar="PATH",
                     help="Load and apply OC settings from JSON profile")
     oc.add_argument("--gpu", "-g", type=int, default=0, help="GPU index")
     oc.add_argument("--status", "-s", action="store_true", help="Show current OC status")
 
+
+def _add_memtest(sub) -> None:
     # ── memtest ── VRAM stability testing
     # Default = single pass pattern test (write/read/verify VRAM patterns).
     # --sweep = automated memory OC sweep (set offset, measure BW, detect cliff).
@@ -125,10 +127,16 @@ def build_parser() -> argparse.ArgumentParser:
     mt.add_argument("--step", type=int, default=50, help="Sweep step size (MHz)")
     mt.add_argument("--gpu", "-g", type=int, default=0, help="GPU index")
     mt.add_argument("--size", type=int, default=256, help="Test buffer size (MB)")
+    mt.add_argument("--all-gpus", action="store_true",
+                    help="Pattern-test every GPU concurrently (not with --sweep)")
 
+
+def _add_info(sub) -> None:
     # ── info ── Static GPU information (no continuous monitoring)
     sub.add_parser("info", help="Detailed GPU information")
 
+
+def _add_import_msi(sub) -> None:
     # ── import-msi ── Import MSI Afterburner per-GPU config profiles
     # Reads a VEN_10DE&DEV_xxxx...cfg file and applies a [ProfileN] or [Startup]
     # section. Can also convert to KingAi JSON format (--save) or list all
@@ -138,14 +146,52 @@ def build_parser() -> argparse.ArgumentParser:
                      help="Path to per-GPU .cfg file (or use --auto)")
     imp.add_argument("--auto", "-a", action="store_true",
                      help="Auto-detect Afterburner install and find per-GPU configs")
-    imp.add_argument("--section", "-S", default="Startup",
-                     help="Section to import (default: Startup)")
+    imp.add_argument("--section", "-S", action="append", default=None,
+                     help="Section to import; repeat to batch several "
+                          "(default: Startup)")
     imp.add_argument("--list", "-l", action="store_true",
                      help="List all profile sections in the .cfg")
     imp.add_argument("--save", type=str, default=None, metavar="PATH",
                      help="Convert to KingAi JSON profile (don't apply)")
     imp.add_argument("--gpu", "-g", type=int, default=0, help="GPU index")
 
+
+# Subcommand name (and aliases) → function that registers its subparser.
+# Order matters for --help output: builders run in this order when the
+# full parser is needed.
+_SUBPARSER_BUILDERS = {
+    "monitor": _add_monitor, "mon": _add_monitor, "m": _add_monitor,
+    "oc": _add_oc,
+    "memtest": _add_memtest, "mem": _add_memtest,
+    "info": _add_info,
+    "import-msi": _add_import_msi,
+}
+
+
+def build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Build the argument parser.
+
+    Each subcommand maps 1:1 to a handler function in its own module.
+    Aliases ('mon', 'm', 'mem') are provided for faster typing in terminal.
+
+    If command names a known subcommand, only that subparser is registered —
+    the invocation can't reach any other, so building them is wasted CLI
+    startup time. Otherwise (no args, --help, typo) the full parser is built
+    so help and "invalid choice" errors list every command.
+    """
+    p = argparse.ArgumentParser(
+        prog="kingai-gpu",
+        description="KingAi GPU Overclocker — monitoring, OC control, and stability testing",
+    )
+    sub = p.add_subparsers(dest="command", help="Command to run")
+
+    builder = _SUBPARSER_BUILDERS.get(command)
+    if builder is not None:
+        builder(sub)
+    else:
+        for add in dict.fromkeys(_SUBPARSER_BUILDERS.values()):
+            add(sub)
+
     return p
 
 
@@ -155,7 +201,9 @@ def main(argv: list[str] | None = None) -> int:
     Returns 0 on success, non-zero on error. Designed to be called
     from the console_scripts entry point defined in pyproject.toml.
     """
-    parser = build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = build_parser(argv[0] if argv else None)
     args = parser.parse_args(argv)
 
     # No subcommand given — show help
@@ -167,7 +215,7 @@ def main(argv: list[str] | None = None) -> int:
     cmd_name = args.command if args.command not in ("mon", "m") else "monitor"
     cmd_name = cmd_name if cmd_name != "mem" else "memtest"
     log_path = _init_log(cmd_name)
-    ts = datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
+    ts = strftime("[%Y-%m-%d %H:%M:%S]", localtime())
     print(f"{ts} kingai-gpu {cmd_name} — log: {log_path}")
 
     # Deferred imports: each subcommand only imports what it needs.
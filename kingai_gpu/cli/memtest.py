@@ -27,12 +27,17 @@ Falls back to pure numpy + system RAM if cupy is unavailable (proof of concept).
 
 from __future__ import annotations
 
+import math
+import statistics
 import sys
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime
 
-from kingai_gpu.lib.nvml import snapshot
+from kingai_gpu.lib.nvml import GpuSnapshot, gpu_count, snapshot
 
 
 # ── Try to import CUDA-capable libraries ──
@@ -107,6 +112,16 @@ class BandwidthResult:
     power_draw: float = 0.0
 
 
+# SweepResult.summary() table layout — built once, not per call/row
+_SWEEP_HEADER = (
+    f"  {'Offset':>8}  {'BW (GB/s)':>10}  {'Errors':>7}  {'Temp':>5}  {'Clock':>7}  {'Power':>7}"
+)
+_SWEEP_RULE = f"  {'─'*8}  {'─'*10}  {'─'*7}  {'─'*5}  {'─'*7}  {'─'*7}"
+_SWEEP_ROW_FMT = (
+    "  {offset:>8}  {bw:>10.1f}  {errors:>7}  {temp:>4}°  {clock:>6}M  {power:>5.0f}W{marker}"
+)
+
+
 @dataclass
 class SweepResult:
     """Full memory OC sweep result.
@@ -124,6 +139,18 @@ class SweepResult:
     cliff_offset_mhz: int = -1  # -1 = no cliff detected — BW never decreased
     crash_offset_mhz: int = -1  # -1 = no crash — all steps completed
 
+    def _marker(self, r: BandwidthResult) -> str:
+        # A row can be several of these at once (e.g. the cliff step can also
+        # be the one that errored) — show every tag that applies.
+        tags = []
+        if r.mem_offset_mhz == self.optimal_offset_mhz:
+            tags.append("OPTIMAL")
+        if r.mem_offset_mhz == self.cliff_offset_mhz:
+            tags.append("CLIFF")
+        if r.errors > 0:
+            tags.append(f"{r.errors} ERRORS")
+        return f" ← {', '.join(tags)}" if tags else ""
+
     def summary(self) -> str:
         lines = [
             f"═══ Memory OC Sweep: {self.gpu_name} ═══",
@@ -136,25 +163,16 @@ class SweepResult:
         if self.crash_offset_mhz >= 0:
             lines.append(f"  Crash point:       +{self.crash_offset_mhz} MHz")
         lines.append("")
-        lines.append(f"  {'Offset':>8}  {'BW (GB/s)':>10}  {'Errors':>7}  {'Temp':>5}  {'Clock':>7}  {'Power':>7}")
-        lines.append(f"  {'─'*8}  {'─'*10}  {'─'*7}  {'─'*5}  {'─'*7}  {'─'*7}")
-        for r in self.results:
-            marker = ""
-            if r.mem_offset_mhz == self.optimal_offset_mhz:
-                marker = " ← OPTIMAL"
-            if r.mem_offset_mhz == self.cliff_offset_mhz:
-                marker = " ← CLIFF"
-            if r.errors > 0:
-                marker = f" ← {r.errors} ERRORS"
-            lines.append(
-                f"  {'+' + str(r.mem_offset_mhz):>8}  "
-                f"{r.bandwidth_gbps:>10.1f}  "
-                f"{r.errors:>7}  "
-                f"{r.gpu_temp:>4}°  "
-                f"{r.mem_clock:>6}M  "
-                f"{r.power_draw:>5.0f}W"
-                f"{marker}"
+        lines.append(_SWEEP_HEADER)
+        lines.append(_SWEEP_RULE)
+        lines += [
+            _SWEEP_ROW_FMT.format(
+                offset=f"+{r.mem_offset_mhz}", bw=r.bandwidth_gbps, errors=r.errors,
+                temp=r.gpu_temp, clock=r.mem_clock, power=r.power_draw,
+                marker=self._marker(r),
             )
+            for r in self.results
+        ]
         return "\n".join(lines)
 
 
@@ -175,19 +193,98 @@ PATTERNS = [
 ]
 
 
-def _run_pattern_test_cupy(size_mb: int = 256, gpu_index: int = 0) -> MemtestResult:
+# Fused mismatch counter: counts x != y in a single pass and reduces straight
+# to a uint64, instead of materializing a size_u32 boolean temp for cp.sum().
+# y may be a scalar (fixed patterns) or an array (random pattern). uint64
+# matches lcg_check's atomicAdd counter, so both can feed one accumulator.
+if _HAS_CUPY:
+    _ne_count = cp.ReductionKernel(
+        "uint32 x, uint32 y", "uint64 z",
+        "x != y", "a + b", "z = a", "0", "ne_count",
+    )
+
+# Seed for the random pattern. Fixed so the expected data can be regenerated
+# independently on readback instead of being copied from the buffer under test.
+_RANDOM_SEED = 0x4B41
+
+# Random pattern generator: a per-element LCG seeded by the global index.
+# The value at index i is a closed-form function of (seed, i), so the check
+# kernel recomputes it in-register and counts mismatches in the same pass —
+# no cuRAND state, no second expected-data buffer.
+_LCG_SRC = r"""
+__device__ __forceinline__ unsigned int lcg(unsigned int seed, unsigned int i) {
+    unsigned int s = seed ^ (i * 2654435761u);
+    return s * 1664525u + 1013904223u;
+}
+
+extern "C" __global__
+void lcg_fill(unsigned int* out, unsigned int n, unsigned int seed) {
+    unsigned int i = blockIdx.x * blockDim.x + threadIdx.x;
+    if (i < n) out[i] = lcg(seed, i);
+}
+
+extern "C" __global__
+void lcg_check(const unsigned int* data, unsigned int n, unsigned int seed,
+               unsigned long long* errors) {
+    unsigned int i = blockIdx.x * blockDim.x + threadIdx.x;
+    if (i < n && data[i] != lcg(seed, i)) atomicAdd(errors, 1ULL);
+}
+"""
+_LCG_BLOCK = 256
+
+if _HAS_CUPY:
+    # NVRTC compile happens on first get_function(), not at import
+    _lcg_module = cp.RawModule(code=_LCG_SRC)
+
+
+def _fill_word(value: int):
+    """Repeat a byte pattern across a uint32 word (0xAA → 0xAAAAAAAA)."""
+    return np.uint32(value | (value << 8) | (value << 16) | (value << 24))
+
+
+def _run_fixed_patterns_parallel(fixed: list[tuple[str, int]], size_u32: int) -> int:
+    """Run the fixed-value patterns concurrently, one stream + buffer pair each.
+
+    The fixed patterns don't depend on each other, so queuing them all before
+    syncing lets the copy engine and SMs overlap instead of idling between
+    patterns. Returns the total mismatch count. Needs len(fixed) × 2 buffers
+    of VRAM at once — the caller checks that fits.
+    """
+    nbytes = size_u32 * 4
+    d2d = cp.cuda.runtime.memcpyDeviceToDevice
+    streams, buffers, counts = [], [], []
+    for _, value in fixed:
+        st = cp.cuda.Stream(non_blocking=True)
+        fill_val = _fill_word(value)
+        with st:
+            buf = cp.empty(size_u32, dtype=cp.uint32)
+            verify = cp.empty(size_u32, dtype=cp.uint32)
+            buf.fill(fill_val)
+            cp.cuda.runtime.memcpyAsync(verify.data.ptr, buf.data.ptr, nbytes, d2d, st.ptr)
+            counts.append(_ne_count(verify, fill_val))
+        streams.append(st)
+        buffers.append((buf, verify))  # keep alive until the streams drain
+    for st in streams:
+        st.synchronize()
+    return sum(int(c) for c in counts)
+
+
+def _run_pattern_test_cupy(
+    size_mb: int = 256, gpu_index: int = 0, gpu_state: GpuSnapshot | None = None
+) -> MemtestResult:
     """GPU-accelerated VRAM pattern test using CuPy.
 
     For each pattern:
-      1. Allocate CuPy array on GPU VRAM (uint32 for efficiency)
-      2. Fill with pattern value
-      3. Force CUDA sync (ensures write is complete)
-      4. Copy buffer to a second GPU array
-      5. Compare original vs copy element-wise
-      6. Count mismatches (any mismatch = VRAM corruption)
-
+      1. Fill the test buffer in VRAM with the pattern (uint32 for efficiency)
+      2. Copy it device-to-device into a second VRAM buffer (the readback)
+      3. Compare the readback against independently generated expected data —
+         the scalar fill value, or the seeded LCG recomputed for 'random'
+      4. Count mismatches (any mismatch = VRAM corruption)
+
+    Comparing against regenerated ground truth (not a copy of the buffer
+    under test) is what lets a corrupted write or read actually show up.
     The walking_1 pattern runs 32 sub-tests (one per bit position).
-    Total VRAM usage: ~2x size_mb during each pattern test.
+    Total VRAM usage: ~2x size_mb.
     """
     result = MemtestResult(
         timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
@@ -196,52 +293,96 @@ def _run_pattern_test_cupy(size_mb: int = 256, gpu_index: int = 0) -> MemtestRes
     t0 = time.perf_counter()
     size_bytes = size_mb * 1024 * 1024
     size_u32 = size_bytes // 4  # Work in uint32 for efficiency
+    nbytes = size_u32 * 4
 
     total_errors = 0
     patterns_run = 0
 
-    for name, value in PATTERNS:
+    # Fixed-value patterns run concurrently when there's VRAM for all of
+    # their buffer pairs at once (with 20% headroom); otherwise, or if the
+    # parallel run fails, they run one by one in the loop below.
+    fixed = [(name, value) for name, value in PATTERNS if value is not None]
+    parallel_done: set[str] = set()
+    free_vram, _ = cp.cuda.runtime.memGetInfo()
+    if len(fixed) * 2 * nbytes < free_vram * 0.8:
         try:
-            if name == "walking_1":
-                # Walk a 1 bit through each 32-bit word position
-                for bit in range(32):
-                    pattern_val = 1 << bit
-                    buf = cp.full(size_u32, pattern_val, dtype=cp.uint32)
-                    cp.cuda.runtime.deviceSynchronize()
-                    readback = buf.copy()
-                    cp.cuda.runtime.deviceSynchronize()
-                    mismatches = int(cp.sum(buf != readback))
-                    total_errors += mismatches
-                    del buf, readback
-                patterns_run += 32
-
-            elif name == "random":
-                # Write random data, read back, compare
-                buf = cp.random.randint(0, 0xFFFFFFFF, size=size_u32, dtype=cp.uint32)
-                cp.cuda.runtime.deviceSynchronize()
-                expected = buf.copy()
-                cp.cuda.runtime.deviceSynchronize()
-                # Read back original buffer
-                mismatches = int(cp.sum(buf != expected))
-                total_errors += mismatches
-                del buf, expected
-                patterns_run += 1
-
-            else:
-                # Fixed-value pattern
-                fill_val = value | (value << 8) | (value << 16) | (value << 24)
-                buf = cp.full(size_u32, fill_val, dtype=cp.uint32)
-                cp.cuda.runtime.deviceSynchronize()
-                readback = buf.copy()
-                cp.cuda.runtime.deviceSynchronize()
-                mismatches = int(cp.sum(buf != readback))
-                total_errors += mismatches
-                del buf, readback
-                patterns_run += 1
-
+            total_errors += _run_fixed_patterns_parallel(fixed, size_u32)
+            patterns_run += len(fixed)
+            parallel_done = {name for name, _ in fixed}
         except Exception as e:
-            print(f"  Pattern '{name}' failed: {e}")
-            continue
+            print(f"  Parallel fixed patterns failed ({e}), running sequentially")
+
+    # Allocated once and reused by every remaining pattern
+    buf = cp.empty(size_u32, dtype=cp.uint32)
+    verify = cp.empty(size_u32, dtype=cp.uint32)
+    stream = cp.cuda.Stream(non_blocking=True)
+
+    # buf/verify are passed in rather than closed over, so the del below
+    # really drops the last references before free_all_blocks()
+    def readback(src, dst):
+        # src → dst through the memory controller
+        cp.cuda.runtime.memcpyAsync(
+            dst.data.ptr, src.data.ptr, nbytes,
+            cp.cuda.runtime.memcpyDeviceToDevice, stream.ptr,
+        )
+
+    def roundtrip(src, dst, expected):
+        # Read back, then check dst against a scalar expected value.
+        # Returns the mismatch count as a 0-d device array — no host sync.
+        readback(src, dst)
+        return _ne_count(dst, expected)
+
+    # Every remaining pattern adds its mismatch count here on the device;
+    # the host reads it once after the last pattern instead of per pattern.
+    with stream:
+        err_accum = cp.zeros((), dtype=cp.uint64)
+        for name, value in PATTERNS:
+            if name in parallel_done:
+                continue
+            try:
+                if name == "walking_1":
+                    # Walk a 1 bit through each 32-bit word position. All 32
+                    # sub-tests queue on the stream without a host sync.
+                    for bit in range(32):
+                        pattern_val = np.uint32(1 << bit)
+                        buf.fill(pattern_val)
+                        err_accum += roundtrip(buf, verify, pattern_val)
+                    patterns_run += 32
+
+                elif name == "random":
+                    # LCG fill, read back, then recompute + compare in one kernel
+                    grid = ((size_u32 + _LCG_BLOCK - 1) // _LCG_BLOCK,)
+                    n, seed = np.uint32(size_u32), np.uint32(_RANDOM_SEED)
+                    lcg_fill = _lcg_module.get_function("lcg_fill")
+                    lcg_check = _lcg_module.get_function("lcg_check")
+                    lcg_fill(grid, (_LCG_BLOCK,), (buf, n, seed))
+                    readback(buf, verify)
+                    lcg_check(grid, (_LCG_BLOCK,), (verify, n, seed, err_accum))
+                    patterns_run += 1
+
+                else:
+                    # Fixed-value pattern
+                    fill_val = _fill_word(value)
+                    buf.fill(fill_val)
+                    err_accum += roundtrip(buf, verify, fill_val)
+                    patterns_run += 1
+
+            except Exception as e:
+                print(f"  Pattern '{name}' failed: {e}")
+                continue
+
+        # Single readback: async copy into pinned host memory on the test
+        # stream, so it skips the pageable staging copy int() would do
+        err_host = cp.cuda.alloc_pinned_memory(8)
+        err_view = np.frombuffer(err_host, dtype=np.uint64, count=1)
+        cp.cuda.runtime.memcpyAsync(
+            err_host.ptr, err_accum.data.ptr, 8,
+            cp.cuda.runtime.memcpyDeviceToHost, stream.ptr,
+        )
+        stream.synchronize()
+        total_errors += int(err_view[0])
+
+    del buf, verify
 
     # Force CUDA sync and cleanup
     cp.cuda.runtime.deviceSynchronize()
@@ -253,9 +394,9 @@ def _run_pattern_test_cupy(size_mb: int = 256, gpu_index: int = 0) -> MemtestRes
     result.errors_detected = total_errors
     result.passed = total_errors == 0
 
-    # Grab GPU state
+    # Grab GPU state (unless the caller already has a fresh snapshot)
     try:
-        s = snapshot(gpu_index)
+        s = gpu_state or snapshot(gpu_index)
         result.gpu_temp = s.temp_gpu
         result.mem_clock = s.clock_mem
     except Exception:
@@ -264,15 +405,33 @@ def _run_pattern_test_cupy(size_mb: int = 256, gpu_index: int = 0) -> MemtestRes
     return result
 
 
-def _run_pattern_test_numpy(size_mb: int = 256, gpu_index: int = 0) -> MemtestResult:
+# Elements per chunk when the numpy fallback evaluates the LCG (64 MiB of uint32)
+_NP_LCG_CHUNK = 16 * 1024 * 1024
+
+
+def _lcg_np(start: int, count: int, seed: int):
+    """numpy twin of the lcg() device function for indices [start, start+count)."""
+    s = np.arange(start, start + count, dtype=np.uint32)
+    s *= np.uint32(2654435761)
+    s ^= np.uint32(seed)
+    s *= np.uint32(1664525)
+    s += np.uint32(1013904223)
+    return s
+
+
+def _run_pattern_test_numpy(
+    size_mb: int = 256, gpu_index: int = 0, gpu_state: GpuSnapshot | None = None
+) -> MemtestResult:
     """CPU-based fallback VRAM pattern test (system RAM only).
 
     This does NOT actually test VRAM — it's a proof-of-concept that runs
     the same pattern logic on system RAM via numpy. Useful for testing
     the test harness itself without a CUDA-capable GPU.
 
-    Walking_1 and random patterns are skipped in fallback mode to keep
-    runtime reasonable on CPU.
+    Works on uint64 words (8 bytes per element) and compares each buffer
+    directly against the expected value — a scalar for the fixed and
+    walking_1 patterns, the same LCG as the CUDA kernel for 'random'
+    (recomputed in chunks to bound the temporaries).
     """
     result = MemtestResult(
         timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
@@ -289,15 +448,37 @@ def _run_pattern_test_numpy(size_mb: int = 256, gpu_index: int = 0) -> MemtestRe
     total_errors = 0
     patterns_run = 0
 
+    size_u64 = size_bytes // 8
+    buf = np.empty(size_u64, dtype=np.uint64)  # reused by every pattern
+
     for name, value in PATTERNS:
-        if name == "walking_1" or name == "random":
-            continue  # Skip complex patterns in fallback mode
-        buf = np.full(size_bytes, value, dtype=np.uint8)
-        readback = buf.copy()
-        mismatches = int(np.sum(buf != readback))
-        total_errors += mismatches
-        patterns_run += 1
-        del buf, readback
+        if name == "walking_1":
+            # Same bit in both 32-bit halves of each word
+            for bit in range(32):
+                pattern_val = np.uint64((1 << bit) * 0x0000000100000001)
+                buf.fill(pattern_val)
+                total_errors += int(np.count_nonzero(buf != pattern_val))
+            patterns_run += 32
+
+        elif name == "random":
+            words = buf.view(np.uint32)
+            n_words = words.size
+            for off in range(0, n_words, _NP_LCG_CHUNK):
+                n = min(_NP_LCG_CHUNK, n_words - off)
+                words[off:off + n] = _lcg_np(off, n, _RANDOM_SEED)
+            for off in range(0, n_words, _NP_LCG_CHUNK):
+                n = min(_NP_LCG_CHUNK, n_words - off)
+                expected = _lcg_np(off, n, _RANDOM_SEED)
+                total_errors += int(np.count_nonzero(words[off:off + n] != expected))
+            patterns_run += 1
+
+        else:
+            fill_val = np.uint64(value * 0x0101010101010101)
+            buf.fill(fill_val)
+            total_errors += int(np.count_nonzero(buf != fill_val))
+            patterns_run += 1
+
+    del buf
 
     result.duration_sec = time.perf_counter() - t0
     result.patterns_tested = patterns_run
@@ -306,7 +487,7 @@ def _run_pattern_test_numpy(size_mb: int = 256, gpu_index: int = 0) -> MemtestRe
     result.passed = total_errors == 0
 
     try:
-        s = snapshot(gpu_index)
+        s = gpu_state or snapshot(gpu_index)
         result.gpu_temp = s.temp_gpu
         result.mem_clock = s.clock_mem
     except Exception:
@@ -315,29 +496,133 @@ def _run_pattern_test_numpy(size_mb: int = 256, gpu_index: int = 0) -> MemtestRe
     return result
 
 
-def run_memtest(size_mb: int = 256, gpu_index: int = 0) -> MemtestResult:
-    """Run VRAM pattern test. Auto-selects CuPy (GPU) or numpy (CPU) backend."""
+def run_memtest(
+    size_mb: int = 256, gpu_index: int = 0, gpu_state: GpuSnapshot | None = None
+) -> MemtestResult:
+    """Run VRAM pattern test. Auto-selects CuPy (GPU) or numpy (CPU) backend.
+
+    gpu_state: snapshot to report temp/clock from. If None, one is taken
+    after the test; the sweep passes its own to avoid a second NVML read.
+    """
     if _HAS_CUPY:
-        return _run_pattern_test_cupy(size_mb, gpu_index)
+        # Allocate and run on the GPU under test, not whatever device is
+        # current. CUDA and NVML enumerate GPUs in the same (PCI) order
+        # when CUDA_DEVICE_ORDER=PCI_BUS_ID; on single-GPU boxes it's moot.
+        with cp.cuda.Device(gpu_index):
+            return _run_pattern_test_cupy(size_mb, gpu_index, gpu_state)
     else:
         print("Warning: CuPy not installed. Running CPU-only fallback (tests system RAM, not VRAM).")
         print("Install CuPy for actual VRAM testing: pip install cupy-cuda12x")
-        return _run_pattern_test_numpy(size_mb, gpu_index)
+        return _run_pattern_test_numpy(size_mb, gpu_index, gpu_state)
+
+
+def run_memtest_all(
+    size_mb: int = 256, gpu_indices: list[int] | None = None
+) -> list[MemtestResult]:
+    """Run the VRAM pattern test on several GPUs at once.
+
+    Each GPU has its own memory subsystem, so the tests run concurrently —
+    one thread per GPU, each with its own CUDA device context (CuPy calls
+    release the GIL while the kernels run). Results come back in
+    gpu_indices order. gpu_indices defaults to every NVIDIA GPU.
+
+    Without CuPy the CPU fallback tests system RAM, which is shared, so the
+    runs stay sequential there.
+    """
+    if gpu_indices is None:
+        gpu_indices = list(range(gpu_count()))
+    if not _HAS_CUPY or len(gpu_indices) <= 1:
+        return [run_memtest(size_mb, i) for i in gpu_indices]
+    with ThreadPoolExecutor(max_workers=len(gpu_indices)) as ex:
+        return list(ex.map(lambda i: run_memtest(size_mb, i), gpu_indices))
 
 
 # ── Bandwidth measurement ──
 # Measures effective GPU memory bandwidth by timing device-to-device copies.
 # This is the key metric for detecting the ECC/EDR bandwidth cliff.
 
-def measure_bandwidth(size_mb: int = 256, iterations: int = 50) -> float:
+# Parallel copy streams per device, created once and reused by every
+# measure_bandwidth() call in a sweep.
+_BW_STREAMS = 4
+_bw_streams: dict[int, list] = {}
+
+# Copies per event-timed batch, and the minimum batches before the
+# early-stop check in measure_bandwidth() is trusted.
+_BW_BATCH = 5
+_BW_MIN_BATCHES = 3
+
+# (device, size_bytes) → (src, dst). Kept across calls so a sweep doesn't
+# allocate, fill and free 2× size_mb of VRAM at every step; run_sweep
+# releases them when it finishes.
+_bw_buffers: dict[tuple[int, int], tuple] = {}
+
+
+def _get_bw_streams() -> list:
+    dev = cp.cuda.runtime.getDevice()
+    streams = _bw_streams.get(dev)
+    if streams is None:
+        streams = [cp.cuda.Stream(non_blocking=True) for _ in range(_BW_STREAMS)]
+        _bw_streams[dev] = streams
+    return streams
+
+
+def _bw_copy_parts(size_bytes: int) -> tuple[list, list]:
+    """Cached streams + per-stream copy chunks for a size_bytes D2D copy.
+
+    The copy is split into _BW_STREAMS chunks issued on parallel streams —
+    one stream can't keep enough copies in flight to saturate GDDR6X, which
+    understates BW and flattens the cliff we're trying to find. Returns
+    (streams, parts) where each part is a memcpyAsync argument tuple
+    (dst_ptr, src_ptr, nbytes, stream_ptr).
+    """
+    # Buffer pair is cached per (device, size) and reused by every call in a
+    # sweep. Contents don't matter for copy bandwidth, so cp.empty is enough.
+    key = (cp.cuda.runtime.getDevice(), size_bytes)
+    pair = _bw_buffers.get(key)
+    if pair is None:
+        pair = (cp.empty(size_bytes, dtype=cp.uint8), cp.empty(size_bytes, dtype=cp.uint8))
+        _bw_buffers[key] = pair
+    src, dst = pair
+
+    streams = _get_bw_streams()
+    chunk = -(-size_bytes // len(streams))
+    parts = [
+        (dst.data.ptr + off, src.data.ptr + off, min(chunk, size_bytes - off), st.ptr)
+        for off, st in zip(range(0, size_bytes, chunk), streams)
+    ]
+    return streams, parts
+
+
+def warmup_bandwidth(size_mb: int = 256, copies: int = 5) -> None:
+    """Queue the bandwidth warmup copies and return without waiting.
+
+    run_sweep() calls this right after changing the memory offset so the
+    warmup runs on the GPU during the clock-settle sleep; the following
+    measure_bandwidth(..., warmup=False) then goes straight to timing.
+    """
+    if not _HAS_CUPY:
+        return
+    _, parts = _bw_copy_parts(size_mb * 1024 * 1024)
+    memcpy = cp.cuda.runtime.memcpyAsync
+    d2d = cp.cuda.runtime.memcpyDeviceToDevice
+    for _ in range(copies):
+        for dst_ptr, src_ptr, n, stream_ptr in parts:
+            memcpy(dst_ptr, src_ptr, n, d2d, stream_ptr)
+
+
+def measure_bandwidth(size_mb: int = 256, iterations: int = 50, warmup: bool = True) -> float:
     """Measure GPU memory bandwidth in GB/s using device-to-device copy.
 
     Methodology:
-      1. Allocate src + dst buffers on GPU VRAM
-      2. Warm up (5 copies to stabilize clocks + caches)
-      3. Time N iterations of src->dst copy
-      4. Calculate: bandwidth = (bytes × iterations × 2) / elapsed
-         The ×2 accounts for both read (from src) and write (to dst).
+      1. Allocate src + dst buffers on GPU VRAM (cached across calls)
+      2. Warm up (5 copies to stabilize clocks + caches) — skipped with
+         warmup=False when warmup_bandwidth() was already queued
+      3. Time up to N iterations of src->dst copy (fanned out over parallel
+         streams) in event-timed batches; stop early once the batch
+         readings agree to within 0.5% standard error
+      4. Calculate: bandwidth = (bytes × copies × 2) / elapsed, averaged
+         over batches. The ×2 accounts for both read (from src) and write
+         (to dst).
 
     Returns effective bandwidth in GB/s. Typical values:
       - RTX 3080 stock: ~750-760 GB/s
@@ -349,39 +634,64 @@ def measure_bandwidth(size_mb: int = 256, iterations: int = 50) -> float:
         return 0.0
 
     size_bytes = size_mb * 1024 * 1024
-
-    # Allocate two buffers
-    src = cp.random.randint(0, 255, size=size_bytes, dtype=cp.uint8)
-    dst = cp.zeros(size_bytes, dtype=cp.uint8)
-    cp.cuda.runtime.deviceSynchronize()
-
-    # Warm up
-    for _ in range(5):
-        cp.copyto(dst, src)
-    cp.cuda.runtime.deviceSynchronize()
-
-    # Timed run
-    t0 = time.perf_counter()
-    for _ in range(iterations):
-        cp.copyto(dst, src)
+    streams, parts = _bw_copy_parts(size_bytes)
+
+    # Timing uses CUDA events: pure GPU copy time, with no Python loop /
+    # driver submission overhead mixed into the window. The root stream
+    # brackets the run; the others wait on its start event and the root waits
+    # on theirs before recording stop.
+    root = streams[0]
+    start = cp.cuda.Event()
+    stop = cp.cuda.Event()
+    memcpy = cp.cuda.runtime.memcpyAsync
+    d2d = cp.cuda.runtime.memcpyDeviceToDevice
+
+    if warmup:
+        warmup_bandwidth(size_mb)
+    # Drain earlier work (the pattern test, or a warmup queued by the caller)
+    # so none of it lands inside a timed window
     cp.cuda.runtime.deviceSynchronize()
-    elapsed = time.perf_counter() - t0
 
-    # Bandwidth = (bytes read + bytes written) / time
-    # Each copy reads src and writes dst, so total data moved = 2× size
-    bw_bytes = size_bytes * iterations * 2
-    bw_gbps = bw_bytes / elapsed / 1e9
-
-    del src, dst
-    cp.get_default_memory_pool().free_all_blocks()
-
-    return bw_gbps
+    # Timed run, in batches of _BW_BATCH copies. Each batch is one event-timed
+    # window; a running mean/variance (Welford) over the batch readings lets
+    # us stop early once the estimate is tight (stderr < 0.5% of mean) rather
+    # than always burning the full iteration budget on a steady offset.
+    n_batches = max(1, -(-iterations // _BW_BATCH))
+    batch_bytes = size_bytes * _BW_BATCH * 2  # read + write per copy
+    mean = m2 = 0.0
+    for k in range(1, n_batches + 1):
+        start.record(root)
+        for st in streams[1:]:
+            st.wait_event(start)
+        for _ in range(_BW_BATCH):
+            for dst_ptr, src_ptr, n, stream_ptr in parts:
+                memcpy(dst_ptr, src_ptr, n, d2d, stream_ptr)
+        for st in streams[1:]:
+            root.wait_event(st.record())
+        stop.record(root)
+        stop.synchronize()
+        elapsed = cp.cuda.get_elapsed_time(start, stop) / 1e3  # ms → s
+
+        # Bandwidth = (bytes read + bytes written) / time
+        # Each copy reads src and writes dst, so total data moved = 2× size
+        bw = batch_bytes / elapsed / 1e9
+        delta = bw - mean
+        mean += delta / k
+        m2 += delta * (bw - mean)
+        if k >= _BW_MIN_BATCHES and math.sqrt(m2 / (k - 1) / k) < 0.005 * mean:
+            break
+
+    return mean
 
 
 # ── Memory OC sweep ──
 # The flagship feature — automated memory overclock optimization.
 # Walks through offset range, measuring bandwidth and errors at each step.
 
+# Sweep steps in the cliff-detection window (see run_sweep)
+_CLIFF_WINDOW = 3
+
+
 def run_sweep(
     start_mhz: int = 0,
     stop_mhz: int = 1500,
@@ -402,7 +712,7 @@ def run_sweep(
 
     Detects three key points:
     - OPTIMAL: highest BW with zero errors (this is your best OC)
-    - CLIFF: BW decreased >2% from previous step (ECC/EDR kicking in)
+    - CLIFF: median BW of the last 3 steps >2% below peak (ECC/EDR kicking in)
     - CRASH: exception during test (GPU driver recovery or hang)
 
     SAFETY: Always resets memory offset to +0 in the finally block,
@@ -435,79 +745,112 @@ def run_sweep(
 
     peak_bw = 0.0
     peak_offset = 0
-    prev_bw = 0.0
+    bw_window: deque[float] = deque(maxlen=_CLIFF_WINDOW)
+
+    # One NVML snapshot per step, taken on a worker thread while the
+    # bandwidth test runs so its driver round-trips stay off the GPU timing
+    # path. The same snapshot feeds the pattern test and the step result.
+    nvml_pool = ThreadPoolExecutor(max_workers=1)
 
     try:
         for offset in range(start_mhz, stop_mhz + 1, step_mhz):
-            print(f"\n  Testing +{offset} MHz...", end=" ", flush=True)
-
-            # Set memory offset
-            try:
-                set_mem_offset(offset, gpu_index)
-            except NvApiError as e:
-                print(f"NVAPI error: {e}")
-                sweep.crash_offset_mhz = offset
-                break
-
-            # Wait for clocks to settle
-            time.sleep(2)
-
-            # Measure bandwidth
-            try:
-                bw = measure_bandwidth(size_mb=size_mb, iterations=max(10, test_duration * 5))
-            except Exception as e:
-                print(f"CRASH during bandwidth test: {e}")
-                sweep.crash_offset_mhz = offset
-                break
-
-            # Run pattern test
-            try:
-                mt = run_memtest(size_mb=size_mb, gpu_index=gpu_index)
-                errors = mt.errors_detected
-            except Exception as e:
-                print(f"CRASH during pattern test: {e}")
-                sweep.crash_offset_mhz = offset
-                break
+            # Warmup, BW measurement and pattern test all run on the GPU whose
+            # offset was just stepped — the _bw_buffers/_bw_streams caches are
+            # keyed by the current device, so they land there too.
+            with cp.cuda.Device(gpu_index) if _HAS_CUPY else nullcontext():
+                print(f"\n  Testing +{offset} MHz...", end=" ", flush=True)
+
+                # Set memory offset
+                try:
+                    set_mem_offset(offset, gpu_index)
+                except NvApiError as e:
+                    print(f"NVAPI error: {e}")
+                    sweep.crash_offset_mhz = offset
+                    break
+
+                # Wait for clocks to settle. The BW warmup copies are queued first
+                # so the GPU does them during the sleep instead of after it.
+                try:
+                    warmup_bandwidth(size_mb)
+                except Exception as e:
+                    print(f"CRASH during bandwidth warmup: {e}")
+                    sweep.crash_offset_mhz = offset
+                    break
+                time.sleep(2)
+
+                # Read GPU state (in the background, overlapping the BW test)
+                gs_future = nvml_pool.submit(snapshot, gpu_index)
+
+                # Measure bandwidth (warmup already done above)
+                try:
+                    bw = measure_bandwidth(
+                        size_mb=size_mb, iterations=max(10, test_duration * 5), warmup=False
+                    )
+                except Exception as e:
+                    print(f"CRASH during bandwidth test: {e}")
+                    sweep.crash_offset_mhz = offset
+                    break
+
+                gs = gs_future.result()
+
+                # Run pattern test
+                try:
+                    mt = run_memtest(size_mb=size_mb, gpu_index=gpu_index, gpu_state=gs)
+                    errors = mt.errors_detected
+                except Exception as e:
+                    print(f"CRASH during pattern test: {e}")
+                    sweep.crash_offset_mhz = offset
+                    break
+
+                result = BandwidthResult(
+                    mem_offset_mhz=offset,
+                    bandwidth_gbps=bw,
+                    errors=errors,
+                    gpu_temp=gs.temp_gpu,
+                    mem_clock=gs.clock_mem,
+                    power_draw=gs.power_draw,
+                )
+                sweep.results.append(result)
+
+                print(
+                    f"{bw:.1f} GB/s  {errors} errors  {gs.temp_gpu}°C  {gs.clock_mem}MHz",
+                    flush=True,
+                )
+
+                # Track peak — best BW with zero errors = optimal OC point
+                if bw > peak_bw and errors == 0:
+                    peak_bw = bw
+                    peak_offset = offset
+
+                # Detect bandwidth cliff: median of the last few steps is >2%
+                # below the best error-free BW seen. This means GDDR6/6X error
+                # correction is consuming bandwidth even though no visible
+                # errors appear. The GPU is silently correcting bit errors,
+                # which costs memory controller cycles. The median keeps one
+                # noisy reading from tripping it, while a slow slide spread
+                # over several steps still does.
+                bw_window.append(bw)
+                if (
+                    len(bw_window) == _CLIFF_WINDOW
+                    and sweep.cliff_offset_mhz < 0
+                    and statistics.median(bw_window) < peak_bw * 0.98
+                ):
+                    sweep.cliff_offset_mhz = offset
+
+                # Stop on pattern errors — visible corruption means OC is WAY too high.
+                # No point testing further, and continuing risks driver crash.
+                if errors > 0:
+                    print(f"\n  ⚠ Errors detected at +{offset} MHz. Stopping sweep.")
+                    break
 
-            # Read GPU state
-            gs = snapshot(gpu_index)
-
-            result = BandwidthResult(
-                mem_offset_mhz=offset,
-                bandwidth_gbps=bw,
-                errors=errors,
-                gpu_temp=gs.temp_gpu,
-                mem_clock=gs.clock_mem,
-                power_draw=gs.power_draw,
-            )
-            sweep.results.append(result)
-
-            print(f"{bw:.1f} GB/s  {errors} errors  {gs.temp_gpu}°C  {gs.clock_mem}MHz", flush=True)
-
-            # Track peak — best BW with zero errors = optimal OC point
-            if bw > peak_bw and errors == 0:
-                peak_bw = bw
-                peak_offset = offset
-
-            # Detect bandwidth cliff: BW dropped >2% from previous step.
-            # This means GDDR6/6X error correction is consuming bandwidth
-            # even though no visible errors appear. The GPU is silently
-            # correcting bit errors, which costs memory controller cycles.
-            if prev_bw > 0 and bw < prev_bw * 0.98 and sweep.cliff_offset_mhz < 0:
-                sweep.cliff_offset_mhz = offset
-
-            # Stop on pattern errors — visible corruption means OC is WAY too high.
-            # No point testing further, and continuing risks driver crash.
-            if errors > 0:
-                print(f"\n  ⚠ Errors detected at +{offset} MHz. Stopping sweep.")
-                break
-
-            prev_bw = bw
 
     except KeyboardInterrupt:
         print("\n\nSweep interrupted by user.")
 
     finally:
+        nvml_pool.shutdown(wait=False)
+        _bw_buffers.clear()
+
         # CRITICAL SAFETY: Always reset memory offset to stock.
         # Even if the test crashed, we MUST undo the OC to prevent
         # the user's GPU from running at an unstable memory clock.
@@ -547,6 +890,12 @@ def cmd_memtest(args) -> int:
 
     gpu = args.gpu
 
+    if args.all_gpus and args.sweep:
+        # Each GPU's offset would have to be swept and backed off on its own;
+        # sweep one card at a time with --gpu instead.
+        print("Error: --all-gpus only applies to the pattern test, not --sweep")
+        return 2
+
     if args.sweep:
         # Automated memory OC sweep
         print(f"\nStarting memory OC sweep on GPU {gpu}")
@@ -567,6 +916,37 @@ def cmd_memtest(args) -> int:
         print(f"\n{result.summary()}")
         return 0
 
+    elif args.all_gpus:
+        # Same loop as below, with every GPU tested concurrently per iteration
+        gpus = list(range(gpu_count()))
+        print(f"\nRunning VRAM pattern test on GPUs {', '.join(map(str, gpus))}")
+        print(f"  Buffer size: {args.size} MB per GPU")
+        print(f"  Duration target: {args.duration}s\n")
+
+        t0 = time.time()
+        errors_by_gpu = dict.fromkeys(gpus, 0)
+        iterations = 0
+
+        while time.time() - t0 < args.duration:
+            results = run_memtest_all(size_mb=args.size, gpu_indices=gpus)
+            iterations += 1
+            for i, r in zip(gpus, results):
+                errors_by_gpu[i] += r.errors_detected
+                print(f"  GPU {i}: {r.summary()}")
+            if any(r.errors_detected for r in results):
+                break
+
+        elapsed = time.time() - t0
+        total_errors = sum(errors_by_gpu.values())
+        print(f"\n{'═' * 40}")
+        print(f"  Iterations:  {iterations}")
+        print(f"  Total time:  {elapsed:.1f}s")
+        for i, n in errors_by_gpu.items():
+            print(f"  GPU {i} errors: {n}")
+        print(f"  Result:      {'PASS ✓' if total_errors == 0 else 'FAIL ✗'}")
+
+        return 0 if total_errors == 0 else 1
+
     else:
         # Single/repeated pattern test — runs at current OC setting.
         # Keeps running until --duration elapsed or errors found.
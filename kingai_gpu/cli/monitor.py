@@ -20,27 +20,50 @@ import json
 import os
 import sys
 import time
-from dataclasses import asdict
+from dataclasses import fields
 from datetime import datetime
 
-from kingai_gpu.lib.nvml import GpuSnapshot, gpu_count, snapshot, snapshot_all
+from kingai_gpu.lib.nvml import (
+    GpuSnapshot,
+    snapshot,
+    snapshot_all,
+    snapshot_dynamic,
+    snapshot_static,
+)
+
+# orjson is optional — much faster than stdlib json for the per-frame
+# --json stream, but the output is the same either way.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # ── Formatting helpers ──
 # These produce ASCII/ANSI-styled text for the terminal dashboard.
 # All handle edge cases (zero max, missing data) gracefully.
 
+# Every possible bar per width, built on first use. A bar is then a tuple
+# index instead of two str multiplications + a concat per call — the
+# dashboard draws seven of them each frame.
+_BAR_TABLES: dict[int, tuple[str, ...]] = {}
+
+
 def _bar(value: float, max_val: float, width: int = 30) -> str:
     """ASCII progress bar using block characters. █=filled, ░=empty.
 
     Clamps to [0, max_val] — won't overflow if value > max.
     Returns empty spaces if max_val is 0 or negative (avoid division by zero).
     """
+    table = _BAR_TABLES.get(width)
+    if table is None:
+        table = _BAR_TABLES[width] = tuple(
+            "█" * n + "░" * (width - n) for n in range(width + 1)
+        )
     if max_val <= 0:
         return " " * width
     pct = min(value / max_val, 1.0)
-    filled = int(pct * width)
-    return "█" * filled + "░" * (width - filled)
+    return table[max(int(pct * width), 0)]
 
 
 def _color_temp(temp: int) -> str:
@@ -68,97 +91,124 @@ def _color_throttle(reasons: list[str]) -> str:
     return f"\033[91m{'  '.join(reasons)}\033[0m"
 
 
-def _clear_screen():
-    """Clear terminal screen."""
-    if os.name == "nt":
-        os.system("cls")
-    else:
-        sys.stdout.write("\033[2J\033[H")
-        sys.stdout.flush()
-
+# ANSI "erase display + cursor home". Works on Linux terminals and on
+# Windows 10+ consoles once VT processing is enabled (see _enable_vt_mode).
+_CLEAR = "\033[2J\033[H"
 
-# ── Dashboard render ──
-# Box-drawing characters create a structured display that's easy to read.
-# Fixed 70-char width fits most terminals. Future: detect terminal width.
 
-def render_dashboard(s: GpuSnapshot) -> str:
-    """Render a full monitoring dashboard for one GPU.
+def _enable_vt_mode():
+    """Turn on ANSI escape handling in the Windows console (no-op elsewhere).
 
-    Uses Unicode box-drawing characters (┌─┐│├┤└┘) for structure.
-    Each section shows a metric + ASCII progress bar for visual scanning.
+    Lets the dashboard clear the screen with _CLEAR instead of spawning
+    'cls' through os.system() on every frame.
     """
-    ts = datetime.fromtimestamp(s.timestamp).strftime("%Y-%m-%d %H:%M:%S")
-    w = 70  # box width
+    if os.name != "nt":
+        return
+    try:
+        import ctypes
 
-    lines = []
-    lines.append(f"┌{'─' * w}┐")
-    lines.append(f"│{'KingAi GPU Monitor':^{w}}│")
-    lines.append(f"│{ts:^{w}}│")
-    lines.append(f"├{'─' * w}┤")
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+    except Exception:
+        pass  # not a real console (redirected, IDE) — escapes just pass through
 
-    # Identity
-    lines.append(f"│  GPU {s.index}: {s.name:<{w - 10}}│")
-    lines.append(f"│  Driver: {s.driver_version}  │  PCI: {s.pci_bus_id:<{w - 25}}│")
-    lines.append(f"├{'─' * w}┤")
 
+# ── Dashboard render ──
+# Box-drawing characters create a structured display that's easy to read.
+# Fixed 70-char width fits most terminals. Future: detect terminal width.
+# The whole frame is one format template built at import time, so a render
+# is a single str.format() instead of ~25 f-strings + join.
+
+_W = 70  # box width
+_RULE = "─" * _W
+_SEP = f"├{_RULE}┤"
+
+_DASH_TEMPLATE = "\n".join([
+    f"┌{_RULE}┐",
+    f"│{'KingAi GPU Monitor':^{_W}}│",
+    "│{ts:^70}│",
+    _SEP,
+    # Identity
+    "│  GPU {index}: {name:<60}│",
+    "│  Driver: {driver_version}  │  PCI: {pci_bus_id:<45}│",
+    _SEP,
     # Clocks
-    gpu_bar = _bar(s.clock_gpu, s.clock_gpu_max, 25)
-    mem_bar = _bar(s.clock_mem, s.clock_mem_max, 25)
-    lines.append(f"│  Core Clock:   {s.clock_gpu:>5} / {s.clock_gpu_max} MHz  {gpu_bar}  │")
-    lines.append(f"│  Mem  Clock:   {s.clock_mem:>5} / {s.clock_mem_max} MHz  {mem_bar}  │")
-    lines.append(f"│  SM Clock:     {s.clock_sm:>5} MHz                                  │")
-    lines.append(f"├{'─' * w}┤")
-
+    "│  Core Clock:   {clock_gpu:>5} / {clock_gpu_max} MHz  {gpu_bar}  │",
+    "│  Mem  Clock:   {clock_mem:>5} / {clock_mem_max} MHz  {mem_bar}  │",
+    "│  SM Clock:     {clock_sm:>5} MHz                                  │",
+    _SEP,
     # Temp + Fan
-    temp_bar = _bar(s.temp_gpu, s.temp_gpu_max or 100, 25)
-    fan_bar = _bar(s.fan_speed, 100, 25)
-    lines.append(f"│  Temperature:  {s.temp_gpu:>5} / {s.temp_gpu_max or '?':>3}°C     {temp_bar}  │")
-    lines.append(f"│  Fan Speed:    {s.fan_speed:>5}%              {fan_bar}  │")
-    lines.append(f"├{'─' * w}┤")
-
+    "│  Temperature:  {temp_gpu:>5} / {temp_max:>3}°C     {temp_bar}  │",
+    "│  Fan Speed:    {fan_speed:>5}%              {fan_bar}  │",
+    _SEP,
     # Power
-    pwr_bar = _bar(s.power_draw, s.power_limit, 25)
-    lines.append(
-        f"│  Power:        {s.power_draw:>5.0f} / {s.power_limit:.0f}W "
-        f"({s.power_pct:.0f}%)    {pwr_bar}  │"
-    )
-    lines.append(
-        f"│  Limits:       {s.power_min:.0f}W min  /  "
-        f"{s.power_default:.0f}W default  /  {s.power_max:.0f}W max          │"
-    )
-    lines.append(f"├{'─' * w}┤")
-
+    "│  Power:        {power_draw:>5.0f} / {power_limit:.0f}W ({power_pct:.0f}%)    {pwr_bar}  │",
+    "│  Limits:       {power_min:.0f}W min  /  "
+    "{power_default:.0f}W default  /  {power_max:.0f}W max          │",
+    _SEP,
     # VRAM
-    vram_bar = _bar(s.vram_used, s.vram_total, 25)
-    lines.append(
-        f"│  VRAM:         {s.vram_used:>5} / {s.vram_total} MB "
-        f"({s.vram_used_pct:.0f}%)  {vram_bar}  │"
-    )
-    lines.append(f"├{'─' * w}┤")
-
+    "│  VRAM:         {vram_used:>5} / {vram_total} MB ({vram_used_pct:.0f}%)  {vram_bar}  │",
+    _SEP,
     # Utilization
-    gpu_util_bar = _bar(s.util_gpu, 100, 25)
-    mem_util_bar = _bar(s.util_mem, 100, 25)
-    lines.append(f"│  GPU Util:     {s.util_gpu:>5}%              {gpu_util_bar}  │")
-    lines.append(f"│  Mem Util:     {s.util_mem:>5}%              {mem_util_bar}  │")
-    lines.append(f"├{'─' * w}┤")
-
+    "│  GPU Util:     {util_gpu:>5}%              {gpu_util_bar}  │",
+    "│  Mem Util:     {util_mem:>5}%              {mem_util_bar}  │",
+    _SEP,
     # State
-    throttle_str = "  ".join(s.throttle_reasons)
-    lines.append(f"│  P-State:      {s.pstate:<55}│")
-    lines.append(f"│  Throttle:     {throttle_str:<55}│")
-    lines.append(f"└{'─' * w}┘")
-    lines.append("  Press Ctrl+C to exit")
+    "│  P-State:      {pstate:<55}│",
+    "│  Throttle:     {throttle:<55}│",
+    f"└{_RULE}┘",
+    "  Press Ctrl+C to exit",
+])
+
+
+def render_dashboard(s: GpuSnapshot) -> str:
+    """Render a full monitoring dashboard for one GPU.
 
-    return "\n".join(lines)
+    Uses Unicode box-drawing characters (┌─┐│├┤└┘) for structure.
+    Each section shows a metric + ASCII progress bar for visual scanning.
+    """
+    return _DASH_TEMPLATE.format(
+        ts=datetime.fromtimestamp(s.timestamp).strftime("%Y-%m-%d %H:%M:%S"),
+        index=s.index, name=s.name,
+        driver_version=s.driver_version, pci_bus_id=s.pci_bus_id,
+        clock_gpu=s.clock_gpu, clock_gpu_max=s.clock_gpu_max,
+        clock_mem=s.clock_mem, clock_mem_max=s.clock_mem_max,
+        clock_sm=s.clock_sm,
+        gpu_bar=_bar(s.clock_gpu, s.clock_gpu_max, 25),
+        mem_bar=_bar(s.clock_mem, s.clock_mem_max, 25),
+        temp_gpu=s.temp_gpu, temp_max=s.temp_gpu_max or "?",
+        temp_bar=_bar(s.temp_gpu, s.temp_gpu_max or 100, 25),
+        fan_speed=s.fan_speed, fan_bar=_bar(s.fan_speed, 100, 25),
+        power_draw=s.power_draw, power_limit=s.power_limit, power_pct=s.power_pct,
+        pwr_bar=_bar(s.power_draw, s.power_limit, 25),
+        power_min=s.power_min, power_default=s.power_default, power_max=s.power_max,
+        vram_used=s.vram_used, vram_total=s.vram_total, vram_used_pct=s.vram_used_pct,
+        vram_bar=_bar(s.vram_used, s.vram_total, 25),
+        util_gpu=s.util_gpu, gpu_util_bar=_bar(s.util_gpu, 100, 25),
+        util_mem=s.util_mem, mem_util_bar=_bar(s.util_mem, 100, 25),
+        pstate=s.pstate, throttle="  ".join(s.throttle_reasons),
+    )
 
 
 # ── Output modes ──
 # Each function converts a GpuSnapshot to a different string format.
 # The choice of format is made in cmd_monitor() based on CLI flags.
 
+# Field names resolved once. Reading them with getattr builds a flat dict
+# without asdict()'s recursive deep copy, and works whether GpuSnapshot
+# has a __dict__ or __slots__.
+_SNAPSHOT_FIELDS = tuple(f.name for f in fields(GpuSnapshot))
+
+
 def output_json(s: GpuSnapshot) -> str:
-    d = asdict(s)
+    d = {name: getattr(s, name) for name in _SNAPSHOT_FIELDS}
+    d["timestamp"] = s.timestamp  # seconds, as before timestamp_ns existed
+    if orjson is not None:
+        return orjson.dumps(d, option=orjson.OPT_INDENT_2).decode()
     return json.dumps(d, indent=2)
 
 
@@ -204,6 +254,8 @@ def cmd_monitor(args) -> int:
             print(render_dashboard(s))
         return 0
 
+    _enable_vt_mode()
+
     # Continuous monitoring — loop until Ctrl+C.
     # Each format handles its own output differently:
     #   dashboard = clear screen + redraw (full refresh)
@@ -212,8 +264,13 @@ def cmd_monitor(args) -> int:
     #   json = print object + separator
     try:
         first = True
+        # Identity / limits are read once; each tick only re-reads live sensors
+        static = snapshot_static(args.gpu)
+        # Ticks follow a monotonic deadline (as in nvml.poll), so rendering
+        # time doesn't stretch the period past --interval
+        deadline = time.monotonic()
         while True:
-            s = snapshot(args.gpu)
+            s = snapshot_dynamic(args.gpu, static)
 
             if args.json:
                 print(output_json(s))
@@ -229,10 +286,16 @@ def cmd_monitor(args) -> int:
                 sys.stdout.write(f"\r{ts} {s.summary_line()}")
                 sys.stdout.flush()
             else:
-                _clear_screen()
-                print(render_dashboard(s))
+                # Clear + frame in one write (one write per sink via the tee)
+                sys.stdout.write(f"{_CLEAR}{render_dashboard(s)}\n")
+                sys.stdout.flush()
 
-            time.sleep(args.interval)
+            deadline += args.interval
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                deadline = time.monotonic()  # fell behind — don't burst to catch up
     except KeyboardInterrupt:
         print("\nMonitoring stopped.")
         return 0
@@ -240,11 +303,11 @@ def cmd_monitor(args) -> int:
 
 def cmd_info(_args) -> int:
     """Print detailed GPU info for all GPUs."""
-    count = gpu_count()
-    print(f"Found {count} NVIDIA GPU(s)\n")
+    # All GPUs are read concurrently, then printed in index order
+    snaps = snapshot_all()
+    print(f"Found {len(snaps)} NVIDIA GPU(s)\n")
 
-    for i in range(count):
-        s = snapshot(i)
+    for i, s in enumerate(snaps):
         print(f"═══ GPU {i}: {s.name} ═══")
         print(f"  Driver:        {s.driver_version}")
         print(f"  PCI Bus:       {s.pci_bus_id}")
@@ -10,6 +10,7 @@ Command behavior:
   - One or more Set flags: apply settings to GPU, then confirm
   - --reset: restore everything to factory defaults
   - --save PATH: snapshot current OC settings to a JSON profile
+                 (after applying any Set flags given alongside it)
   - --load PATH: apply OC settings from a saved JSON profile
   - --status: explicitly show OC status (redundant with no-flags)
 
@@ -31,9 +32,41 @@ Profile format (JSON):
 from __future__ import annotations
 
 import json
+import sys
 from datetime import datetime
 from pathlib import Path
 
+# orjson is optional — used for profile read/write when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(o):
+    """stdlib json fallback for values orjson handles natively (datetime)."""
+    if isinstance(o, datetime):
+        return o.isoformat(timespec="seconds")
+    raise TypeError(f"{type(o).__name__} is not JSON serializable")
+
+
+# Profile reader/writer picked once at import. Both parsers take UTF-8 bytes;
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers'
+# except clauses cover either.
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _write_json(p: Path, obj) -> None:
+        # orjson formats datetime itself; OMIT_MICROSECONDS matches
+        # isoformat(timespec="seconds")
+        p.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_OMIT_MICROSECONDS))
+else:
+    _loads = json.loads
+
+    def _write_json(p: Path, obj) -> None:
+        with p.open("w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2, default=_json_default)
+
 
 def _save_profile(path_str: str, status) -> str:
     """Save current OC status to a JSON profile file.
@@ -44,7 +77,7 @@ def _save_profile(path_str: str, status) -> str:
     """
     profile = {
         "kingai_gpu_profile": "1.0",
-        "saved_at": datetime.now().isoformat(timespec="seconds"),
+        "saved_at": datetime.now(),  # serialized as ISO 8601, seconds precision
         "gpu_name": status.gpu_name,
         "bus_id": status.bus_id,
         # ── Settable values (these get applied on --load) ──
@@ -66,7 +99,7 @@ def _save_profile(path_str: str, status) -> str:
     if p.suffix == "":
         p = p.with_suffix(".json")
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(profile, indent=2), encoding="utf-8")
+    _write_json(p, profile)
     return str(p)
 
 
@@ -78,14 +111,126 @@ def _load_profile(path_str: str) -> dict:
     functions (NVAPI will reject out-of-range values with an error).
     """
     p = Path(path_str).resolve()
-    if not p.exists():
-        raise FileNotFoundError(f"Profile not found: {p}")
-    data = json.loads(p.read_text(encoding="utf-8"))
+    # One open + read of the raw bytes; both parsers take UTF-8 bytes, so
+    # there's no separate exists() stat or str decode pass
+    try:
+        raw = p.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Profile not found: {p}") from None
+    data = _loads(raw)
     if not isinstance(data, dict):
         raise ValueError(f"Invalid profile: expected JSON object, got {type(data).__name__}")
     return data
 
 
+# ── Set operations ──
+# One row per settable parameter, shared by the --load branch (values from
+# the profile dict) and the direct-flag branch (values from argparse):
+#   (args attr, profile key, nvapi setter, change-line format, error label, convert)
+# Order is the order they're applied and printed.
+_SET_OPS = (
+    ("core", "core_offset_mhz", "set_core_offset",
+     "  Core offset:   {:+d} MHz", "core offset", int),
+    ("mem", "mem_offset_mhz", "set_mem_offset",
+     "  Memory offset: {:+d} MHz", "memory offset", int),
+    ("power", "power_pct", "set_power_limit",
+     "  Power limit:   {}%", "power limit", None),
+    ("thermal", "thermal_c", "set_thermal_limit",
+     "  Thermal limit: {}°C", "thermal limit", int),
+    ("fan", "fan_pct", "set_fan_speed",
+     "  Fan speed:     {}%", "fan speed", int),
+)
+
+
+# Value-less Set flags (store_true): (args attr, nvapi setter, change line, error label)
+_SET_TOGGLES = (
+    ("fan_auto", "set_fan_auto", "  Fan:           auto", "fan auto"),
+)
+
+
+def _apply_toggles(args, gpu: int, changes: list[str]) -> bool:
+    """Apply each _SET_TOGGLES flag that's set. False after printing a failure."""
+    from kingai_gpu.lib import nvapi
+
+    for attr, setter, line, label in _SET_TOGGLES:
+        if not getattr(args, attr):
+            continue
+        try:
+            getattr(nvapi, setter)(gpu)
+        except nvapi.NvApiError as e:
+            print(f"Failed to set {label}: {e}")
+            return False
+        changes.append(line)
+    return True
+
+
+def _apply_settings(values: dict, gpu: int, current: dict | None = None) -> list[str] | None:
+    """Apply each _SET_OPS value in `values` (keyed by args attr) that isn't None.
+
+    current: live values from nvapi.get_current_settings(). Any value that
+    already matches is reported but not re-sent to the driver.
+
+    Stops at the first failure — partial application could leave the GPU in
+    an unexpected state, and the user can re-run with correct values.
+    Returns the change lines, or None after printing the failure.
+    """
+    from kingai_gpu.lib import nvapi
+
+    current = current or {}
+    lines: dict[str, str] = {}
+    todo: dict = {}
+    for attr, _key, _setter, fmt, _label, convert in _SET_OPS:
+        val = values.get(attr)
+        if val is None:
+            continue
+        if convert is not None:
+            val = convert(val)
+        if attr in current and float(val) == current[attr]:
+            lines[attr] = fmt.format(val) + "  (unchanged)"
+        else:
+            todo[attr] = val
+
+    # Core + memory together are a single SetPstates20 write
+    if "core" in todo and "mem" in todo:
+        core, mem = todo.pop("core"), todo.pop("mem")
+        try:
+            nvapi.set_clock_offsets(core, mem, gpu)
+        except nvapi.NvApiError as e:
+            print(f"Failed to set core/memory offset: {e}")
+            return None
+        lines["core"] = f"  Core offset:   {core:+d} MHz"
+        lines["mem"] = f"  Memory offset: {mem:+d} MHz"
+
+    for attr, _key, setter, fmt, label, _convert in _SET_OPS:
+        if attr not in todo:
+            continue
+        val = todo[attr]
+        try:
+            getattr(nvapi, setter)(val, gpu)
+        except nvapi.NvApiError as e:
+            print(f"Failed to set {label}: {e}")
+            return None
+        lines[attr] = fmt.format(val)
+
+    return [lines[op[0]] for op in _SET_OPS if op[0] in lines]
+
+
+# Output after a successful --reset — fixed text, written in one go
+_RESET_DONE = (
+    "  Core offset:   0 MHz\n"
+    "  Memory offset: 0 MHz\n"
+    "  Power limit:   default\n"
+    "  Thermal limit: default\n"
+    "  Fan:           auto\n"
+    "Done.\n"
+)
+
+
+def _print_changes(changes: list[str], gpu: int) -> None:
+    """Print the 'Applied to GPU N:' block as a single write."""
+    sys.stdout.write(f"Applied to GPU {gpu}:\n" + "\n".join(changes) + "\n")
+
+
 def cmd_overclock(args) -> int:
     """Handle the 'oc' subcommand."""
 
@@ -93,14 +238,9 @@ def cmd_overclock(args) -> int:
         from kingai_gpu.lib.nvapi import (
             NvApiError,
             enable_oc,
+            get_current_settings,
             get_oc_status,
             reset_all,
-            set_core_offset,
-            set_fan_auto,
-            set_fan_speed,
-            set_mem_offset,
-            set_power_limit,
-            set_thermal_limit,
         )
     except ImportError as e:
         print(f"Error: {e}")
@@ -120,44 +260,15 @@ def cmd_overclock(args) -> int:
     # This is the "panic button" — undoes all overclocking.
     # reset_all() in nvapi.py handles each subsystem independently.
     if args.reset:
-        print(f"Resetting GPU {gpu} to stock defaults...")
+        print(f"Resetting GPU {gpu} to stock defaults...", flush=True)
         try:
             reset_all(gpu)
-            print("  Core offset:   0 MHz")
-            print("  Memory offset: 0 MHz")
-            print("  Power limit:   default")
-            print("  Thermal limit: default")
-            print("  Fan:           auto")
-            print("Done.")
+            sys.stdout.write(_RESET_DONE)
         except NvApiError as e:
             print(f"Error during reset: {e}")
             return 1
         return 0
 
-    # ── Save profile ── Snapshot current OC settings to a JSON file.
-    # Reads the live OcStatus and writes the settable values.
-    if args.save:
-        try:
-            s = get_oc_status(gpu)
-        except NvApiError as e:
-            print(f"Error reading OC status for save: {e}")
-            return 1
-        try:
-            saved_path = _save_profile(args.save, s)
-            print(f"Saved profile to {saved_path}")
-            print(f"  Core offset:   {s.core_offset_mhz:+.0f} MHz")
-            print(f"  Memory offset: {s.mem_offset_mhz:+.0f} MHz")
-            print(f"  Power limit:   {s.power_pct:.0f}%")
-            print(f"  Thermal limit: {s.thermal_c}°C")
-            if s.fan_pct is not None:
-                print(f"  Fan speed:     {s.fan_pct}%")
-            else:
-                print(f"  Fan:           auto (not saved)")
-        except (OSError, ValueError) as e:
-            print(f"Failed to save profile: {e}")
-            return 1
-        return 0
-
     # ── Load profile ── Apply OC settings from a JSON file.
     # Only applies fields that are present in the profile. Missing fields
     # are left unchanged (not reset). This lets you share partial profiles
@@ -173,146 +284,87 @@ def cmd_overclock(args) -> int:
         src = profile.get("gpu_name", "unknown GPU")
         print(f"Loading profile (from {src})...")
 
-        changes = []
-        if "core_offset_mhz" in profile:
-            val = int(profile["core_offset_mhz"])
-            try:
-                set_core_offset(val, gpu)
-                changes.append(f"  Core offset:   {val:+d} MHz")
-            except NvApiError as e:
-                print(f"Failed to set core offset: {e}")
-                return 1
-
-        if "mem_offset_mhz" in profile:
-            val = int(profile["mem_offset_mhz"])
-            try:
-                set_mem_offset(val, gpu)
-                changes.append(f"  Memory offset: {val:+d} MHz")
-            except NvApiError as e:
-                print(f"Failed to set memory offset: {e}")
-                return 1
-
-        if "power_pct" in profile:
-            val = profile["power_pct"]
-            try:
-                set_power_limit(val, gpu)
-                changes.append(f"  Power limit:   {val}%")
-            except NvApiError as e:
-                print(f"Failed to set power limit: {e}")
-                return 1
-
-        if "thermal_c" in profile:
-            val = int(profile["thermal_c"])
-            try:
-                set_thermal_limit(val, gpu)
-                changes.append(f"  Thermal limit: {val}°C")
-            except NvApiError as e:
-                print(f"Failed to set thermal limit: {e}")
-                return 1
-
-        fan = profile.get("fan_pct")
-        if fan is not None:
-            try:
-                set_fan_speed(int(fan), gpu)
-                changes.append(f"  Fan speed:     {fan}%")
-            except NvApiError as e:
-                print(f"Failed to set fan speed: {e}")
-                return 1
+        # Absent or null fields are left unchanged (fan_pct null = auto).
+        # Fields the GPU already has are skipped, so re-loading the same
+        # profile doesn't re-send every Set to the driver.
+        values = {op[0]: profile.get(op[1]) for op in _SET_OPS}
+        changes = _apply_settings(values, gpu, get_current_settings(gpu))
+        if changes is None:
+            return 1
 
         if changes:
-            print(f"Applied to GPU {gpu}:")
-            for c in changes:
-                print(c)
+            _print_changes(changes, gpu)
         else:
             print("Profile had no applicable settings.")
-        return 0
+        if not args.save:
+            return 0
+
+    # --reset has returned above, and --load has too unless --save follows
+    # it, so only the Set flags and --save decide what happens from here on
+    no_set_flags = (
+        all(getattr(args, op[0]) is None for op in _SET_OPS)
+        and not any(getattr(args, t[0]) for t in _SET_TOGGLES)
+    )
 
     # ── Show status ── Read-only view of all current OC parameters.
-    # Shown by default when no Set flags are given, or explicitly with --status.
-    if args.status or (
-        args.core is None
-        and args.mem is None
-        and args.power is None
-        and args.thermal is None
-        and args.fan is None
-        and not args.fan_auto
-        and not args.save
-        and not args.load
-    ):
+    # Shown by default when no Set flags (and no --save) are given, or
+    # explicitly with --status.
+    if not args.save and (args.status or no_set_flags):
         try:
             s = get_oc_status(gpu)
         except NvApiError as e:
             print(f"Error reading OC status: {e}")
             return 1
 
-        print(f"═══ GPU {gpu}: {s.gpu_name} (Bus {s.bus_id}) ═══")
-        print(f"  Core offset:   {s.core_offset_mhz:+.0f} MHz  "
-              f"(range: {s.core_offset_range_mhz[0]:+.0f} to {s.core_offset_range_mhz[1]:+.0f})")
-        print(f"  Memory offset: {s.mem_offset_mhz:+.0f} MHz  "
-              f"(range: {s.mem_offset_range_mhz[0]:+.0f} to {s.mem_offset_range_mhz[1]:+.0f})")
-        print(f"  Power limit:   {s.power_pct:.0f}%  "
-              f"(range: {s.power_range_pct[0]:.0f}% to {s.power_range_pct[1]:.0f}%)")
-        print(f"  Thermal limit: {s.thermal_c}°C  "
-              f"(range: {s.thermal_range_c[0]}°C to {s.thermal_range_c[1]}°C)")
+        sys.stdout.write(
+            f"═══ GPU {gpu}: {s.gpu_name} (Bus {s.bus_id}) ═══\n"
+            f"  Core offset:   {s.core_offset_mhz:+.0f} MHz  "
+            f"(range: {s.core_offset_range_mhz[0]:+.0f} to {s.core_offset_range_mhz[1]:+.0f})\n"
+            f"  Memory offset: {s.mem_offset_mhz:+.0f} MHz  "
+            f"(range: {s.mem_offset_range_mhz[0]:+.0f} to {s.mem_offset_range_mhz[1]:+.0f})\n"
+            f"  Power limit:   {s.power_pct:.0f}%  "
+            f"(range: {s.power_range_pct[0]:.0f}% to {s.power_range_pct[1]:.0f}%)\n"
+            f"  Thermal limit: {s.thermal_c}°C  "
+            f"(range: {s.thermal_range_c[0]}°C to {s.thermal_range_c[1]}°C)\n"
+        )
         return 0
 
     # ── Apply settings ── Each flag is applied independently.
     # If one fails, we return immediately with error (don't apply remaining).
     # This is intentional — partial application could leave the GPU in an
     # unexpected state. The user can re-run with correct values.
-    changes = []
-
-    if args.core is not None:
-        try:
-            set_core_offset(args.core, gpu)
-            changes.append(f"  Core offset:   {args.core:+d} MHz")
-        except NvApiError as e:
-            print(f"Failed to set core offset: {e}")
-            return 1
-
-    if args.mem is not None:
-        try:
-            set_mem_offset(args.mem, gpu)
-            changes.append(f"  Memory offset: {args.mem:+d} MHz")
-        except NvApiError as e:
-            print(f"Failed to set memory offset: {e}")
-            return 1
-
-    if args.power is not None:
-        try:
-            set_power_limit(args.power, gpu)
-            changes.append(f"  Power limit:   {args.power}%")
-        except NvApiError as e:
-            print(f"Failed to set power limit: {e}")
-            return 1
+    # Fan auto has no value, so it lives in _SET_TOGGLES instead.
+    changes = _apply_settings({op[0]: getattr(args, op[0]) for op in _SET_OPS}, gpu)
+    if changes is None or not _apply_toggles(args, gpu, changes):
+        return 1
 
-    if args.thermal is not None:
-        try:
-            set_thermal_limit(args.thermal, gpu)
-            changes.append(f"  Thermal limit: {args.thermal}°C")
-        except NvApiError as e:
-            print(f"Failed to set thermal limit: {e}")
-            return 1
+    if changes:
+        _print_changes(changes, gpu)
 
-    if args.fan is not None:
+    # ── Save profile ── Snapshot current OC settings to a JSON file.
+    # Reads the live OcStatus and writes the settable values. Runs after
+    # any Set flags, so '--core 100 --save p.json' applies then saves in
+    # one run — a single status read that already reflects the new values.
+    if args.save:
         try:
-            set_fan_speed(args.fan, gpu)
-            changes.append(f"  Fan speed:     {args.fan}%")
+            s = get_oc_status(gpu)
         except NvApiError as e:
-            print(f"Failed to set fan speed: {e}")
+            print(f"Error reading OC status for save: {e}")
             return 1
-
-    if args.fan_auto:
         try:
-            set_fan_auto(gpu)
-            changes.append(f"  Fan:           auto")
-        except NvApiError as e:
-            print(f"Failed to set fan auto: {e}")
+            saved_path = _save_profile(args.save, s)
+            fan = (f"  Fan speed:     {s.fan_pct}%" if s.fan_pct is not None
+                   else "  Fan:           auto (not saved)")
+            sys.stdout.write(
+                f"Saved profile to {saved_path}\n"
+                f"  Core offset:   {s.core_offset_mhz:+.0f} MHz\n"
+                f"  Memory offset: {s.mem_offset_mhz:+.0f} MHz\n"
+                f"  Power limit:   {s.power_pct:.0f}%\n"
+                f"  Thermal limit: {s.thermal_c}°C\n"
+                f"{fan}\n"
+            )
+        except (OSError, ValueError) as e:
+            print(f"Failed to save profile: {e}")
             return 1
 
-    if changes:
-        print(f"Applied to GPU {gpu}:")
-        for c in changes:
-            print(c)
-
     return 0
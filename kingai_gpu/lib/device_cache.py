@@ -10,11 +10,13 @@ Solution: After a successful get_oc_status(), save what we learned:
   - Power info: did primary offsets work, or which scanned offsets were found?
   - Thermal info: are the values <<8 shifted?
   - Fan API: did the new ClientFanCoolersSetControl work, or did we fall back?
+  - Limit ranges: the BIOS min/max for power target and thermal limit
 
 Cache invalidation: keyed by (gpu_name, bus_id, driver_version).
 If the driver updates, the cache auto-invalidates and re-probes.
 
-File location: ~/.kingai_gpu/device_cache.json
+File location: ~/.kingai_gpu/device_cache.json (plus nvapi_missing.json,
+the per-driver list of NVAPI functions QueryInterface doesn't expose)
 The file is optional — if missing or corrupt, everything still works
 (just re-probes as if no cache existed). This is a polish optimization,
 not a correctness requirement.
@@ -22,25 +24,85 @@ not a correctness requirement.
 Design principles:
   - Cache is NEVER trusted for correctness — it's a hint that skips probing
   - If a cached hint causes an NVAPI error, we fall back to full probing
-  - The cache only stores layout metadata, never OC settings or sensor values
-  - Cache file is human-readable JSON (useful for debugging driver quirks)
+  - The cache only stores layout metadata and static BIOS limit ranges,
+    never OC settings or sensor values
+  - Cache file is plain JSON, written compact. Set KINGAI_GPU_CACHE_PRETTY=1
+    to write it indented when debugging driver quirks by hand
 """
 
 from __future__ import annotations
 
+import atexit
 import json
-from dataclasses import dataclass, field, asdict
+import os
+import time
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+# orjson is optional — faster parse/dump on the startup path of every
+# command that touches NVAPI. Same file format either way.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Serializer picked once at import so load/save don't re-branch per call.
+# All three work in UTF-8 bytes.
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _dumps_pretty(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def _dumps_pretty(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
 
 # Default cache location — in user's home directory, not the repo.
 # This survives Python venv changes and works for installed packages.
 _CACHE_DIR = Path.home() / ".kingai_gpu"
 _CACHE_FILE = _CACHE_DIR / "device_cache.json"
 
+# Plain-string forms, resolved once. The load/save path goes straight to
+# open()/os.* with these instead of re-walking the Path objects each call.
+_CACHE_DIR_STR = str(_CACHE_DIR)
+_CACHE_FILE_STR = str(_CACHE_FILE)
+_CACHE_TMP_STR = _CACHE_FILE_STR + ".tmp"
+
+# Which NVAPI entry points QueryInterface reported missing, per driver build
+# (see load_missing_functions). Separate file: it's per-driver, not per-GPU.
+_QI_FILE_STR = str(_CACHE_DIR / "nvapi_missing.json")
 
-@dataclass
+# In-process copy of the cache file, parsed on first use. get_entry() and
+# put_entry() share it, so a get → probe → put flow reads the file once.
+_CACHE: dict[str, GpuCacheEntry] | None = None
+
+# (mtime_ns, parsed entries) from the last load_cache() that read the file
+_LOADED: tuple[int, dict[str, GpuCacheEntry]] | None = None
+
+# Bytes this process last wrote to _CACHE_FILE — lets save_cache() skip a
+# rewrite (and the read to compare) when nothing changed.
+_last_written: bytes | None = None
+
+# Deferred writes — put_entry(..., defer=True) only marks the in-process
+# cache dirty; it reaches disk at most once per _FLUSH_INTERVAL_S while
+# probes keep coming, and once more at interpreter exit (flush()).
+_FLUSH_INTERVAL_S = 30.0
+_dirty = False
+_last_flush = 0.0
+_atexit_registered = False
+
+
+@dataclass(slots=True)
 class GpuCacheEntry:
     """Cached probe results for a single GPU + driver version.
 
@@ -72,51 +134,104 @@ class GpuCacheEntry:
     fan_entry_size: int | None = None  # entry size for new API (typically 68)
     fan_count: int | None = None  # number of fan entries
 
+    # ── Static limit ranges ──
+    # BIOS-defined ranges for power target and thermal limit. Constant for a
+    # GPU + driver, so 'oc --status' can skip the two Info reads once cached.
+    power_range_pct: list[float] | None = None  # [min_pct, max_pct]
+    thermal_range_c: list[int] | None = None  # [min_c, max_c]
+
     # ── Metadata ──
-    cached_at: str = ""  # ISO timestamp of when this was saved
+    # Unix seconds of when this was saved — format with
+    # datetime.fromtimestamp() only when shown. (Files written before this
+    # was an int hold an ISO string; it's metadata only, never compared.)
+    cached_at: int = 0
     probe_time_ms: float = 0.0  # how long the full probe took (for diagnostics)
 
-
+    def to_dict(self) -> dict[str, Any]:
+        """Flat dict for JSON. A plain literal — asdict() would deep-copy.
+
+        scanned_power_offsets is shared, not copied: the result only goes to
+        the JSON encoder, which never mutates it.
+        """
+        return {
+            "gpu_name": self.gpu_name,
+            "bus_id": self.bus_id,
+            "driver_version": self.driver_version,
+            "power_primary_ok": self.power_primary_ok,
+            "scanned_power_offsets": self.scanned_power_offsets,
+            "thermal_shifted": self.thermal_shifted,
+            "fan_api": self.fan_api,
+            "fan_entry_size": self.fan_entry_size,
+            "fan_count": self.fan_count,
+            "power_range_pct": self.power_range_pct,
+            "thermal_range_c": self.thermal_range_c,
+            "cached_at": self.cached_at,
+            "probe_time_ms": self.probe_time_ms,
+        }
+
+
+# (field name, default) for every GpuCacheEntry field — load_cache() fills
+# missing keys from this, so old cache files with fewer fields still load.
+_FIELDS = tuple((f.name, f.default) for f in fields(GpuCacheEntry))
+
+
+@lru_cache(maxsize=32)
 def _cache_key(gpu_name: str, bus_id: int, driver_version: str) -> str:
     """Build a unique cache key from GPU identity + driver version.
 
     Format: "GeForce RTX 4090 [Bus 1] @ 560.94"
     Driver version is part of the key so cache auto-invalidates on update.
+    Memoized — a host has a handful of (GPU, driver) combos, so repeated
+    get/put calls reuse the same key string instead of re-formatting it.
     """
     return f"{gpu_name} [Bus {bus_id}] @ {driver_version}"
 
 
+def _read_cache_file() -> bytes | None:
+    """Raw cache file contents, or None if it doesn't exist yet."""
+    try:
+        with open(_CACHE_FILE_STR, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
 def load_cache() -> dict[str, GpuCacheEntry]:
     """Load the device cache from disk. Returns empty dict on any failure.
 
     This is deliberately forgiving — a corrupt or missing cache file
     just means we re-probe everything (same as first run).
+
+    The parsed result is kept with the file's mtime; while the file is
+    unchanged, later calls in the same process skip the read + parse and
+    get a fresh dict over the same entries.
     """
-    if not _CACHE_FILE.exists():
-        return {}
+    global _LOADED
     try:
-        raw = json.loads(_CACHE_FILE.read_text(encoding="utf-8"))
-        if not isinstance(raw, dict):
+        mtime = os.stat(_CACHE_FILE_STR).st_mtime_ns
+    except OSError:
+        return {}  # missing (first run) or unreadable
+    if _LOADED is not None and _LOADED[0] == mtime:
+        return dict(_LOADED[1])
+    try:
+        data = _read_cache_file()
+        if data is None:
             return {}
+        raw = _loads(data)
+        try:
+            items = raw.items()
+        except AttributeError:
+            return {}  # top level isn't an object
         cache = {}
-        for key, data in raw.items():
-            if isinstance(data, dict):
-                entry = GpuCacheEntry(
-                    gpu_name=data.get("gpu_name", ""),
-                    bus_id=data.get("bus_id", 0),
-                    driver_version=data.get("driver_version", ""),
-                    power_primary_ok=data.get("power_primary_ok"),
-                    scanned_power_offsets=data.get("scanned_power_offsets"),
-                    thermal_shifted=data.get("thermal_shifted"),
-                    fan_api=data.get("fan_api"),
-                    fan_entry_size=data.get("fan_entry_size"),
-                    fan_count=data.get("fan_count"),
-                    cached_at=data.get("cached_at", ""),
-                    probe_time_ms=data.get("probe_time_ms", 0.0),
-                )
-                cache[key] = entry
-        return cache
-    except (json.JSONDecodeError, OSError, TypeError):
+        for key, data in items:
+            try:
+                cache[key] = GpuCacheEntry(**{k: data.get(k, d) for k, d in _FIELDS})
+            except AttributeError:
+                continue  # entry isn't an object — skip just this one
+        _LOADED = (mtime, cache)
+        return dict(cache)
+    except (ValueError, OSError, TypeError):
+        # ValueError covers json.JSONDecodeError and orjson.JSONDecodeError
         return {}
 
 
@@ -125,19 +240,52 @@ def save_cache(cache: dict[str, GpuCacheEntry]) -> bool:
 
     Creates ~/.kingai_gpu/ if it doesn't exist. Any write failure is
     silently ignored — the cache is optional and re-probing works fine.
+
+    Skips the write when the serialized bytes match what's already on disk
+    (or what this process last wrote), and otherwise writes a temp file and
+    os.replace()s it in, so a crash mid-write can't leave a corrupt cache.
     """
+    global _last_written
     try:
-        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        serializable = {key: asdict(entry) for key, entry in cache.items()}
-        _CACHE_FILE.write_text(
-            json.dumps(serializable, indent=2),
-            encoding="utf-8",
-        )
+        serializable = {key: entry.to_dict() for key, entry in cache.items()}
+        if os.environ.get("KINGAI_GPU_CACHE_PRETTY") == "1":
+            data = _dumps_pretty(serializable)
+        else:
+            data = _dumps(serializable)
+
+        if data == _last_written:
+            return True
+        if _last_written is None and _read_cache_file() == data:
+            _last_written = data
+            return True
+
+        os.makedirs(_CACHE_DIR_STR, exist_ok=True)
+        with open(_CACHE_TMP_STR, "wb") as f:
+            f.write(data)
+        os.replace(_CACHE_TMP_STR, _CACHE_FILE_STR)
+        _last_written = data
         return True
     except (OSError, TypeError):
         return False
 
 
+def _get_loaded_cache() -> dict[str, GpuCacheEntry]:
+    """Return the in-process cache, loading it from disk on first call."""
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = load_cache()
+    return _CACHE
+
+
+def _invalidate() -> None:
+    """Drop the in-process copy so the next access re-reads the file."""
+    global _CACHE, _LOADED, _last_written, _dirty
+    _CACHE = None
+    _LOADED = None
+    _last_written = None
+    _dirty = False
+
+
 def get_entry(
     gpu_name: str,
     bus_id: int,
@@ -146,11 +294,11 @@ def get_entry(
 ) -> GpuCacheEntry | None:
     """Look up a cache entry for a specific GPU + driver combo.
 
-    If cache is None, loads from disk first.
+    If cache is None, uses the in-process cache (loaded from disk once).
     Returns None on cache miss (unknown GPU or driver version changed).
     """
     if cache is None:
-        cache = load_cache()
+        cache = _get_loaded_cache()
     key = _cache_key(gpu_name, bus_id, driver_version)
     return cache.get(key)
 
@@ -158,25 +306,110 @@ def get_entry(
 def put_entry(
     entry: GpuCacheEntry,
     cache: dict[str, GpuCacheEntry] | None = None,
+    defer: bool = False,
 ) -> dict[str, GpuCacheEntry]:
     """Store a cache entry and persist to disk.
 
-    If cache is None, loads existing cache first (preserves other GPU entries).
-    Returns the updated cache dict.
+    If cache is None, updates the in-process cache (loaded from disk once,
+    so other GPU entries are preserved). Returns the updated cache dict.
+
+    defer=True (in-process cache only) skips the immediate write: the
+    entry is marked dirty and written by the next flush — when
+    _FLUSH_INTERVAL_S has passed since the last one, or at exit. Callers
+    that probe repeatedly (a polling loop calling get_oc_status) use this
+    so the file isn't rewritten on every tick.
     """
+    global _dirty
     if cache is None:
-        cache = load_cache()
+        cache = _get_loaded_cache()
     key = _cache_key(entry.gpu_name, entry.bus_id, entry.driver_version)
     cache[key] = entry
-    save_cache(cache)
+    if not defer or cache is not _CACHE:
+        save_cache(cache)
+        return cache
+
+    _dirty = True
+    _register_flush()
+    if time.monotonic() - _last_flush >= _FLUSH_INTERVAL_S:
+        flush()
     return cache
 
 
-def clear_cache() -> bool:
-    """Delete the cache file entirely. Used for troubleshooting."""
+def flush() -> bool:
+    """Write deferred put_entry() changes to disk, if there are any.
+
+    Registered with atexit on the first deferred put, so callers normally
+    never need this — it's public for code that wants the file current
+    right now (e.g. before handing the cache dir to another process).
+    """
+    global _dirty, _last_flush
+    if not _dirty or _CACHE is None:
+        return True
+    _last_flush = time.monotonic()
+    ok = save_cache(_CACHE)
+    if ok:
+        _dirty = False
+    return ok
+
+
+def _register_flush() -> None:
+    global _atexit_registered
+    if not _atexit_registered:
+        atexit.register(flush)
+        _atexit_registered = True
+
+
+# ── NVAPI entry-point availability ──
+# nvapi._init() resolves every function it uses through QueryInterface on
+# each launch. The ones an older driver doesn't expose come back NULL every
+# time, so their names are remembered per driver build and not asked for
+# again until the driver changes. Pointers that did resolve are never
+# cached — they're only valid inside the process that fetched them.
+
+def load_missing_functions(driver_sig: str) -> frozenset[str]:
+    """Names QueryInterface returned NULL for under this driver build.
+
+    driver_sig identifies the installed nvapi64.dll (nvapi.py derives it
+    from the DLL's size + mtime). Returns an empty set on any mismatch,
+    missing file or parse error — i.e. "probe everything".
+    """
+    if not driver_sig:
+        return frozenset()
+    try:
+        with open(_QI_FILE_STR, "rb") as f:
+            raw = _loads(f.read())
+        if raw.get("driver") != driver_sig:
+            return frozenset()
+        return frozenset(raw.get("missing", ()))
+    except (OSError, ValueError, AttributeError, TypeError):
+        return frozenset()
+
+
+def save_missing_functions(driver_sig: str, names) -> bool:
+    """Persist the NULL-resolving function names for driver_sig (atomic write)."""
+    if not driver_sig:
+        return False
     try:
-        if _CACHE_FILE.exists():
-            _CACHE_FILE.unlink()
+        data = _dumps({"driver": driver_sig, "missing": sorted(names)})
+        os.makedirs(_CACHE_DIR_STR, exist_ok=True)
+        tmp = _QI_FILE_STR + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, _QI_FILE_STR)
         return True
-    except OSError:
+    except (OSError, TypeError):
         return False
+
+
+def clear_cache() -> bool:
+    """Delete the cache files entirely. Used for troubleshooting."""
+    _invalidate()
+    ok = True
+    for path in (_CACHE_FILE_STR, _QI_FILE_STR):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            ok = False
+    return ok
@@ -14,11 +14,27 @@ Reference: Demion/nvapioc (C++ OC tool), falahati/NvAPIWrapper (C# wrapper)
 from __future__ import annotations
 
 import ctypes
+import os
+import random
 import struct
 import sys
+import threading
 import time
 from dataclasses import dataclass
 
+# The device cache is optional polish (see lib/device_cache.py) — imported
+# once here so the per-probe cache paths below do no import work at all.
+try:
+    from kingai_gpu.lib.device_cache import (
+        GpuCacheEntry,
+        get_entry,
+        load_missing_functions,
+        put_entry,
+        save_missing_functions,
+    )
+except ImportError:
+    GpuCacheEntry = None
+
 # NVAPI is Windows-only — it's a Windows DLL that talks to the NVIDIA kernel
 # driver (nvlddmkm.sys). On Linux, use nvidia-smi or NVML directly.
 if sys.platform != "win32":
@@ -48,12 +64,18 @@ NVAPI_ERRORS = {
     -104: "INVALID_USER_PRIVILEGE",
 }
 
+# Same names as a tuple indexed by -status (None for codes not listed), so
+# naming an error is a bounds check + tuple index rather than a dict probe.
+_ERROR_NAMES = tuple(NVAPI_ERRORS.get(-i) for i in range(-min(NVAPI_ERRORS) + 1))
+
 
 class NvApiError(Exception):
     """NVAPI call failed."""
 
     def __init__(self, func_name: str, status: int):
-        name = NVAPI_ERRORS.get(status, f"UNKNOWN({status})")
+        name = _ERROR_NAMES[-status] if -len(_ERROR_NAMES) < status <= 0 else None
+        if name is None:
+            name = f"UNKNOWN({status})"
         super().__init__(f"{func_name} returned {status} ({name})")
         self.status = status
         self.func_name = func_name
@@ -65,35 +87,48 @@ def _check(func_name: str, status: int) -> int:
     return status
 
 
-# Status codes that are transient — another app (Afterburner, NVIDIA tuning
-# panel, EVGA Precision) holds the OC lock briefly. The lock releases when
-# their call completes, typically <100ms. Retrying fixes it.
-_TRANSIENT_ERRORS = {-104, -9}  # INVALID_USER_PRIVILEGE, INCOMPATIBLE_STRUCT_VERSION (driver busy)
+# Set failures are classified by status code, since each class wants a
+# different response:
+#
+#   RETRY — another app (Afterburner, NVIDIA tuning panel, EVGA Precision)
+#           holds the OC lock briefly. It releases when their call completes,
+#           typically <100ms, so retry with exponential backoff + jitter (two
+#           tools backing off in lockstep would just collide again).
+#   ABORT — everything else (INVALID_ARGUMENT, NOT_SUPPORTED, ...). Retrying
+#           can't change the answer; fail immediately. This includes
+#           INCOMPATIBLE_STRUCT_VERSION: the struct we send is identical on
+#           every try, so a version rejection is structural, never transient.
+_RETRY = "retry"
+_ABORT = "abort"
+
+_ERROR_CLASS = {
+    -104: _RETRY,       # INVALID_USER_PRIVILEGE (OC lock held)
+}
+
+_RETRY_BASE_S = 0.1   # first backoff step; doubles each attempt
 
 
 def _check_set(func_name: str, fn, *args, max_retries: int = 3) -> int:
-    """Call an NVAPI Set function with retry on transient lock errors.
+    """Call an NVAPI Set function, retrying according to _ERROR_CLASS.
 
     Only used for write operations (SetPstates20, SetStatus, SetLimit,
     SetCoolerLevels, SetControl). Get operations should NOT retry — if a
     Get fails, the struct layout is wrong and retrying won't help.
 
-    Retry schedule: 100ms, 200ms, 300ms. Total worst-case: 600ms.
-    If it still fails after 3 tries, the lock is held persistently
-    (user should close Afterburner).
+    Backoff: base * 2**attempt plus up to 50% jitter — roughly 100-150ms,
+    then 200-300ms with the default 3 tries. If a lock error survives
+    every try, the lock is held persistently (user should close Afterburner).
     """
-    last_status = 0
+    status = 0
     for attempt in range(max_retries):
         status = fn(*args)
         if status == NVAPI_OK:
             return status
-        last_status = status
-        if status in _TRANSIENT_ERRORS and attempt < max_retries - 1:
-            time.sleep(0.1 * (attempt + 1))  # 100ms, 200ms, 300ms
-            continue
-        # Non-transient error or last attempt — fail immediately
-        raise NvApiError(func_name, status)
-    raise NvApiError(func_name, last_status)
+        if _ERROR_CLASS.get(status, _ABORT) != _RETRY or attempt >= max_retries - 1:
+            break
+        delay = _RETRY_BASE_S * (2 ** attempt)
+        time.sleep(delay + random.uniform(0, delay * 0.5))
+    raise NvApiError(func_name, status)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -173,23 +208,36 @@ _QI = {
 # Function pointer resolution
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-# NVAPI functions use C calling conventions. We define 3 signatures:
+# NVAPI functions use C calling conventions. We define 5 signatures:
 #
 # _FN_VOID — no args (Initialize only)
 #   fn() → int status
 #
 # _FN_2PTR — most OC functions (Get/Set with struct)
 #   fn(void* gpuHandle, void* structPtr) → int status
-#   Also used for EnumPhysicalGPUs(void** handles, uint* count)
-#   and GetFullName(void* handle, char* nameBuf) — same 2-pointer layout
+#   Also used for GetFullName(void* handle, char* nameBuf) — same layout
+#
+# _FN_ENUM — EnumPhysicalGPUs(void** handles, uint* count) → int status
+#
+# _FN_OUT_UINT — fn(void* gpuHandle, uint* out) → int status (GetBusId)
 #
 # _FN_3ARG — old fan API only
 #   fn(void* gpuHandle, uint coolerIndex, void* structPtr) → int status
 #   SetCoolerLevels takes an extra uint for which cooler to target
 
+# A ctypes array passed for a c_void_p argument is converted to the address
+# of its first element inside the call, so buffers are handed over as-is —
+# no ctypes.cast() (which builds a new c_void_p object every time). Likewise
+# the typed-pointer signatures take a c_uint / c_void_p array directly and
+# ctypes passes its address, with no byref()/pointer() wrapper per call.
+
 _FN_VOID = ctypes.CFUNCTYPE(ctypes.c_int)
 _FN_2PTR = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p)
 _FN_3ARG = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_void_p)
+_FN_ENUM = ctypes.CFUNCTYPE(
+    ctypes.c_int, ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_uint)
+)
+_FN_OUT_UINT = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint))
 
 
 def _resolve(name: str, sig=_FN_2PTR):
@@ -212,10 +260,26 @@ def _resolve(name: str, sig=_FN_2PTR):
 # Resolved function pointers (populated on first use)
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-# name -> ctypes callable. Lazily populated by _init() on first use.
+# One module global per NVAPI entry point, bound by _init() on first use.
 # We resolve all function pointers once at startup rather than per-call
 # because QueryInterface has some overhead and the pointer never changes.
-_fn = {}
+# Plain globals (rather than a name -> callable dict) keep each call site
+# to a single global load instead of a string hash + dict probe, which adds
+# up when the getters are polled. None = not resolved / not exposed.
+_fn_EnumPhysicalGPUs = None
+_fn_GetFullName = None
+_fn_GetBusId = None
+_fn_GetPstates20 = None
+_fn_SetPstates20 = None
+_fn_ClientPowerPoliciesGetInfo = None
+_fn_ClientPowerPoliciesGetStatus = None
+_fn_ClientPowerPoliciesSetStatus = None
+_fn_ClientThermalPoliciesGetInfo = None
+_fn_ClientThermalPoliciesGetLimit = None
+_fn_ClientThermalPoliciesSetLimit = None
+_fn_SetCoolerLevels = None
+_fn_ClientFanCoolersGetControl = None
+_fn_ClientFanCoolersSetControl = None
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -283,41 +347,91 @@ _VOLTAGE_BOOST_SIZE = 40
 # Buffer helpers
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
+# Per-thread scratch buffers, one per struct size. A polling caller reads
+# the same few structs every tick (PStates20 alone is ~7 KB), so reusing the
+# array and clearing it with memset avoids a fresh ctypes allocation and
+# Python object per call. Thread-local so concurrent callers never share.
+_scratch = threading.local()
+
+
 def _buf(size: int, version: int) -> ctypes.Array:
-    """Create a zero-filled buffer with version tag at offset 0.
+    """Return a zero-filled buffer with version tag at offset 0.
 
     Every NVAPI struct must start with the version tag. We zero-fill
     the entire buffer first because NVAPI checks for garbage data
     in unused fields on some functions (particularly Set operations).
+
+    The buffer is this thread's scratch array for `size` — it stays valid
+    only until the next _buf() call with the same size on the same thread,
+    so parse it (or copy out what you need) before requesting another.
     """
-    b = (ctypes.c_ubyte * size)()
-    struct.pack_into("<I", b, 0, _make_version(size, version))
+    try:
+        bufs = _scratch.bufs
+    except AttributeError:
+        bufs = _scratch.bufs = {}
+    b = bufs.get(size)
+    if b is None:
+        b = bufs[size] = (ctypes.c_ubyte * size)()
+    else:
+        ctypes.memset(b, 0, size)
+    _u32_pack(b, 0, _make_version(size, version))
     return b
 
 
+def _struct_buf(cls, version: int):
+    """_buf() for the fixed-layout ctypes.Structure types (_PowerStatus, ...).
+
+    Same per-thread reuse and lifetime rule: one zeroed instance per type,
+    version field stamped, valid until the next _struct_buf(cls) call.
+    """
+    try:
+        structs = _scratch.structs
+    except AttributeError:
+        structs = _scratch.structs = {}
+    st = structs.get(cls)
+    if st is None:
+        st = structs[cls] = cls()
+    else:
+        ctypes.memset(ctypes.addressof(st), 0, ctypes.sizeof(cls))
+    st.version = _make_version(ctypes.sizeof(cls), version)
+    return st
+
+
 # These helpers read/write little-endian integers from raw byte buffers.
 # We use struct.pack/unpack instead of ctypes.Structure because the
 # undocumented structs have layouts that vary by driver version.
 # Raw buffers + offset math is more reliable than rigid Structure defs.
+#
+# The formats are compiled once into Struct objects and their bound methods
+# kept at module level — the PStates20 scans call these hundreds of times
+# per read, and struct.unpack_from("<I", ...) re-resolves the format string
+# through the struct module's cache on every call.
+_U32 = struct.Struct("<I")
+_I32 = struct.Struct("<i")
+_u32_unpack = _U32.unpack_from
+_i32_unpack = _I32.unpack_from
+_u32_pack = _U32.pack_into
+_i32_pack = _I32.pack_into
+
 
 def _u32(buf, offset: int) -> int:
     """Read unsigned 32-bit little-endian integer from buffer."""
-    return struct.unpack_from("<I", buf, offset)[0]
+    return _u32_unpack(buf, offset)[0]
 
 
 def _i32(buf, offset: int) -> int:
     """Read signed 32-bit little-endian integer from buffer."""
-    return struct.unpack_from("<i", buf, offset)[0]
+    return _i32_unpack(buf, offset)[0]
 
 
 def _w32(buf, offset: int, value: int):
     """Write unsigned 32-bit LE to buffer. Masks to 32 bits."""
-    struct.pack_into("<I", buf, offset, value & 0xFFFFFFFF)
+    _u32_pack(buf, offset, value & 0xFFFFFFFF)
 
 
 def _wi32(buf, offset: int, value: int):
     """Write signed 32-bit LE to buffer. Used for clock offsets (can be negative)."""
-    struct.pack_into("<i", buf, offset, value)
+    _i32_pack(buf, offset, value)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -354,6 +468,64 @@ def _volt_off(pstate: int, volt: int) -> int:
     return _pstate_off(pstate) + 8 + _MAX_CLOCKS * _CLOCK_ENTRY_SIZE + volt * _VOLTAGE_ENTRY_SIZE
 
 
+# The geometry is fixed, so every offset is computed once here. The scan
+# loops index this table (_CLOCK_OFFSETS[pi][ci]) instead of paying a
+# Python call per entry; the functions above remain for one-off use.
+_CLOCK_OFFSETS = tuple(
+    tuple(_clock_off(pi, ci) for ci in range(_MAX_CLOCKS)) for pi in range(_MAX_PSTATES)
+)
+
+# Bulk readers so the parse loops run inside struct's C code:
+#   _PSTATE_DOMAINS — the domain field of all 8 clock entries of one pstate
+#                     in a single call (each entry is 4 bytes read + 40 skipped)
+#   _CK_DELTAS      — delta value/min/max, three consecutive int32 at +12
+#   _CK_DOMAIN_DELTAS / _PS_COUNTS — the cached-location read in _read_clock_delta
+_PSTATE_DOMAINS = struct.Struct("<" + "I40x" * (_MAX_CLOCKS - 1) + "I")
+_CK_DELTAS = struct.Struct("<3i")
+_CK_DOMAIN_DELTAS = struct.Struct("<I8x3i")   # domain + the same three, one entry in one go
+_PS_COUNTS = struct.Struct("<2I")             # numPStates, numClocks (adjacent in the header)
+
+# Write-side counterparts for SetPstates20 — the fields a Set fills are
+# contiguous, so each group is one pack_into instead of one call per field:
+#   _SET_PS_HEADER — numPStates, numClocks, numBaseVoltages, pStates[0].pStateId
+#   _SET_CK_ENTRY  — clock entry domain, type, flags, delta value (signed)
+_SET_PS_HEADER = struct.Struct("<4I")
+_SET_CK_ENTRY = struct.Struct("<3Ii")
+
+
+# numpy dtype mirroring one pStates[] entry, built on first use (numpy is
+# only imported when something enumerates the whole table — the OC paths
+# above never need it).
+_pstate_dtype = None
+
+
+def _pstates_view(buf):
+    """Zero-copy structured numpy view of pStates[0.._MAX_PSTATES) in a PStates20 buffer.
+
+    Fields: id, editable, clocks[_MAX_CLOCKS] (domain, type, flags,
+    delta_val, delta_min, delta_max, freq, ...), volts (raw bytes). Whole
+    columns come out in one step — e.g. view["clocks"]["domain"] is a
+    (16, 8) matrix of domain IDs, so np.argwhere(... == domain_id) finds
+    every (pstate, clock) hit at once. Rows/clocks past numPStates /
+    numClocks are unused space; slice them off. Shares memory with buf.
+    """
+    global _pstate_dtype
+    import numpy as np
+
+    if _pstate_dtype is None:
+        clock = np.dtype([
+            ("domain", "<u4"), ("type", "<u4"), ("flags", "<u4"),
+            ("delta_val", "<i4"), ("delta_min", "<i4"), ("delta_max", "<i4"),
+            ("freq", "<u4"), ("rest", f"V{_CLOCK_ENTRY_SIZE - _CK_DATA_FREQ - 4}"),
+        ])
+        _pstate_dtype = np.dtype([
+            ("id", "<u4"), ("editable", "<u4"),
+            ("clocks", clock, (_MAX_CLOCKS,)),
+            ("volts", f"V{_MAX_VOLTAGES * _VOLTAGE_ENTRY_SIZE}"),
+        ])
+    return np.frombuffer(buf, dtype=_pstate_dtype, count=_MAX_PSTATES, offset=_PS_PSTATES_START)
+
+
 # Clock entry fields (offsets relative to the start of each clock entry).
 # Each clock entry is 44 bytes within a pstate.
 _CK_DOMAIN = 0       # uint32: clock domain ID (0=Graphics/Core, 4=Memory)
@@ -376,6 +548,45 @@ _MAX_GPUS = 64
 _gpu_handles = (ctypes.c_void_p * _MAX_GPUS)()  # Filled by _init()
 _gpu_count = ctypes.c_uint(0)                    # Set by _init()
 _initialized = False                              # Ensures _init() runs only once
+_init_lock = threading.Lock()                     # Serializes the one-time init
+
+
+# ── Known-missing entry points (persisted per driver build) ──
+
+def _dll_signature() -> str:
+    """Identify the loaded nvapi64.dll build as "size:mtime_ns".
+
+    Changes with every driver install. Costs one GetModuleFileNameW + stat,
+    far cheaper than asking the driver for its version. "" if unavailable
+    (which disables the known-missing cache).
+    """
+    try:
+        path = ctypes.create_unicode_buffer(260)
+        n = ctypes.windll.kernel32.GetModuleFileNameW(ctypes.c_void_p(_nvapi._handle), path, 260)
+        if not n:
+            return ""
+        st = os.stat(path.value)
+        return f"{st.st_size}:{st.st_mtime_ns}"
+    except (OSError, AttributeError):
+        return ""
+
+
+def _load_known_missing(driver_sig: str) -> frozenset[str]:
+    if GpuCacheEntry is None:
+        return frozenset()
+    try:
+        return load_missing_functions(driver_sig)
+    except Exception:
+        return frozenset()
+
+
+def _save_known_missing(driver_sig: str, missing: set[str]) -> None:
+    if GpuCacheEntry is None:
+        return
+    try:
+        save_missing_functions(driver_sig, missing)
+    except Exception:
+        pass  # Cache failures never block init
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -390,12 +601,28 @@ def _init():
       - All function pointers are resolved from QueryInterface
       - GPU handles are enumerated and stored in _gpu_handles
 
-    This is idempotent — safe to call multiple times.
+    This is idempotent — safe to call multiple times, from any thread.
+    Double-checked: once initialized, the unlocked flag read returns
+    immediately; only callers racing the first init take _init_lock, and
+    the loser re-checks under the lock so NvAPI_Initialize / EnumPhysicalGPUs
+    run exactly once.
     """
-    global _initialized
-
     if _initialized:
         return
+    with _init_lock:
+        if _initialized:
+            return
+        _init_locked()
+
+
+def _init_locked():
+    """Body of _init(); caller holds _init_lock."""
+    global _initialized
+    global _fn_EnumPhysicalGPUs, _fn_GetFullName, _fn_GetBusId, _fn_GetPstates20, _fn_SetPstates20
+    global _fn_ClientPowerPoliciesGetInfo, _fn_ClientPowerPoliciesGetStatus
+    global _fn_ClientPowerPoliciesSetStatus, _fn_ClientThermalPoliciesGetInfo
+    global _fn_ClientThermalPoliciesGetLimit, _fn_ClientThermalPoliciesSetLimit
+    global _fn_SetCoolerLevels, _fn_ClientFanCoolersGetControl, _fn_ClientFanCoolersSetControl
 
     # Step 1: Call NvAPI_Initialize() — mandatory before any other NVAPI call.
     # This sets up internal state inside the DLL.
@@ -405,38 +632,50 @@ def _init():
     _check("Initialize", fn_init())
 
     # Step 2: Resolve all function pointers we'll use.
-    # Each _resolve() call goes through QueryInterface and returns a callable.
+    # Each resolve() call goes through QueryInterface and returns a callable.
     # None is returned if the function isn't available (old driver, etc).
-    _fn["EnumPhysicalGPUs"] = _resolve("EnumPhysicalGPUs", _FN_2PTR)
-    _fn["GPU_GetFullName"] = _resolve("GPU_GetFullName", _FN_2PTR)
-    _fn["GPU_GetBusId"] = _resolve("GPU_GetBusId", _FN_2PTR)
+    # Names a previous run under this same driver build found missing are
+    # not queried again — the answer can't change until the driver does.
+    driver_sig = _dll_signature()
+    known_missing = _load_known_missing(driver_sig)
+    resolved: dict[str, object] = {}
 
-    _fn["GPU_GetPstates20"] = _resolve("GPU_GetPstates20", _FN_2PTR)
-    _fn["GPU_SetPstates20"] = _resolve("GPU_SetPstates20", _FN_2PTR)
+    def resolve(name: str, sig=_FN_2PTR):
+        fn = None if name in known_missing else _resolve(name, sig)
+        resolved[name] = fn
+        return fn
 
-    _fn["GPU_ClientPowerPoliciesGetInfo"] = _resolve("GPU_ClientPowerPoliciesGetInfo", _FN_2PTR)
-    _fn["GPU_ClientPowerPoliciesGetStatus"] = _resolve("GPU_ClientPowerPoliciesGetStatus", _FN_2PTR)
-    _fn["GPU_ClientPowerPoliciesSetStatus"] = _resolve("GPU_ClientPowerPoliciesSetStatus", _FN_2PTR)
+    _fn_EnumPhysicalGPUs = resolve("EnumPhysicalGPUs", _FN_ENUM)
+    _fn_GetFullName = resolve("GPU_GetFullName", _FN_2PTR)
+    _fn_GetBusId = resolve("GPU_GetBusId", _FN_OUT_UINT)
 
-    _fn["GPU_ClientThermalPoliciesGetInfo"] = _resolve("GPU_ClientThermalPoliciesGetInfo", _FN_2PTR)
-    _fn["GPU_ClientThermalPoliciesGetLimit"] = _resolve("GPU_ClientThermalPoliciesGetLimit", _FN_2PTR)
-    _fn["GPU_ClientThermalPoliciesSetLimit"] = _resolve("GPU_ClientThermalPoliciesSetLimit", _FN_2PTR)
+    _fn_GetPstates20 = resolve("GPU_GetPstates20", _FN_2PTR)
+    _fn_SetPstates20 = resolve("GPU_SetPstates20", _FN_2PTR)
+
+    _fn_ClientPowerPoliciesGetInfo = resolve("GPU_ClientPowerPoliciesGetInfo", _FN_2PTR)
+    _fn_ClientPowerPoliciesGetStatus = resolve("GPU_ClientPowerPoliciesGetStatus", _FN_2PTR)
+    _fn_ClientPowerPoliciesSetStatus = resolve("GPU_ClientPowerPoliciesSetStatus", _FN_2PTR)
+
+    _fn_ClientThermalPoliciesGetInfo = resolve("GPU_ClientThermalPoliciesGetInfo", _FN_2PTR)
+    _fn_ClientThermalPoliciesGetLimit = resolve("GPU_ClientThermalPoliciesGetLimit", _FN_2PTR)
+    _fn_ClientThermalPoliciesSetLimit = resolve("GPU_ClientThermalPoliciesSetLimit", _FN_2PTR)
 
     # Old fan API uses 3-arg signature (handle, coolerIndex, struct)
-    _fn["GPU_SetCoolerLevels"] = _resolve("GPU_SetCoolerLevels", _FN_3ARG)
+    _fn_SetCoolerLevels = resolve("GPU_SetCoolerLevels", _FN_3ARG)
 
-    _fn["GPU_ClientFanCoolersGetControl"] = _resolve("GPU_ClientFanCoolersGetControl", _FN_2PTR)
-    _fn["GPU_ClientFanCoolersSetControl"] = _resolve("GPU_ClientFanCoolersSetControl", _FN_2PTR)
+    _fn_ClientFanCoolersGetControl = resolve("GPU_ClientFanCoolersGetControl", _FN_2PTR)
+    _fn_ClientFanCoolersSetControl = resolve("GPU_ClientFanCoolersSetControl", _FN_2PTR)
+
+    missing = {name for name, fn in resolved.items() if fn is None}
+    if missing != known_missing:
+        _save_known_missing(driver_sig, missing)
 
     # Step 3: Enumerate all physical GPUs in the system.
     # This fills _gpu_handles[] and sets _gpu_count.
-    if _fn["EnumPhysicalGPUs"]:
+    if _fn_EnumPhysicalGPUs:
         _check(
             "EnumPhysicalGPUs",
-            _fn["EnumPhysicalGPUs"](
-                ctypes.cast(ctypes.pointer(_gpu_handles), ctypes.c_void_p),
-                ctypes.byref(_gpu_count),
-            ),
+            _fn_EnumPhysicalGPUs(_gpu_handles, _gpu_count),
         )
 
     _initialized = True
@@ -448,7 +687,8 @@ def _handle(gpu: int = 0) -> ctypes.c_void_p:
     All NVAPI functions require an opaque GPU handle. This is the main
     entry point that triggers lazy initialization.
     """
-    _init()
+    if not _initialized:
+        _init()
     if gpu >= _gpu_count.value:
         raise NvApiError("GPU_GetHandle", -5)  # -5 = INVALID_ARGUMENT
     return _gpu_handles[gpu]
@@ -458,31 +698,53 @@ def _handle(gpu: int = 0) -> ctypes.c_void_p:
 # GPU info helpers
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
+# Identity never changes while the process runs, so each GPU's name and
+# bus ID are read from the driver once and served from here afterwards —
+# the out-buffers below are only allocated on that first read, never per
+# poll. A missing entry point is remembered the same way; a failed call
+# is not (it's retried next time).
+_gpu_names: dict[int, str] = {}
+_bus_ids: dict[int, int] = {}
+
+
 def _get_gpu_name(gpu: int = 0) -> str:
     """Get GPU full name string."""
+    name = _gpu_names.get(gpu)
+    if name is not None:
+        return name
     h = _handle(gpu)
+    fn = _fn_GetFullName
+    if fn is None:
+        # Not exposed by this driver — permanent, so remember the fallback too
+        name = _gpu_names[gpu] = "Unknown GPU"
+        return name
     name_buf = (ctypes.c_char * 64)()
-    fn = _fn.get("GPU_GetFullName")
-    if fn:
-        try:
-            _check("GPU_GetFullName", fn(h, ctypes.cast(name_buf, ctypes.c_void_p)))
-            return name_buf.value.decode("utf-8", errors="replace")
-        except NvApiError:
-            pass
+    try:
+        _check("GPU_GetFullName", fn(h, name_buf))
+        name = _gpu_names[gpu] = name_buf.value.decode("utf-8", errors="replace")
+        return name
+    except NvApiError:
+        pass
     return "Unknown GPU"
 
 
 def _get_bus_id(gpu: int = 0) -> int:
     """Get GPU PCI bus ID."""
+    bus = _bus_ids.get(gpu)
+    if bus is not None:
+        return bus
     h = _handle(gpu)
+    fn = _fn_GetBusId
+    if fn is None:
+        _bus_ids[gpu] = 0  # Not exposed by this driver — permanent
+        return 0
     bus_id = ctypes.c_uint(0)
-    fn = _fn.get("GPU_GetBusId")
-    if fn:
-        try:
-            _check("GPU_GetBusId", fn(h, ctypes.byref(bus_id)))
-            return bus_id.value
-        except NvApiError:
-            pass
+    try:
+        _check("GPU_GetBusId", fn(h, bus_id))
+        _bus_ids[gpu] = bus_id.value
+        return bus_id.value
+    except NvApiError:
+        pass
     return 0
 
 
@@ -498,11 +760,11 @@ def _get_pstates20(gpu: int = 0):
     core and memory clock offsets from.
     """
     h = _handle(gpu)
-    b = _buf(_PSTATES20_V1_SIZE, 1)  # V1 for reading
-    fn = _fn.get("GPU_GetPstates20")
+    fn = _fn_GetPstates20
     if fn is None:
         raise NvApiError("GPU_GetPstates20", -3)
-    _check("GPU_GetPstates20", fn(h, ctypes.cast(b, ctypes.c_void_p)))
+    b = _buf(_PSTATES20_V1_SIZE, 1)  # V1 for reading
+    _check("GPU_GetPstates20", fn(h, b))
     return b
 
 
@@ -513,30 +775,47 @@ def _find_clock_in_pstates(buf, domain_id: int, pstate_idx: int = 0) -> int | No
     domain_id: 0=Graphics/Core, 4=Memory
     Returns clock index (0-7) or None.
     """
-    num_clocks = _u32(buf, _PS_NUM_CLOCKS)
-    for ci in range(min(num_clocks, _MAX_CLOCKS)):
-        base = _clock_off(pstate_idx, ci)
-        if _u32(buf, base + _CK_DOMAIN) == domain_id:
-            return ci
-    return None
+    num_clocks = min(_u32(buf, _PS_NUM_CLOCKS), _MAX_CLOCKS)
+    domains = _PSTATE_DOMAINS.unpack_from(buf, _CLOCK_OFFSETS[pstate_idx][0] + _CK_DOMAIN)
+    try:
+        return domains.index(domain_id, 0, num_clocks)
+    except ValueError:
+        return None
+
+
+# (gpu, domain_id) → (pstate, clock) index of the entry _read_clock_delta
+# found last time. The PStates20 layout doesn't change within a driver
+# session, so repeat reads go straight to the entry instead of re-scanning
+# up to 16 pstates × 8 clocks. Each hit is re-validated against the buffer
+# (counts + domain field), so a layout change just falls back to a scan.
+_clock_layout: dict[tuple[int, int], tuple[int, int]] = {}
 
 
-def _read_clock_delta(buf, domain_id: int) -> tuple[int, int, int]:
+def _read_clock_delta(buf, domain_id: int, gpu: int | None = None) -> tuple[int, int, int]:
     """
     Read clock delta for domain from PStates20 buffer.
 
     Returns (current_khz, min_khz, max_khz).
-    Searches all pstates for the first match.
+    Searches all pstates for the first match. Pass gpu to reuse (and
+    record) the entry location for that GPU in _clock_layout.
     """
-    num_pstates = _u32(buf, _PS_NUM_PSTATES)
-    for pi in range(min(num_pstates, _MAX_PSTATES)):
+    num_pstates, num_clocks = _PS_COUNTS.unpack_from(buf, _PS_NUM_PSTATES)
+    num_pstates = min(num_pstates, _MAX_PSTATES)
+    loc = _clock_layout.get((gpu, domain_id)) if gpu is not None else None
+    if loc is not None:
+        # Polling fast path: counts + one whole-entry unpack, no scan
+        pi, ci = loc
+        if pi < num_pstates and ci < num_clocks:
+            dom, val, lo, hi = _CK_DOMAIN_DELTAS.unpack_from(buf, _CLOCK_OFFSETS[pi][ci])
+            if dom == domain_id:
+                return (val, lo, hi)
+    for pi in range(num_pstates):
         ci = _find_clock_in_pstates(buf, domain_id, pi)
         if ci is not None:
-            base = _clock_off(pi, ci)
-            val = _i32(buf, base + _CK_DELTA_VAL)
-            lo = _i32(buf, base + _CK_DELTA_MIN)
-            hi = _i32(buf, base + _CK_DELTA_MAX)
-            return (val, lo, hi)
+            if gpu is not None:
+                _clock_layout[(gpu, domain_id)] = (pi, ci)
+            # (val, lo, hi) — _CK_DELTA_VAL/_MIN/_MAX are adjacent
+            return _CK_DELTAS.unpack_from(buf, _CLOCK_OFFSETS[pi][ci] + _CK_DELTA_VAL)
     return (0, 0, 0)
 
 
@@ -544,6 +823,12 @@ def _read_clock_delta(buf, domain_id: int) -> tuple[int, int, int]:
 # PStates20 — Write clock offsets
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
+# Set once SetPstates20 rejects our V2 struct with INCOMPATIBLE_STRUCT_VERSION.
+# The layout is fixed for the process, so later clock writes fail fast with
+# the same error instead of rebuilding the buffer and calling the driver.
+_set_pstates20_v2_rejected = False
+
+
 def _set_clock_offset(domain_id: int, offset_khz: int, gpu: int = 0):
     """
     Set clock offset via SetPstates20 V2.
@@ -560,26 +845,42 @@ def _set_clock_offset(domain_id: int, offset_khz: int, gpu: int = 0):
       pStatesInfo.pStates[0].clocks[0].typeId = 0;
       pStatesInfo.pStates[0].clocks[0].frequencyDeltaKHz.value = offset;
     """
-    h = _handle(gpu)
-    b = _buf(_PSTATES20_V2_SIZE, 2)
+    _set_clock_offsets([(domain_id, offset_khz)], gpu)
 
-    # Header
-    _w32(b, _PS_NUM_PSTATES, 1)
-    _w32(b, _PS_NUM_CLOCKS, 1)
 
-    # pStates[0].pStateId = 0 (P0)
-    _w32(b, _pstate_off(0), 0)
-
-    # pStates[0].clocks[0]
-    ck = _clock_off(0, 0)
-    _w32(b, ck + _CK_DOMAIN, domain_id)
-    _w32(b, ck + _CK_TYPE, 0)        # single frequency type
-    _wi32(b, ck + _CK_DELTA_VAL, offset_khz)
+def _set_clock_offsets(deltas: list[tuple[int, int]], gpu: int = 0):
+    """
+    Set several clock offsets in one SetPstates20 V2 call.
 
-    fn = _fn.get("GPU_SetPstates20")
+    deltas: [(domain_id, offset_khz), ...] — one P0 clock entry each, so
+    core + memory go to the driver as a single write (numClocks=2) instead
+    of two separate Set calls.
+    """
+    global _set_pstates20_v2_rejected
+    if _set_pstates20_v2_rejected:
+        # This driver already refused the V2 layout — it won't accept it now
+        raise NvApiError("GPU_SetPstates20", -9)
+    h = _handle(gpu)
+    fn = _fn_SetPstates20
     if fn is None:
         raise NvApiError("GPU_SetPstates20", -3)
-    _check_set("GPU_SetPstates20", fn, h, ctypes.cast(b, ctypes.c_void_p))
+    b = _buf(_PSTATES20_V2_SIZE, 2)
+
+    # Header + pStates[0].pStateId in one pack: numPStates = 1,
+    # numClocks = len(deltas), numBaseVoltages = 0, pStateId = 0 (P0)
+    _SET_PS_HEADER.pack_into(b, _PS_NUM_PSTATES, 1, len(deltas), 0, 0)
+
+    # pStates[0].clocks[i] — domain, type 0 (single frequency), flags, delta
+    offsets = _CLOCK_OFFSETS[0]
+    for i, (domain_id, offset_khz) in enumerate(deltas):
+        _SET_CK_ENTRY.pack_into(b, offsets[i] + _CK_DOMAIN, domain_id, 0, 0, offset_khz)
+
+    try:
+        _check_set("GPU_SetPstates20", fn, h, b)
+    except NvApiError as e:
+        if e.status == -9:  # INCOMPATIBLE_STRUCT_VERSION
+            _set_pstates20_v2_rejected = True
+        raise
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -598,6 +899,28 @@ def _set_clock_offset(domain_id: int, offset_khz: int, gpu: int = 0):
 _PWR_STATUS_COUNT = 4      # offset of the 'count' field
 _PWR_STATUS_POWER = 12     # offset of entry[0].power (the value we care about)
 
+
+# Power Status has kept this fixed layout across every driver we've seen,
+# so (unlike PStates20) it's declared as a ctypes.Structure and its fields
+# are read/written as attributes instead of through struct pack/unpack.
+class _PowerStatusEntry(ctypes.Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("unknown1", ctypes.c_uint32),   # must be 0 for Set calls
+        ("power", ctypes.c_uint32),      # PCM
+        ("unknown2", ctypes.c_uint32),
+        ("unknown3", ctypes.c_uint32),
+    ]
+
+
+class _PowerStatus(ctypes.Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("version", ctypes.c_uint32),
+        ("count", ctypes.c_uint32),
+        ("entries", _PowerStatusEntry * 4),
+    ]
+
 # Power Info layout (184 bytes) — read-only, provides allowed power range:
 #   +0:  version (uint32)
 #   +4:  count   (uint32, usually 1)
@@ -611,20 +934,37 @@ _PWR_INFO_ENTRY_SIZE = 44
 _PWR_INFO_MIN = 20        # entry[0].minPower — e.g., 50000 PCM (50%)
 _PWR_INFO_DEF = 28        # entry[0].defPower — e.g., 100000 PCM (100%)
 _PWR_INFO_MAX = 36        # entry[0].maxPower — e.g., 116000 PCM (116%)
+# min/def/max in one unpack — they sit 8 bytes apart from _PWR_INFO_MIN
+_PWR_INFO_RANGE = struct.Struct("<I4xI4xI")
 
 
 def _get_power_status(gpu: int = 0) -> int:
     """Read current power target in PCM (100000 = 100%). Returns PCM value."""
     h = _handle(gpu)
-    b = _buf(_POWER_STATUS_SIZE, 1)
-    fn = _fn.get("GPU_ClientPowerPoliciesGetStatus")
+    fn = _fn_ClientPowerPoliciesGetStatus
     if fn is None:
         raise NvApiError("GPU_ClientPowerPoliciesGetStatus", -3)
-    _check("GPU_ClientPowerPoliciesGetStatus", fn(h, ctypes.cast(b, ctypes.c_void_p)))
-    return _u32(b, _PWR_STATUS_POWER)
+    st = _struct_buf(_PowerStatus, 1)
+    _check("GPU_ClientPowerPoliciesGetStatus", fn(h, ctypes.byref(st)))
+    return st.entries[0].power
+
+
+# Info structs hold BIOS limits — static for the life of the process — so
+# each GPU's (min, default, max) is read once. reset_all() and uncached
+# get_oc_status() calls then only issue the Get/Set they actually need.
+_power_info: dict[int, tuple[int, int, int]] = {}
+_thermal_info: dict[int, tuple[int, int, int]] = {}
 
 
 def _get_power_info(gpu: int = 0) -> tuple[int, int, int]:
+    """(min_pcm, default_pcm, max_pcm), read from the driver once per GPU."""
+    info = _power_info.get(gpu)
+    if info is None:
+        info = _power_info[gpu] = _read_power_info(gpu)
+    return info
+
+
+def _read_power_info(gpu: int = 0) -> tuple[int, int, int]:
     """
     Read power limits from GetInfo struct.
 
@@ -632,16 +972,14 @@ def _get_power_info(gpu: int = 0) -> tuple[int, int, int]:
     Falls back to scanning buffer for recognizable PCM values if primary offsets fail.
     """
     h = _handle(gpu)
-    b = _buf(_POWER_INFO_SIZE, 1)
-    fn = _fn.get("GPU_ClientPowerPoliciesGetInfo")
+    fn = _fn_ClientPowerPoliciesGetInfo
     if fn is None:
         raise NvApiError("GPU_ClientPowerPoliciesGetInfo", -3)
-    _check("GPU_ClientPowerPoliciesGetInfo", fn(h, ctypes.cast(b, ctypes.c_void_p)))
+    b = _buf(_POWER_INFO_SIZE, 1)
+    _check("GPU_ClientPowerPoliciesGetInfo", fn(h, b))
 
     # Try primary offsets
-    min_p = _u32(b, _PWR_INFO_MIN)
-    def_p = _u32(b, _PWR_INFO_DEF)
-    max_p = _u32(b, _PWR_INFO_MAX)
+    min_p, def_p, max_p = _PWR_INFO_RANGE.unpack_from(b, _PWR_INFO_MIN)
 
     # Validate: default power should be in sane range (30%-200%).
     # Some driver versions or GPU models put the values at different offsets.
@@ -651,20 +989,24 @@ def _get_power_info(gpu: int = 0) -> tuple[int, int, int]:
     # GRACEFUL DEGRADATION: If primary offsets miss, scan the entire buffer
     # for uint32 values that look like PCM power values. This handles
     # struct layout shifts across different driver versions.
-    pcm_candidates = []
-    for off in range(4, len(b) - 3, 4):
-        val = _u32(b, off)
-        if 30000 <= val <= 200000:
-            pcm_candidates.append((off, val))
+    # The scan is one vectorized pass over a zero-copy uint32 view of the
+    # buffer (skipping the version tag) rather than a Python loop of _u32
+    # reads. numpy is imported here, not at module level, since only this
+    # fallback needs it and 'oc' shouldn't pay its import cost otherwise.
+    import numpy as np
+
+    words = np.frombuffer(b, dtype="<u4")[1:]
+    pcm_candidates = words[(words >= 30000) & (words <= 200000)]
 
     # Look for 100000 (100.0% = factory default). Min is typically before it,
     # max after it in the buffer. This heuristic works across all known layouts.
-    for i, (off, val) in enumerate(pcm_candidates):
-        if val == 100000:  # default power = 100.000%
-            # min is likely before, max after
-            min_p = pcm_candidates[i - 1][1] if i > 0 else 50000
-            max_p = pcm_candidates[i + 1][1] if i < len(pcm_candidates) - 1 else 116000
-            return (min_p, 100000, max_p)
+    defaults = np.flatnonzero(pcm_candidates == 100000)  # default power = 100.000%
+    if defaults.size:
+        i = int(defaults[0])
+        # min is likely before, max after
+        min_p = int(pcm_candidates[i - 1]) if i > 0 else 50000
+        max_p = int(pcm_candidates[i + 1]) if i < pcm_candidates.size - 1 else 116000
+        return (min_p, 100000, max_p)
 
     # Last resort: hardcoded safe defaults (50% min, 100% default, 116% max).
     # These are conservative and work for most GeForce cards.
@@ -682,14 +1024,14 @@ def _set_power_status(power_pcm: int, gpu: int = 0):
       powerStatus.entries[0].power = power * 1000;
     """
     h = _handle(gpu)
-    b = _buf(_POWER_STATUS_SIZE, 1)
-    _w32(b, _PWR_STATUS_COUNT, 1)    # count = 1
-    _w32(b, _PWR_STATUS_POWER, power_pcm)
-
-    fn = _fn.get("GPU_ClientPowerPoliciesSetStatus")
+    fn = _fn_ClientPowerPoliciesSetStatus
     if fn is None:
         raise NvApiError("GPU_ClientPowerPoliciesSetStatus", -3)
-    _check_set("GPU_ClientPowerPoliciesSetStatus", fn, h, ctypes.cast(b, ctypes.c_void_p))
+    st = _struct_buf(_PowerStatus, 1)
+    st.count = 1
+    st.entries[0].power = power_pcm
+
+    _check_set("GPU_ClientPowerPoliciesSetStatus", fn, h, ctypes.byref(st))
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -713,6 +1055,26 @@ _THERMAL_LIMIT_CONTROLLER = 8
 _THERMAL_LIMIT_VALUE = 12
 _THERMAL_LIMIT_FLAGS = 16
 
+
+# Same treatment as _PowerStatus: the V2 limit struct is stable.
+class _ThermalLimitEntry(ctypes.Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("controller", ctypes.c_uint32),  # 1 = GPU thermal controller
+        ("value", ctypes.c_uint32),       # tempC << 8
+        ("flags", ctypes.c_uint32),       # 1 = priority
+        ("unknown", ctypes.c_uint32),
+    ]
+
+
+class _ThermalLimit(ctypes.Structure):
+    _pack_ = 1
+    _fields_ = [
+        ("version", ctypes.c_uint32),
+        ("count", ctypes.c_uint32),
+        ("entries", _ThermalLimitEntry * 2),
+    ]
+
 # Thermal Info layout (88 bytes, V1):
 #   +0: version    (uint32)
 #   +4: count      (uint32)
@@ -722,37 +1084,44 @@ _THERMAL_INFO_ENTRY_START = 8
 _THERMAL_INFO_MIN = 16     # entry[0] offset+8
 _THERMAL_INFO_DEF = 20     # entry[0] offset+12
 _THERMAL_INFO_MAX = 24     # entry[0] offset+16
+_THERMAL_INFO_RANGE = struct.Struct("<3I")  # min/def/max, contiguous from MIN
 
 
 def _get_thermal_limit(gpu: int = 0) -> int:
     """Read current thermal limit in °C."""
     h = _handle(gpu)
-    b = _buf(_THERMAL_LIMIT_SIZE, 2)  # Version 2!
-    fn = _fn.get("GPU_ClientThermalPoliciesGetLimit")
+    fn = _fn_ClientThermalPoliciesGetLimit
     if fn is None:
         raise NvApiError("GPU_ClientThermalPoliciesGetLimit", -3)
-    _check("GPU_ClientThermalPoliciesGetLimit", fn(h, ctypes.cast(b, ctypes.c_void_p)))
-    raw = _u32(b, _THERMAL_LIMIT_VALUE)
+    st = _struct_buf(_ThermalLimit, 2)  # Version 2!
+    _check("GPU_ClientThermalPoliciesGetLimit", fn(h, ctypes.byref(st)))
+    raw = st.entries[0].value
     # Undo the <<8 shift: e.g., raw=21248 → 21248>>8 = 83°C
     return raw >> 8
 
 
 def _get_thermal_info(gpu: int = 0) -> tuple[int, int, int]:
+    """(min_c, default_c, max_c), read from the driver once per GPU."""
+    info = _thermal_info.get(gpu)
+    if info is None:
+        info = _thermal_info[gpu] = _read_thermal_info(gpu)
+    return info
+
+
+def _read_thermal_info(gpu: int = 0) -> tuple[int, int, int]:
     """
     Read thermal range from GetInfo.
 
     Returns (min_c, default_c, max_c) in degrees Celsius.
     """
     h = _handle(gpu)
-    b = _buf(_THERMAL_INFO_SIZE, 1)
-    fn = _fn.get("GPU_ClientThermalPoliciesGetInfo")
+    fn = _fn_ClientThermalPoliciesGetInfo
     if fn is None:
         raise NvApiError("GPU_ClientThermalPoliciesGetInfo", -3)
-    _check("GPU_ClientThermalPoliciesGetInfo", fn(h, ctypes.cast(b, ctypes.c_void_p)))
+    b = _buf(_THERMAL_INFO_SIZE, 1)
+    _check("GPU_ClientThermalPoliciesGetInfo", fn(h, b))
 
-    min_t = _u32(b, _THERMAL_INFO_MIN)
-    def_t = _u32(b, _THERMAL_INFO_DEF)
-    max_t = _u32(b, _THERMAL_INFO_MAX)
+    min_t, def_t, max_t = _THERMAL_INFO_RANGE.unpack_from(b, _THERMAL_INFO_MIN)
 
     # The Info struct's temperature values may or may not be <<8 shifted,
     # depending on driver version. The Limit struct (V2) is always shifted,
@@ -765,18 +1134,19 @@ def _get_thermal_info(gpu: int = 0) -> tuple[int, int, int]:
 
     # Sanity check: default thermal limit should be 30-120°C for any GPU
     if not (30 <= def_t <= 120):
-        # Fallback: scan buffer for temp-like values
-        found_temps = []
-        for off in range(8, len(b) - 3, 4):
-            raw = _u32(b, off)
-            candidate = raw
-            if 30 <= (raw >> 8) <= 120:
-                candidate = raw >> 8
-            if 60 <= candidate <= 100:
-                found_temps.append(candidate)
-        if found_temps:
-            min_t = min(found_temps)
-            max_t = max(found_temps)
+        # Fallback: scan buffer for temp-like values — one vectorized pass
+        # over a zero-copy uint32 view from +8 (numpy imported lazily, as in
+        # _get_power_info). Each word counts as its >>8 value when that is a
+        # plausible temperature, otherwise as-is.
+        import numpy as np
+
+        raw = np.frombuffer(b, dtype="<u4")[2:]
+        shifted = raw >> 8
+        candidate = np.where((shifted >= 30) & (shifted <= 120), shifted, raw)
+        found_temps = candidate[(candidate >= 60) & (candidate <= 100)]
+        if found_temps.size:
+            min_t = int(found_temps.min())
+            max_t = int(found_temps.max())
             def_t = (min_t + max_t) // 2
         else:
             # Hardcoded safe defaults — 65°C min, 83°C default, 90°C max.
@@ -801,16 +1171,17 @@ def _set_thermal_limit(temp_c: int, gpu: int = 0, priority: bool = False):
       thermalLimit.entries[0].flags = priority ? 1 : 0;
     """
     h = _handle(gpu)
-    b = _buf(_THERMAL_LIMIT_SIZE, 2)  # Version 2!
-    _w32(b, _THERMAL_LIMIT_COUNT, 1)
-    _w32(b, _THERMAL_LIMIT_CONTROLLER, 1)
-    _w32(b, _THERMAL_LIMIT_VALUE, temp_c << 8)
-    _w32(b, _THERMAL_LIMIT_FLAGS, 1 if priority else 0)
-
-    fn = _fn.get("GPU_ClientThermalPoliciesSetLimit")
+    fn = _fn_ClientThermalPoliciesSetLimit
     if fn is None:
         raise NvApiError("GPU_ClientThermalPoliciesSetLimit", -3)
-    _check_set("GPU_ClientThermalPoliciesSetLimit", fn, h, ctypes.cast(b, ctypes.c_void_p))
+    st = _struct_buf(_ThermalLimit, 2)  # Version 2!
+    st.count = 1
+    entry = st.entries[0]
+    entry.controller = 1
+    entry.value = (temp_c << 8) & 0xFFFFFFFF
+    entry.flags = 1 if priority else 0
+
+    _check_set("GPU_ClientThermalPoliciesSetLimit", fn, h, ctypes.byref(st))
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -833,6 +1204,7 @@ def _set_thermal_limit(temp_c: int, gpu: int = 0, priority: bool = False):
 # This API works on all NVIDIA GPUs — used as fallback when new API fails.
 _FAN_POLICY_MANUAL = 1     # User controls fan speed directly
 _FAN_POLICY_AUTO = 32      # GPU controls fan speed via its internal curve
+_COOLER_LEVEL = struct.Struct("<2I")  # one coolers[] entry: level, policy
 
 
 def _set_cooler_level(speed_pct: int, cooler_index: int = 0, gpu: int = 0):
@@ -848,27 +1220,27 @@ def _set_cooler_level(speed_pct: int, cooler_index: int = 0, gpu: int = 0):
       NvAPI_GPU_SetCoolerLevels(handle, fanIndex, &coolerLevel);
     """
     h = _handle(gpu)
-    b = _buf(_COOLER_LEVELS_SIZE, 1)
-    _w32(b, 4, max(0, min(100, speed_pct)))  # cooler[0].level
-    _w32(b, 8, _FAN_POLICY_MANUAL)            # cooler[0].policy = manual
-
-    fn = _fn.get("GPU_SetCoolerLevels")
+    fn = _fn_SetCoolerLevels
     if fn is None:
         raise NvApiError("GPU_SetCoolerLevels", -3)
-    _check_set("GPU_SetCoolerLevels", fn, h, cooler_index, ctypes.cast(b, ctypes.c_void_p))
+    b = _buf(_COOLER_LEVELS_SIZE, 1)
+    # cooler[0].level, cooler[0].policy = manual
+    _COOLER_LEVEL.pack_into(b, 4, max(0, min(100, speed_pct)), _FAN_POLICY_MANUAL)
+
+    _check_set("GPU_SetCoolerLevels", fn, h, cooler_index, b)
 
 
 def _set_cooler_auto(cooler_index: int = 0, gpu: int = 0):
     """Reset fan to auto/default using old SetCoolerLevels API."""
     h = _handle(gpu)
-    b = _buf(_COOLER_LEVELS_SIZE, 1)
-    _w32(b, 4, 30)                    # cooler[0].level (ignored in auto mode)
-    _w32(b, 8, _FAN_POLICY_AUTO)      # cooler[0].policy = auto (32)
-
-    fn = _fn.get("GPU_SetCoolerLevels")
+    fn = _fn_SetCoolerLevels
     if fn is None:
         raise NvApiError("GPU_SetCoolerLevels", -3)
-    _check_set("GPU_SetCoolerLevels", fn, h, cooler_index, ctypes.cast(b, ctypes.c_void_p))
+    b = _buf(_COOLER_LEVELS_SIZE, 1)
+    # cooler[0].level (ignored in auto mode), cooler[0].policy = auto (32)
+    _COOLER_LEVEL.pack_into(b, 4, 30, _FAN_POLICY_AUTO)
+
+    _check_set("GPU_SetCoolerLevels", fn, h, cooler_index, b)
 
 
 def _set_fan_new_api(speed_pct: int, manual: bool = True, gpu: int = 0):
@@ -888,8 +1260,8 @@ def _set_fan_new_api(speed_pct: int, manual: bool = True, gpu: int = 0):
     See ignore/useful_patterns_and_future_improvements_for_gpu_oc.md.
     """
     h = _handle(gpu)
-    fn_get = _fn.get("GPU_ClientFanCoolersGetControl")
-    fn_set = _fn.get("GPU_ClientFanCoolersSetControl")
+    fn_get = _fn_ClientFanCoolersGetControl
+    fn_set = _fn_ClientFanCoolersSetControl
 
     if fn_get is None or fn_set is None:
         # Fallback to old API
@@ -899,12 +1271,63 @@ def _set_fan_new_api(speed_pct: int, manual: bool = True, gpu: int = 0):
     # Get current control state
     b = _buf(_FAN_CONTROL_SIZE, 1)
     try:
-        _check("GPU_ClientFanCoolersGetControl", fn_get(h, ctypes.cast(b, ctypes.c_void_p)))
+        _check("GPU_ClientFanCoolersGetControl", fn_get(h, b))
     except NvApiError:
         # Fallback to old API
         _set_cooler_level(speed_pct, 0, gpu)
         return
 
+    layout = _fan_layout.get(gpu)
+    if layout is None:
+        layout = _get_cached_fan_layout(gpu)
+    if layout is not None:
+        count, entry_size = layout
+    else:
+        count, entry_size = _probe_fan_layout(b)
+        if count == 0:
+            # Can't determine layout, use old API
+            _set_cooler_level(speed_pct, 0, gpu)
+            return
+        _fan_layout[gpu] = (count, entry_size)
+
+    mode_val = 1 if manual else 0
+    level = max(0, min(100, speed_pct))
+    if entry_size % 4 == 0:
+        # Word-aligned entries: view the entries as a (count, words) uint32
+        # matrix over the ctypes buffer and write both columns in one go —
+        # level is word 2 (+8) of each entry, mode word 3 (+12). count <= 32
+        # means entry_size >= 45, so every entry lies inside the buffer.
+        import numpy as np
+
+        words = entry_size // 4
+        entries = np.frombuffer(b, dtype="<u4", count=count * words, offset=12)
+        entries = entries.reshape(count, words)
+        entries[:, 2] = level
+        entries[:, 3] = mode_val
+    else:
+        for i in range(count):
+            base = 12 + i * entry_size
+            # level is at +8 within each entry, mode at +12
+            level_off = base + 8
+            mode_off = base + 12
+            if level_off + 8 <= len(b):
+                _w32(b, level_off, level)
+                _w32(b, mode_off, mode_val)
+
+    try:
+        _check_set("GPU_ClientFanCoolersSetControl", fn_set, h, b)
+    except NvApiError:
+        _fan_layout.pop(gpu, None)  # re-probe next time instead of trusting it
+        raise
+
+
+def _probe_fan_layout(b) -> tuple[int, int]:
+    """(fan count, entry size) from a filled FanCoolersGetControl buffer.
+
+    Returns (0, 0) if the layout can't be determined. The result is static
+    for a GPU + driver, so callers keep it in _fan_layout (and the device
+    cache) rather than re-deriving it on every fan write.
+    """
     # The fan count is usually at offset 8, but some driver versions put it
     # at offset 4. Try both.
     count = _u32(b, 8)
@@ -912,9 +1335,7 @@ def _set_fan_new_api(speed_pct: int, manual: bool = True, gpu: int = 0):
         count = _u32(b, 4)  # Alternative location
 
     if count == 0 or count > 16:
-        # Can't determine layout, use old API
-        _set_cooler_level(speed_pct, 0, gpu)
-        return
+        return 0, 0
 
     # Fan control entry layout (from FanCoolersGetControl V1):
     # The struct has a 12-byte header, then 'count' entries of variable size.
@@ -929,33 +1350,20 @@ def _set_fan_new_api(speed_pct: int, manual: bool = True, gpu: int = 0):
     # If the math doesn't make sense, bail to old API.
     ENTRY_SIZE_GUESS = 68  # Expected: (1452 - 12) / 21 entries ≈ 68
     if count <= 0 or count > 32:
-        _set_cooler_level(speed_pct, 0, gpu)
-        return
+        return 0, 0
 
     entry_size = (_FAN_CONTROL_SIZE - 12) // count if count > 0 else 0
     if entry_size < 12 or entry_size > 256:
         # Can't determine layout, use old API
-        _set_cooler_level(speed_pct, 0, gpu)
-        return
-
-    mode_val = 1 if manual else 0
-    for i in range(count):
-        base = 12 + i * entry_size
-        # level is at +8 within each entry, mode at +12
-        level_off = base + 8
-        mode_off = base + 12
-        if level_off + 8 <= len(b):
-            _w32(b, level_off, max(0, min(100, speed_pct)))
-            _w32(b, mode_off, mode_val)
-
-    _check_set("GPU_ClientFanCoolersSetControl", fn_set, h, ctypes.cast(b, ctypes.c_void_p))
+        return 0, 0
+    return count, entry_size
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # OC Status dataclass
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-@dataclass
+@dataclass(slots=True)
 class OcStatus:
     """Current overclocking status — snapshot of all controllable parameters.
 
@@ -979,6 +1387,20 @@ class OcStatus:
     fan_pct: int | None = None  # None = auto/unknown, 0-100 = manual speed
 
 
+@dataclass(slots=True)
+class OcReadings:
+    """Live settable values in raw NVAPI units — one polling tick's worth.
+
+    Unlike OcStatus this carries no names or ranges, only what changes:
+    the three Get calls a telemetry loop needs each frame. A field is None
+    if its read failed.
+    """
+    core_offset_khz: int | None = None
+    mem_offset_khz: int | None = None
+    power_pcm: int | None = None      # 100000 = 100%
+    thermal_limit_c: int | None = None
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Device cache integration
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -988,58 +1410,118 @@ class OcStatus:
 # All cache operations are wrapped in try/except — cache failures NEVER
 # block normal operation. The cache is purely a performance optimization.
 
-# In-session cache: lazily loaded on first use, persists for the session.
-_device_cache: dict | None = None
+# The persisted cache is loaded once per process inside device_cache itself
+# (get_entry/put_entry with cache=None) and probe results are written back
+# deferred (put_entry defer=True); only the fan API pick lives here.
 _session_fan_api: dict[int, str] = {}  # gpu_idx → "new" or "old" (in-session only)
+_fan_layout: dict[int, tuple[int, int]] = {}  # gpu_idx → (fan count, entry size)
+# gpu_idx → the probe outcome last handed to (or found equal in) the cache.
+# A polling get_oc_status() compares against this and returns before any
+# GpuCacheEntry / timestamp is built.
+_last_saved_probe: dict[int, tuple] = {}
+_driver_version: str | None = None  # NVML driver version; None = not read yet
 
 
 def _get_driver_version() -> str:
     """Get driver version string from NVML (for cache key).
 
     Returns empty string if NVML isn't available (safe — just means no caching).
+    Read once per process — only the static identity fields are queried —
+    and a failure is remembered too, so a machine without NVML doesn't
+    retry the import + init on every cache lookup.
     """
+    global _driver_version
+    if _driver_version is None:
+        try:
+            from kingai_gpu.lib.nvml import snapshot_static
+            _driver_version = snapshot_static(0).driver_version or ""
+        except Exception:
+            _driver_version = ""
+    return _driver_version
+
+
+def _get_cache_entry(gpu: int = 0):
+    """Persisted device-cache entry for this GPU + driver, or None."""
+    if GpuCacheEntry is None:
+        return None
     try:
-        from kingai_gpu.lib.nvml import snapshot
-        snap = snapshot(0)
-        return snap.driver_version
+        gpu_name = _get_gpu_name(gpu)
+        driver = _get_driver_version()
+        if not gpu_name or not driver:
+            return None
+        return get_entry(gpu_name, _get_bus_id(gpu), driver)
     except Exception:
-        return ""
+        return None
 
 
-def _save_probe_to_cache(status: OcStatus, gpu: int = 0):
+def _save_probe_to_cache(
+    status: OcStatus,
+    gpu: int = 0,
+    power_range: tuple[float, float] | None = None,
+    thermal_range: tuple[int, int] | None = None,
+    previous=None,
+):
     """Save probe outcomes to device cache after a successful get_oc_status().
 
     This records what the probing logic discovered (thermal shift, power offsets,
     fan API preference) so the next session can skip redundant probes.
+    power_range / thermal_range are the BIOS limit ranges, when they were
+    actually read (or came from the cache) — they're static per GPU + driver.
+    previous: the entry this session started from; if nothing but the
+    timestamp would change, the file isn't rewritten.
     """
-    global _device_cache
+    if GpuCacheEntry is None:
+        return
     try:
-        from datetime import datetime
-        from kingai_gpu.lib.device_cache import (
-            GpuCacheEntry, load_cache, put_entry,
-        )
-
         driver = _get_driver_version()
         if not status.gpu_name or not driver:
             return  # Can't build a cache key without identity
 
+        fan_api = _session_fan_api.get(gpu)
+        if fan_api is None and previous is not None:
+            fan_api = previous.fan_api  # keep what an earlier session learned
+        fan_count, fan_entry_size = _fan_layout.get(gpu, (None, None))
+        if fan_count is None and previous is not None:
+            fan_count, fan_entry_size = previous.fan_count, previous.fan_entry_size
+
+        # Record whether power primary offsets succeeded
+        # (if power_pct is non-default, primary offsets worked)
+        power_primary_ok = (
+            status.power_pct != 100.0 or status.power_range_pct != (50.0, 150.0)
+        )
+
+        probe = (
+            status.gpu_name, status.bus_id, driver, power_primary_ok,
+            fan_api, fan_count, fan_entry_size, power_range, thermal_range,
+        )
+        if _last_saved_probe.get(gpu) == probe:
+            return  # same outcome as the last call — nothing to rebuild
+        _last_saved_probe[gpu] = probe
+
         entry = GpuCacheEntry(
             gpu_name=status.gpu_name,
             bus_id=status.bus_id,
             driver_version=driver,
-            # Record whether power primary offsets succeeded
-            # (if power_pct is non-default, primary offsets worked)
-            power_primary_ok=status.power_pct != 100.0 or status.power_range_pct != (50.0, 150.0),
+            power_primary_ok=power_primary_ok,
             # Record thermal shift detection (if thermal_c is sane, probe worked)
             thermal_shifted=None,  # We don't expose shift status from _get_thermal_info
             # Fan API preference from in-session tracking
-            fan_api=_session_fan_api.get(gpu),
-            cached_at=datetime.now().isoformat(timespec="seconds"),
+            fan_api=fan_api,
+            fan_entry_size=fan_entry_size,
+            fan_count=fan_count,
+            power_range_pct=list(power_range) if power_range else None,
+            thermal_range_c=list(thermal_range) if thermal_range else None,
+            cached_at=int(time.time()),
         )
 
-        if _device_cache is None:
-            _device_cache = load_cache()
-        _device_cache = put_entry(entry, _device_cache)
+        if previous is not None:
+            entry.cached_at, stamp = previous.cached_at, entry.cached_at
+            if entry == previous:
+                return  # nothing new to persist
+            entry.cached_at = stamp
+        # Deferred: written at most every 30 s and at exit, so a polling
+        # loop re-probing every tick doesn't rewrite the file each time
+        put_entry(entry, defer=True)
     except Exception:
         pass  # Cache save failure is non-fatal
 
@@ -1050,31 +1532,35 @@ def _get_cached_fan_api(gpu: int = 0) -> str | None:
     Returns "new", "old", or None (no cached preference).
     Checks in-session cache first (fastest), then persisted cache.
     """
-    # In-session cache (set during this run by _note_fan_api)
-    if gpu in _session_fan_api:
-        return _session_fan_api[gpu]
+    # In-session cache (set during this run by _note_fan_api) — one lookup
+    api = _session_fan_api.get(gpu)
+    if api is not None:
+        return api
 
     # Persisted cache from a previous session
-    global _device_cache
-    try:
-        from kingai_gpu.lib.device_cache import load_cache, get_entry
+    entry = _get_cache_entry(gpu)
+    if entry is not None and entry.fan_api:
+        _session_fan_api[gpu] = entry.fan_api  # Promote to session cache
+        return entry.fan_api
+    return None
 
-        if _device_cache is None:
-            _device_cache = load_cache()
 
-        gpu_name = _get_gpu_name(gpu)
-        bus_id = _get_bus_id(gpu)
-        driver = _get_driver_version()
-        if not gpu_name or not driver:
-            return None
+def _get_cached_fan_layout(gpu: int = 0) -> tuple[int, int] | None:
+    """(fan count, entry size) for the new fan API from a previous session.
 
-        entry = get_entry(gpu_name, bus_id, driver, _device_cache)
-        if entry is not None and entry.fan_api:
-            _session_fan_api[gpu] = entry.fan_api  # Promote to session cache
-            return entry.fan_api
-    except Exception:
-        pass
-    return None
+    Promoted into _fan_layout on a hit so the persisted cache is consulted
+    once per GPU. Only sane layouts are accepted — anything else is treated
+    as a miss and re-probed from the GetControl buffer.
+    """
+    entry = _get_cache_entry(gpu)
+    if entry is None or not entry.fan_count or not entry.fan_entry_size:
+        return None
+    count, entry_size = entry.fan_count, entry.fan_entry_size
+    if not (0 < count <= 16 and 12 <= entry_size <= 256
+            and 12 + count * entry_size <= _FAN_CONTROL_SIZE):
+        return None
+    _fan_layout[gpu] = (count, entry_size)
+    return count, entry_size
 
 
 def _note_fan_api(api: str, gpu: int = 0):
@@ -1095,24 +1581,65 @@ def enable_oc(gpu: int = 0):
     """
     _init()
     _ = _handle(gpu)  # Validate GPU index exists, raises on invalid
+    if gpu not in _fan_layout and _get_cached_fan_api(gpu) is None:
+        _probe_fan_api(gpu)
 
 
-def get_oc_status(gpu: int = 0) -> OcStatus:
+def _probe_fan_api(gpu: int = 0):
+    """One GetControl up front, so fan writes don't rediscover a dead new API.
+
+    If the new fan API is missing, its Get fails, or its buffer layout
+    can't be parsed, "old" is recorded now and set_fan_speed/set_fan_auto
+    go straight to SetCoolerLevels. Otherwise the layout is remembered and
+    "new" is left to be confirmed by the first successful SetControl — a
+    working Get doesn't prove the Set will be accepted.
+    """
+    fn_get = _fn_ClientFanCoolersGetControl
+    if fn_get is None or _fn_ClientFanCoolersSetControl is None:
+        _note_fan_api("old", gpu)
+        return
+    b = _buf(_FAN_CONTROL_SIZE, 1)
+    if fn_get(_handle(gpu), b) != 0:
+        _note_fan_api("old", gpu)
+        return
+    count, entry_size = _probe_fan_layout(b)
+    if count == 0:
+        _note_fan_api("old", gpu)
+    else:
+        _fan_layout[gpu] = (count, entry_size)
+
+
+def get_oc_status(gpu: int = 0, into: OcStatus | None = None) -> OcStatus:
     """Read all current OC settings into a single dataclass.
 
     GRACEFUL DEGRADATION: Each subsystem (clocks, power, thermal) is read
     independently with its own try/except. If one fails, the others still
     populate. Partial data is better than no data.
+
+    into: an OcStatus to refill in place (reset to defaults first, so a
+    failed read never leaves last tick's value behind) — lets a dashboard
+    keep one instance instead of allocating a new one per refresh.
     """
-    s = OcStatus()
+    if into is None:
+        s = OcStatus()
+    else:
+        s = into
+        OcStatus.__init__(s)
     s.gpu_name = _get_gpu_name(gpu)
     s.bus_id = _get_bus_id(gpu)
 
+    # Power / thermal limit ranges are BIOS constants for a given GPU +
+    # driver. Once a previous run has cached them, only the current values
+    # are read from the driver.
+    entry = _get_cache_entry(gpu)
+    power_range = tuple(entry.power_range_pct) if entry and entry.power_range_pct else None
+    thermal_range = tuple(entry.thermal_range_c) if entry and entry.thermal_range_c else None
+
     # Clock offsets from PStates20 — the most reliable read
     try:
         ps_buf = _get_pstates20(gpu)
-        core_val, core_min, core_max = _read_clock_delta(ps_buf, domain_id=0)
-        mem_val, mem_min, mem_max = _read_clock_delta(ps_buf, domain_id=4)
+        core_val, core_min, core_max = _read_clock_delta(ps_buf, domain_id=0, gpu=gpu)
+        mem_val, mem_min, mem_max = _read_clock_delta(ps_buf, domain_id=4, gpu=gpu)
         s.core_offset_mhz = core_val / 1000.0
         s.core_offset_range_mhz = (core_min / 1000.0, core_max / 1000.0)
         s.mem_offset_mhz = mem_val / 1000.0
@@ -1123,10 +1650,14 @@ def get_oc_status(gpu: int = 0) -> OcStatus:
     # Power limit — reads current target and allowed range
     try:
         current_pcm = _get_power_status(gpu)
-        min_pcm, def_pcm, max_pcm = _get_power_info(gpu)
-        if def_pcm > 0:
+        if power_range is not None:
             s.power_pct = current_pcm / 1000.0
-            s.power_range_pct = (min_pcm / 1000.0, max_pcm / 1000.0)
+            s.power_range_pct = power_range
+        else:
+            min_pcm, def_pcm, max_pcm = _get_power_info(gpu)
+            if def_pcm > 0:
+                s.power_pct = current_pcm / 1000.0
+                s.power_range_pct = power_range = (min_pcm / 1000.0, max_pcm / 1000.0)
     except NvApiError:
         pass
 
@@ -1137,19 +1668,73 @@ def get_oc_status(gpu: int = 0) -> OcStatus:
         pass  # Keep default (83°C)
 
     # Thermal range — min/max allowed temperature targets
-    try:
-        t_min, t_def, t_max = _get_thermal_info(gpu)
-        s.thermal_range_c = (t_min, t_max)
-    except NvApiError:
-        pass
+    if thermal_range is not None:
+        s.thermal_range_c = thermal_range
+    else:
+        try:
+            t_min, t_def, t_max = _get_thermal_info(gpu)
+            s.thermal_range_c = thermal_range = (t_min, t_max)
+        except NvApiError:
+            pass
 
     # ── Save probe results to device cache ──
     # Non-blocking: if cache save fails, everything still works.
-    _save_probe_to_cache(s, gpu)
+    _save_probe_to_cache(s, gpu, power_range, thermal_range, previous=entry)
 
     return s
 
 
+def get_oc_readings(gpu: int = 0) -> OcReadings:
+    """Read the live settable values in one pass (PStates20, power, thermal).
+
+    The handle lookup / lazy init / bounds check runs once up front, so the
+    three Gets below each go straight to the driver, and both clock domains
+    come from the same PStates20 buffer. Much lighter than get_oc_status(),
+    which also reads names, ranges and updates the device cache.
+    """
+    r = OcReadings()
+    try:
+        _handle(gpu)
+    except NvApiError:
+        return r
+    try:
+        ps_buf = _get_pstates20(gpu)
+        r.core_offset_khz = _read_clock_delta(ps_buf, domain_id=0, gpu=gpu)[0]
+        r.mem_offset_khz = _read_clock_delta(ps_buf, domain_id=4, gpu=gpu)[0]
+    except NvApiError:
+        pass
+    try:
+        r.power_pcm = _get_power_status(gpu)
+    except NvApiError:
+        pass
+    try:
+        r.thermal_limit_c = _get_thermal_limit(gpu)
+    except NvApiError:
+        pass
+    return r
+
+
+def get_current_settings(gpu: int = 0) -> dict[str, float]:
+    """Read just the live settable values, in the units the set_* functions take.
+
+    Returns {"core": MHz, "mem": MHz, "power": %, "thermal": °C}. A key is
+    missing if its read failed. Built on get_oc_readings(). Used by
+    'oc --load' to skip Set calls for values the GPU already has. Fan speed
+    isn't included: there's no cheap read of the manual target, so it's
+    always re-applied.
+    """
+    r = get_oc_readings(gpu)
+    cur: dict[str, float] = {}
+    if r.core_offset_khz is not None:
+        cur["core"] = r.core_offset_khz / 1000.0
+        cur["mem"] = r.mem_offset_khz / 1000.0
+    if r.power_pcm is not None:
+        cur["power"] = r.power_pcm / 1000.0
+    if r.thermal_limit_c is not None:
+        cur["thermal"] = r.thermal_limit_c
+    return cur
+
+
 def set_core_offset(mhz: int, gpu: int = 0):
     """Set core (graphics) clock offset in MHz. Positive = overclock, negative = undervolt."""
     _set_clock_offset(domain_id=0, offset_khz=mhz * 1000, gpu=gpu)
@@ -1160,6 +1745,11 @@ def set_mem_offset(mhz: int, gpu: int = 0):
     _set_clock_offset(domain_id=4, offset_khz=mhz * 1000, gpu=gpu)
 
 
+def set_clock_offsets(core_mhz: int, mem_mhz: int, gpu: int = 0):
+    """Set core and memory offsets together — one SetPstates20 call, not two."""
+    _set_clock_offsets([(0, core_mhz * 1000), (4, mem_mhz * 1000)], gpu)
+
+
 def set_power_limit(pct: float, gpu: int = 0):
     """Set power limit as percentage (e.g., 100 = default, 125 = +25%)."""
     pcm = int(pct * 1000)
@@ -1180,7 +1770,8 @@ def set_fan_speed(pct: int, gpu: int = 0):
 
     DEVICE CACHE: If a previous session recorded which API works for this
     GPU, skip straight to that API to avoid the Get-Modify-Set overhead
-    of the new API when it's going to fail anyway.
+    of the new API when it's going to fail anyway. Once "new" is known the
+    session map is left alone — only a fallback to the old API updates it.
     """
     # Check device cache for fan API preference
     cached_api = _get_cached_fan_api(gpu)
@@ -1190,7 +1781,8 @@ def set_fan_speed(pct: int, gpu: int = 0):
 
     try:
         _set_fan_new_api(pct, manual=True, gpu=gpu)
-        _note_fan_api("new", gpu)
+        if cached_api is None:
+            _note_fan_api("new", gpu)
     except NvApiError:
         _set_cooler_level(pct, cooler_index=0, gpu=gpu)
         _note_fan_api("old", gpu)
@@ -1205,7 +1797,8 @@ def set_fan_auto(gpu: int = 0):
 
     try:
         _set_fan_new_api(0, manual=False, gpu=gpu)
-        _note_fan_api("new", gpu)
+        if cached_api is None:
+            _note_fan_api("new", gpu)
     except NvApiError:
         _set_cooler_auto(cooler_index=0, gpu=gpu)
         _note_fan_api("old", gpu)
@@ -1221,19 +1814,23 @@ def reset_all(gpu: int = 0):
     """
     errors = []
 
-    # Reset core clock offset to 0 (no overclock/undervolt)
-    try:
-        set_core_offset(0, gpu)
-    except NvApiError as e:
-        errors.append(f"core: {e}")
-
-    # Reset memory clock offset to 0
+    # Reset core + memory clock offsets to 0 in one write. If the combined
+    # write is rejected, retry each domain alone so one bad domain doesn't
+    # block the other's rollback.
     try:
-        set_mem_offset(0, gpu)
-    except NvApiError as e:
-        errors.append(f"memory: {e}")
+        set_clock_offsets(0, 0, gpu)
+    except NvApiError:
+        try:
+            set_core_offset(0, gpu)
+        except NvApiError as e:
+            errors.append(f"core: {e}")
+        try:
+            set_mem_offset(0, gpu)
+        except NvApiError as e:
+            errors.append(f"memory: {e}")
 
-    # Reset power limit to factory default (reads default from Info struct)
+    # Reset power limit to factory default (from the Info struct, read once
+    # per process — a repeat reset is Set calls only)
     try:
         _, def_pcm, _ = _get_power_info(gpu)
         _set_power_status(def_pcm, gpu)
@@ -1261,6 +1858,153 @@ def reset_all(gpu: int = 0):
         raise NvApiError("reset_all", -1)
 
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Non-blocking writes (for interactive frontends)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Every set_* call blocks until the driver answers — plus retry backoff if
+# another OC tool holds the lock. A slider dragged in a GUI emits far more
+# values than that can absorb, so apply_async() hands the call to a single
+# daemon writer thread and returns at once. Pending calls coalesce per
+# (setter, gpu): a newer value replaces one not yet written, so only the
+# latest slider position ever reaches the driver. The CLI stays blocking.
+
+_async_cv = threading.Condition()
+_async_pending: dict[tuple, tuple] = {}   # (setter, gpu) → args, oldest first
+_async_busy = False                       # writer is inside a setter call
+_async_error: Exception | None = None     # last failure, reported by flush_async()
+_async_thread: threading.Thread | None = None
+
+
+def _writer_loop():
+    global _async_busy, _async_error
+    while True:
+        with _async_cv:
+            while not _async_pending:
+                _async_cv.wait()
+            key = next(iter(_async_pending))
+            args = _async_pending.pop(key)
+            _async_busy = True
+        setter, gpu = key
+        err = None
+        try:
+            setter(*args, gpu=gpu)
+        except Exception as e:  # keep the writer alive; surface via flush_async()
+            err = e
+        with _telemetry_lock:
+            _telemetry.pop(gpu, None)  # cached readings predate this write
+            _telemetry_gen[gpu] = _telemetry_gen.get(gpu, 0) + 1  # so do in-flight ones
+        with _async_cv:
+            _async_busy = False
+            if err is not None:
+                _async_error = err
+            _async_cv.notify_all()
+
+
+def apply_async(setter, *args, gpu: int = 0) -> None:
+    """Queue a Set call on the writer thread, e.g. apply_async(set_core_offset, 150).
+
+    Returns immediately. If a call to the same setter for the same GPU is
+    still pending, its arguments are replaced with these. Errors don't
+    raise here — collect them with flush_async().
+    """
+    global _async_thread
+    with _async_cv:
+        _async_pending[(setter, gpu)] = args
+        if _async_thread is None:
+            _async_thread = threading.Thread(
+                target=_writer_loop, name="kingai-nvapi-writer", daemon=True
+            )
+            _async_thread.start()
+        _async_cv.notify_all()
+
+
+def flush_async(timeout: float | None = None) -> Exception | None:
+    """Wait until every queued write has been applied.
+
+    Returns the last error raised by a queued setter since the previous
+    flush (and clears it), or None. If timeout expires first, returns
+    whatever error has been seen so far without waiting further.
+    """
+    global _async_error
+    with _async_cv:
+        _async_cv.wait_for(lambda: not _async_pending and not _async_busy, timeout)
+        err, _async_error = _async_error, None
+        return err
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Background telemetry (for interactive frontends)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# An overlay redrawing at 60 Hz doesn't need 60 driver round-trips a second
+# for limits that change when the user changes them. start_telemetry() runs
+# one daemon thread that refreshes get_oc_readings() every `interval`
+# seconds; get_cached_readings() serves the latest copy without touching the
+# driver. refresh_now() forces a read, and writes queued via apply_async()
+# drop the GPU's cached copy so the next read reflects them — each write
+# also bumps the GPU's generation, and a refresh that straddled it discards
+# its result instead of caching it. Opt-in only — the CLI and
+# get_oc_status() always read live.
+
+_telemetry_lock = threading.Lock()
+_telemetry: dict[int, OcReadings] = {}      # gpu → latest readings
+_telemetry_gen: dict[int, int] = {}         # gpu → writes applied so far
+_telemetry_stop: threading.Event | None = None
+_telemetry_thread: threading.Thread | None = None
+
+
+def _telemetry_loop(gpus: tuple[int, ...], interval: float, stop: threading.Event):
+    while not stop.is_set():
+        for gpu in gpus:
+            refresh_now(gpu)
+        stop.wait(interval)
+
+
+def start_telemetry(gpus: tuple[int, ...] = (0,), interval: float = 0.5) -> None:
+    """Start (or restart) the background poller for the given GPUs."""
+    global _telemetry_stop, _telemetry_thread
+    stop_telemetry()
+    stop = threading.Event()
+    thread = threading.Thread(
+        target=_telemetry_loop, args=(tuple(gpus), interval, stop),
+        name="kingai-nvapi-telemetry", daemon=True,
+    )
+    thread.start()
+    _telemetry_stop, _telemetry_thread = stop, thread
+
+
+def stop_telemetry() -> None:
+    """Stop the background poller and wait for its thread (cached readings are kept)."""
+    global _telemetry_stop, _telemetry_thread
+    if _telemetry_stop is not None:
+        _telemetry_stop.set()
+        _telemetry_stop = None
+    if _telemetry_thread is not None:
+        _telemetry_thread.join()  # at most one in-flight refresh
+        _telemetry_thread = None
+
+
+def refresh_now(gpu: int = 0) -> OcReadings:
+    """Read live values now and store them as the cached copy.
+
+    If an apply_async() write lands while the read is in flight, the result
+    is returned but not cached — it may predate the write.
+    """
+    with _telemetry_lock:
+        gen = _telemetry_gen.get(gpu, 0)
+    r = get_oc_readings(gpu)
+    with _telemetry_lock:
+        if _telemetry_gen.get(gpu, 0) == gen:
+            _telemetry[gpu] = r
+    return r
+
+
+def get_cached_readings(gpu: int = 0) -> OcReadings:
+    """Latest background readings for gpu; reads live if none are cached yet."""
+    with _telemetry_lock:
+        r = _telemetry.get(gpu)
+    return r if r is not None else refresh_now(gpu)
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Debug helpers (for probing / development)
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -1276,11 +2020,18 @@ def dump_buf(buf, label: str = "", max_bytes: int = 128):
     print(f"\n{'═' * 60}")
     print(f"  {label}  ({size} bytes)")
     print(f"{'═' * 60}")
-    for off in range(0, min(size, max_bytes), 4):
-        u = _u32(buf, off)
-        i = _i32(buf, off)
-        raw = bytes(buf[off:off + 4])
-        print(f"  +{off:4d}  0x{u:08X}  u={u:>12d}  i={i:>12d}  {raw.hex()}")
+    # One copy of the dumped range, unpacked word-by-word in C and hexed
+    # once — no per-row slice, bytes() or _u32/_i32 call.
+    words = min(-(-min(size, max_bytes) // 4), size // 4)
+    raw = bytes(buf[:words * 4])
+    hx = raw.hex()
+    rows = []
+    for w, (u,) in enumerate(_U32.iter_unpack(raw)):
+        off = w * 4
+        i = u - 0x100000000 if u & 0x80000000 else u
+        rows.append(f"  +{off:4d}  0x{u:08X}  u={u:>12d}  i={i:>12d}  {hx[off * 2:off * 2 + 8]}")
+    if rows:
+        print("\n".join(rows))
     if size > max_bytes:
         print(f"  ... ({size - max_bytes} more bytes)")
 
@@ -1298,22 +2049,23 @@ def dump_pstates(gpu: int = 0):
     n_vt = _u32(buf, _PS_NUM_BASE_VOLTAGES)
     print(f"\nPStates20: {n_ps} pstates, {n_ck} clocks, {n_vt} base voltages")
 
-    for pi in range(min(n_ps, 4)):  # Show first 4 pstates
-        ps_id = _u32(buf, _pstate_off(pi))
+    # One zero-copy structured view; each field comes out as a whole column
+    n_show = min(n_ps, 4)  # Show first 4 pstates
+    n_clk = min(n_ck, _MAX_CLOCKS)
+    ps = _pstates_view(buf)[:n_show]
+    ck = ps["clocks"][:, :n_clk]
+    domains, ck_types, freqs = ck["domain"].tolist(), ck["type"].tolist(), ck["freq"].tolist()
+    vals, mins, maxs = ck["delta_val"].tolist(), ck["delta_min"].tolist(), ck["delta_max"].tolist()
+    for pi, ps_id in enumerate(ps["id"].tolist()):
         print(f"\n  P{ps_id}:")
-        for ci in range(min(n_ck, _MAX_CLOCKS)):
-            base = _clock_off(pi, ci)
-            domain = _u32(buf, base + _CK_DOMAIN)
-            ctype = _u32(buf, base + _CK_TYPE)
-            delta_val = _i32(buf, base + _CK_DELTA_VAL)
-            delta_min = _i32(buf, base + _CK_DELTA_MIN)
-            delta_max = _i32(buf, base + _CK_DELTA_MAX)
-            freq = _u32(buf, base + _CK_DATA_FREQ)
+        for ci in range(n_clk):
+            domain = domains[pi][ci]
+            delta_val, delta_min, delta_max = vals[pi][ci], mins[pi][ci], maxs[pi][ci]
             domain_name = {0: "Core", 4: "Memory"}.get(domain, f"Dom{domain}")
             print(
                 f"    Clock {ci}: {domain_name:>6}  "
-                f"type={ctype}  "
+                f"type={ck_types[pi][ci]}  "
                 f"delta={delta_val / 1000:+.0f} MHz  "
                 f"range=[{delta_min / 1000:+.0f}, {delta_max / 1000:+.0f}]  "
-                f"freq={freq / 1000:.0f} MHz"
+                f"freq={freqs[pi][ci] / 1000:.0f} MHz"
             )
@@ -16,15 +16,27 @@ Key design decisions:
 
 Provides:
   - snapshot(index)    → GpuSnapshot (one GPU, one moment in time)
+  - snapshot_static(index) / snapshot_dynamic(index, static)
+                       → same, split so polling loops skip static reads
+  - snapshot_delta(index, prev) → same, reusing the decoded throttle list from prev
   - snapshot_all()     → list[GpuSnapshot] (all GPUs)
+  - snapshot_all_soa() → same, as field name → numpy array (one per GPU)
   - poll(index, interval) → generator yielding snapshots forever
+  - poll_samples(index, sample_type, interval)
+                       → generator yielding the driver's buffered samples
+  - start_background_poller() / read_latest() / read_history()
+                       → snapshots from a background thread, no NVML call
   - gpu_count()        → int (number of NVIDIA GPUs)
 """
 
 from __future__ import annotations
 
 import atexit
+import copy
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 
 
@@ -39,26 +51,57 @@ import pynvml as nvml  # noqa: E402
 # We track this with _initialized and register an atexit handler for cleanup.
 
 _initialized = False
+_init_lock = threading.Lock()
+
+# NVML device handles by GPU index. Handles stay valid until nvmlShutdown(),
+# so each is looked up once and reused by every snapshot. Filled ahead of
+# time by snapshot_all() so its worker threads only ever read it.
+_handle_cache: dict[int, object] = {}
+
+# Static fields (identity, max clocks, limit range) by GPU index, as a
+# GpuSnapshot with default dynamic fields. Read once per NVML session, then
+# every snapshot starts from a copy — only the live sensors are re-read.
+_static_cache: dict[int, GpuSnapshot] = {}
+
+# Worker pool for snapshot_all() on multi-GPU systems, created on first use
+_pool: ThreadPoolExecutor | None = None
 
 
 def _ensure_init() -> None:
-    """Lazily initialize NVML on first use. Thread-safe enough for our purposes."""
+    """Lazily initialize NVML on first use.
+
+    Double-checked: once initialized this is a single global read with no
+    lock. The first callers (possibly concurrent — a monitor thread and a
+    snapshot_all() worker) serialize on _init_lock so nvmlInit() runs and
+    the atexit handler is registered exactly once.
+    """
     global _initialized
-    if not _initialized:
-        nvml.nvmlInit()  # Must be called before ANY nvml function
-        _initialized = True
-        atexit.register(_shutdown)  # Clean up on process exit
+    if _initialized:
+        return
+    with _init_lock:
+        if not _initialized:
+            nvml.nvmlInit()  # Must be called before ANY nvml function
+            atexit.register(_shutdown)  # Clean up on process exit
+            _initialized = True
 
 
 def _shutdown() -> None:
     """Clean up NVML on exit. Silently ignores errors (process may be dying)."""
-    global _initialized
+    global _initialized, _pool
+    stop_background_poller()  # joined first — its snapshots use the handles below
+    if _pool is not None:
+        _pool.shutdown(wait=True)  # no snapshot may run past nvmlShutdown()
+        _pool = None
     if _initialized:
         try:
             nvml.nvmlShutdown()
         except Exception:
             pass  # Don't crash during shutdown
         _initialized = False
+        _handle_cache.clear()
+        _static_cache.clear()
+        _no_field_values.clear()
+        _unsupported.clear()
 
 
 # ── Throttle reason flags ──
@@ -80,22 +123,31 @@ THROTTLE_REASONS = {
 }
 
 
+# Every combination of the known flags, decoded once at import: entry i is
+# the names for bitmask i (ascending flag order). 9 flags → 512 entries.
+_THROTTLE_KNOWN = sum(THROTTLE_REASONS)
+_THROTTLE_TABLE = tuple(
+    tuple(name for flag, name in THROTTLE_REASONS.items() if i & flag)
+    for i in range(_THROTTLE_KNOWN + 1)
+)
+
+
 def decode_throttle_reasons(bitmask: int) -> list[str]:
     """Decode throttle reason bitmask into human-readable strings."""
     if bitmask == 0:
         return ["NONE"]
-    reasons = []
-    for flag, name in THROTTLE_REASONS.items():
-        if bitmask & flag:
-            reasons.append(name)
-    return reasons or [f"UNKNOWN(0x{bitmask:08x})"]
+    if not bitmask & ~_THROTTLE_KNOWN:
+        return list(_THROTTLE_TABLE[bitmask])
+    # Only reached with flags newer than this table (rare) — keep the old
+    # behaviour: known names, or UNKNOWN if none of the bits are known
+    return list(_THROTTLE_TABLE[bitmask & _THROTTLE_KNOWN]) or [f"UNKNOWN(0x{bitmask:08x})"]
 
 
 # ── GPU snapshot dataclass ──
 # This is the core data model for monitoring. Every field has a safe default
 # so partial snapshots (where some sensors fail) are still usable.
 
-@dataclass
+@dataclass(slots=True)
 class GpuSnapshot:
     """Point-in-time snapshot of all readable GPU sensors.
 
@@ -153,8 +205,14 @@ class GpuSnapshot:
     throttle_reasons: list[str] = field(default_factory=list)  # Human-readable
     throttle_raw: int = 0       # Raw bitmask for programmatic use
 
-    # Timestamp — when this snapshot was taken (time.time())
-    timestamp: float = 0.0
+    # Timestamp — when this snapshot was taken (time.time_ns(), an int, so
+    # no float is boxed per snapshot; .timestamp gives seconds)
+    timestamp_ns: int = 0
+
+    @property
+    def timestamp(self) -> float:
+        """Seconds since the epoch, as time.time() would have returned."""
+        return self.timestamp_ns / 1e9
 
     @property
     def vram_used_pct(self) -> float:
@@ -170,18 +228,19 @@ class GpuSnapshot:
 
     def summary_line(self) -> str:
         """One-line summary for dashboard display."""
-        throttle = ",".join(self.throttle_reasons)
+        # The two percentages are computed inline from locals rather than
+        # through the properties — each would re-read its fields off self
+        draw, limit = self.power_draw, self.power_limit
+        used, total = self.vram_used, self.vram_total
+        power_pct = 100.0 * draw / limit if limit else 0.0
+        vram_pct = 100.0 * used / total if total else 0.0
         return (
-            f"{self.name} | "
-            f"{self.temp_gpu}°C | "
-            f"{self.clock_gpu}/{self.clock_gpu_max} MHz | "
-            f"Mem {self.clock_mem} MHz | "
-            f"{self.power_draw:.0f}/{self.power_limit:.0f}W ({self.power_pct:.0f}%) | "
-            f"Fan {self.fan_speed}% | "
-            f"GPU {self.util_gpu}% | "
-            f"VRAM {self.vram_used}MB/{self.vram_total}MB ({self.vram_used_pct:.0f}%) | "
-            f"{self.pstate} | "
-            f"{throttle}"
+            f"{self.name} | {self.temp_gpu}°C | "
+            f"{self.clock_gpu}/{self.clock_gpu_max} MHz | Mem {self.clock_mem} MHz | "
+            f"{draw:.0f}/{limit:.0f}W ({power_pct:.0f}%) | "
+            f"Fan {self.fan_speed}% | GPU {self.util_gpu}% | "
+            f"VRAM {used}MB/{total}MB ({vram_pct:.0f}%) | "
+            f"{self.pstate} | {','.join(self.throttle_reasons)}"
         )
 
 
@@ -203,6 +262,63 @@ def _safe(fn, *args, default=None):
         return default
 
 
+# GPU index → live sensors that raised NVMLError_NotSupported. "Supported"
+# is a fixed property of the GPU, so once a sensor says no it isn't asked
+# again — a passive card doesn't raise and catch a fan-speed error every
+# tick. Other errors may be transient and are retried as before.
+_unsupported: dict[int, set[str]] = {}
+
+
+def _sensor(unsupported: set[str], key: str, fn, *args, default=None):
+    """_safe() for a live sensor, skipping ones known to be unsupported."""
+    if key in unsupported:
+        return default
+    try:
+        return fn(*args)
+    except nvml.NVMLError_NotSupported:
+        unsupported.add(key)
+        return default
+    except Exception:
+        return default
+
+
+# ── Batched power reads ──
+# nvmlDeviceGetFieldValues returns several fields in one driver call. Of the
+# live sensors only power draw and the current power target have field IDs
+# (clocks, temperature, fan, utilization and P-state don't), so those two are
+# fetched together. POWER_AVERAGE is the 1 s average nvmlDeviceGetPowerUsage
+# reports on Ampere and newer; on older GPUs the field comes back unsupported
+# and that one value falls back to its own call. The field IDs need
+# nvidia-ml-py 12.535+ — with an older binding the batch is simply skipped.
+
+_POWER_FIELDS = (
+    getattr(nvml, "NVML_FI_DEV_POWER_AVERAGE", None),
+    getattr(nvml, "NVML_FI_DEV_POWER_CURRENT_LIMIT", None),
+)
+# c_nvmlValue_t member for each NVML_VALUE_TYPE_* (by enum value)
+_VALUE_ATTRS = ("dVal", "uiVal", "ulVal", "ullVal", "sllVal", "siVal", "usVal")
+# GPU indices whose driver rejected nvmlDeviceGetFieldValues outright
+_no_field_values: set[int] = set()
+
+
+def _read_power_fields(h, index: int) -> tuple[int | None, int | None]:
+    """(draw_mw, limit_mw) from one FieldValues call; None where unavailable."""
+    if None in _POWER_FIELDS or index in _no_field_values:
+        return None, None
+    try:
+        values = nvml.nvmlDeviceGetFieldValues(h, _POWER_FIELDS)
+    except Exception:
+        _no_field_values.add(index)  # static per driver — don't ask again
+        return None, None
+    out = []
+    for v in values:
+        if v.nvmlReturn != nvml.NVML_SUCCESS or not 0 <= v.valueType < len(_VALUE_ATTRS):
+            out.append(None)
+        else:
+            out.append(int(getattr(v.value, _VALUE_ATTRS[v.valueType])))
+    return out[0], out[1]
+
+
 # ── Main API ─────────────────────────────────────────────────────────────────
 
 def gpu_count() -> int:
@@ -212,9 +328,14 @@ def gpu_count() -> int:
 
 
 def get_handle(index: int = 0):
-    """Get NVML device handle."""
-    _ensure_init()
-    return nvml.nvmlDeviceGetHandleByIndex(index)
+    """Get NVML device handle (cached per index after the first lookup)."""
+    h = _handle_cache.get(index)
+    if h is None:
+        # A cached handle implies NVML is up (_shutdown() clears the cache),
+        # so only a miss needs the init check
+        _ensure_init()
+        h = _handle_cache[index] = nvml.nvmlDeviceGetHandleByIndex(index)
+    return h
 
 
 def snapshot(index: int = 0) -> GpuSnapshot:
@@ -226,30 +347,92 @@ def snapshot(index: int = 0) -> GpuSnapshot:
 
     Performance: ~1-2ms per call on modern GPUs (NVML is very fast).
     Safe to call at 1 Hz for dashboard, or 10 Hz for detailed logging.
+    The static fields are read on the first snapshot of each GPU and
+    reused afterwards, so repeat calls only pay for the live sensors.
     """
-    _ensure_init()
-    h = nvml.nvmlDeviceGetHandleByIndex(index)
-    s = GpuSnapshot(index=index, timestamp=time.time())
+    return snapshot_dynamic(index, _get_static(index))
 
-    # Identity — these are static but we read them every time for simplicity.
-    # Could be cached per-GPU for slight perf gain (not worth the complexity).
+
+def snapshot_delta(index: int = 0, prev: GpuSnapshot | None = None) -> GpuSnapshot:
+    """Like snapshot(), but reuses what can't have changed since prev.
+
+    prev is the previous result for the same GPU (None → full snapshot).
+    Every sensor is re-read — clocks included, since a memory offset or
+    decode load moves them without touching the P-state — but while the
+    throttle mask is unchanged the decoded reason list is carried over.
+    Used by poll(). As the result starts as a copy of prev, a memory or
+    utilization read that fails this tick shows prev's value rather than 0.
+    prev itself isn't modified.
+    """
+    if prev is None:
+        return snapshot(index)
+    h = get_handle(index)
+    s = copy.copy(prev)
+    s.index = index
+    s.timestamp_ns = time.time_ns()
+    _read_dynamic(h, s, prev)
+    return s
+
+
+def snapshot_static(index: int = 0) -> GpuSnapshot:
+    """Snapshot with only the fields that don't change while running.
+
+    Identity (name, driver, PCI, UUID), max clocks, the max temperature
+    threshold and the power limit range. Dynamic fields are left at their
+    defaults — pass the result to snapshot_dynamic() to fill them in.
+    Read from NVML once per GPU; later calls return a fresh copy.
+    """
+    s = copy.copy(_get_static(index))
+    s.timestamp_ns = time.time_ns()
+    return s
+
+
+def _get_static(index: int) -> GpuSnapshot:
+    """The cached static snapshot for index — shared, callers must copy."""
+    s = _static_cache.get(index)
+    if s is None:
+        h = get_handle(index)
+        s = GpuSnapshot(index=index, timestamp_ns=time.time_ns())
+        _read_static(h, s)
+        _static_cache[index] = s
+    return s
+
+
+def snapshot_dynamic(index: int, static: GpuSnapshot) -> GpuSnapshot:
+    """Fresh snapshot that re-reads only the live sensors.
+
+    Static fields are copied from `static` (from snapshot_static()), so the
+    result is a complete GpuSnapshot at roughly half the NVML calls of
+    snapshot(). `static` itself isn't modified.
+    """
+    h = get_handle(index)
+    s = copy.copy(static)
+    s.index = index
+    s.timestamp_ns = time.time_ns()
+    _read_dynamic(h, s)
+    return s
+
+
+def _read_static(h, s: GpuSnapshot) -> None:
+    """Fill the fields that are fixed for the life of the driver session."""
+    # Identity
     s.name = _safe(nvml.nvmlDeviceGetName, h, default="Unknown")
     s.driver_version = _safe(nvml.nvmlSystemGetDriverVersion, default="?")
-    # PCI bus ID may come back as bytes or str depending on pynvml version
-    raw_bus = _safe(lambda hh: nvml.nvmlDeviceGetPciInfo(hh).busId, h, default="")
-    s.pci_bus_id = raw_bus.decode("utf-8", errors="replace") if isinstance(raw_bus, bytes) else str(raw_bus)
+    # PCI bus ID may come back as bytes or str depending on pynvml version.
+    # Decoded here, once per GPU — snapshots copy the finished str.
+    pci = _safe(nvml.nvmlDeviceGetPciInfo, h)
+    raw_bus = pci.busId if pci is not None else ""
+    if isinstance(raw_bus, bytes):
+        s.pci_bus_id = raw_bus.decode("ascii", errors="replace")
+    else:
+        s.pci_bus_id = str(raw_bus)
     s.uuid = _safe(nvml.nvmlDeviceGetUUID, h, default="")
 
-    # Clocks — current frequencies and max boost clocks
-    s.clock_gpu = _safe(nvml.nvmlDeviceGetClockInfo, h, nvml.NVML_CLOCK_GRAPHICS, default=0)
-    s.clock_mem = _safe(nvml.nvmlDeviceGetClockInfo, h, nvml.NVML_CLOCK_MEM, default=0)
-    s.clock_sm = _safe(nvml.nvmlDeviceGetClockInfo, h, nvml.NVML_CLOCK_SM, default=0)
-    s.clock_video = _safe(nvml.nvmlDeviceGetClockInfo, h, nvml.NVML_CLOCK_VIDEO, default=0)
+    # Max boost clocks (from BIOS)
     s.clock_gpu_max = _safe(nvml.nvmlDeviceGetMaxClockInfo, h, nvml.NVML_CLOCK_GRAPHICS, default=0)
     s.clock_mem_max = _safe(nvml.nvmlDeviceGetMaxClockInfo, h, nvml.NVML_CLOCK_MEM, default=0)
 
-    # Temperature
-    s.temp_gpu = _safe(nvml.nvmlDeviceGetTemperature, h, nvml.NVML_TEMPERATURE_GPU, default=0)
+    # Max temperature threshold
     s.temp_gpu_max = _safe(
         nvml.nvmlDeviceGetTemperatureThreshold,
         h,
@@ -257,60 +440,149 @@ def snapshot(index: int = 0) -> GpuSnapshot:
         default=0,
     )
 
-    # Fan speed — 0-100%. Returns 0 for passively cooled cards.
-    s.fan_speed = _safe(nvml.nvmlDeviceGetFanSpeed, h, default=0)
-
-    # Power — NVML returns milliwatts, we want watts for display.
-    # power_draw = actual current consumption
-    # power_limit = current target (may have been raised by OC)
+    # Power limit range — NVML returns milliwatts, we want watts for display.
     # power_default = factory target
     # power_min/max = allowed range for set_power_limit()
-    pw = _safe(nvml.nvmlDeviceGetPowerUsage, h, default=0)
-    s.power_draw = pw / 1000.0 if pw else 0.0
-    pl = _safe(nvml.nvmlDeviceGetPowerManagementLimit, h, default=0)
-    s.power_limit = pl / 1000.0 if pl else 0.0
     pd = _safe(nvml.nvmlDeviceGetPowerManagementDefaultLimit, h, default=0)
     s.power_default = pd / 1000.0 if pd else 0.0
-    pmin, pmax = 0, 0
-    try:
-        pmin = nvml.nvmlDeviceGetPowerManagementLimitConstraints(h)[0]
-        pmax = nvml.nvmlDeviceGetPowerManagementLimitConstraints(h)[1]
-    except Exception:
-        pass
+    pmin, pmax = _safe(nvml.nvmlDeviceGetPowerManagementLimitConstraints, h, default=(0, 0))
     s.power_min = pmin / 1000.0 if pmin else 0.0
     s.power_max = pmax / 1000.0 if pmax else 0.0
 
-    # Memory — NVML returns bytes, we convert to MB for readability
-    mem = _safe(nvml.nvmlDeviceGetMemoryInfo, h, default=None)
+
+def _read_dynamic(h, s: GpuSnapshot, prev: GpuSnapshot | None = None) -> None:
+    """Fill the live sensor fields (clocks, temp, fan, power, memory, state).
+
+    prev: the previous snapshot of the same GPU, already copied into s
+    (snapshot_delta). If the throttle mask hasn't moved since prev, the
+    decoded reason list is kept instead of being rebuilt.
+    """
+    unsup = _unsupported.get(s.index)
+    if unsup is None:
+        unsup = _unsupported.setdefault(s.index, set())
+
+    # Performance state — P0=max perf (gaming/compute), P8=idle, P12=minimum power
+    ps = _sensor(unsup, "pstate", nvml.nvmlDeviceGetPerformanceState, h, default=-1)
+    pstate = f"P{ps}" if ps >= 0 else "?"
+
+    # Throttle reasons — bitmask telling us WHY the GPU isn't running at max clock.
+    # Critical for OC tuning: if SW_POWER_CAP is set, raise power limit.
+    # If SW_THERMAL, raise thermal limit or increase fan speed.
+    throttle = _sensor(
+        unsup, "throttle", nvml.nvmlDeviceGetCurrentClocksThrottleReasons, h, default=0,
+    )
+    same_throttle = prev is not None and throttle == prev.throttle_raw
+    s.pstate = pstate
+    s.throttle_raw = throttle
+    if not same_throttle:
+        # Unchanged mask → s (a copy of prev) already holds the decoded list;
+        # consecutive snapshots share it, so treat throttle_reasons as read-only
+        s.throttle_reasons = decode_throttle_reasons(throttle)
+
+    # Clocks — current frequencies
+    s.clock_gpu = _sensor(
+        unsup, "clock_gpu", nvml.nvmlDeviceGetClockInfo, h, nvml.NVML_CLOCK_GRAPHICS, default=0,
+    )
+    s.clock_sm = _sensor(
+        unsup, "clock_sm", nvml.nvmlDeviceGetClockInfo, h, nvml.NVML_CLOCK_SM, default=0,
+    )
+    s.clock_mem = _sensor(
+        unsup, "clock_mem", nvml.nvmlDeviceGetClockInfo, h, nvml.NVML_CLOCK_MEM, default=0,
+    )
+    s.clock_video = _sensor(
+        unsup, "clock_video", nvml.nvmlDeviceGetClockInfo, h, nvml.NVML_CLOCK_VIDEO, default=0,
+    )
+
+    # Temperature
+    s.temp_gpu = _sensor(
+        unsup, "temp", nvml.nvmlDeviceGetTemperature, h, nvml.NVML_TEMPERATURE_GPU, default=0,
+    )
+
+    # Fan speed — 0-100%. Returns 0 for passively cooled cards.
+    s.fan_speed = _sensor(unsup, "fan", nvml.nvmlDeviceGetFanSpeed, h, default=0)
+
+    # Power — NVML returns milliwatts, we want watts for display.
+    # power_draw = actual current consumption
+    # power_limit = current target (may have been raised by OC, so not static)
+    pw, pl = _read_power_fields(h, s.index)
+    if pw is None:
+        pw = _sensor(unsup, "power_draw", nvml.nvmlDeviceGetPowerUsage, h, default=0)
+    s.power_draw = pw / 1000.0 if pw else 0.0
+    if pl is None:
+        pl = _sensor(unsup, "power_limit", nvml.nvmlDeviceGetPowerManagementLimit, h, default=0)
+    s.power_limit = pl / 1000.0 if pl else 0.0
+
+    # Memory — NVML returns bytes, we convert to MB for readability (>> 20
+    # is // 2**20 for these non-negative counts)
+    mem = _sensor(unsup, "memory", nvml.nvmlDeviceGetMemoryInfo, h, default=None)
     if mem:
-        s.vram_total = mem.total // (1024 * 1024)
-        s.vram_used = mem.used // (1024 * 1024)
-        s.vram_free = mem.free // (1024 * 1024)
+        s.vram_total = mem.total >> 20
+        s.vram_used = mem.used >> 20
+        s.vram_free = mem.free >> 20
 
     # Utilization — percentage of time the GPU/memory bus is busy.
     # NOTE: util_mem is memory CONTROLLER utilization, not VRAM usage percentage.
     # High util_mem with low VRAM usage means lots of small transfers.
-    util = _safe(nvml.nvmlDeviceGetUtilizationRates, h, default=None)
+    util = _sensor(unsup, "util", nvml.nvmlDeviceGetUtilizationRates, h, default=None)
     if util:
         s.util_gpu = util.gpu
         s.util_mem = util.memory
 
-    # Performance state — P0=max perf (gaming/compute), P8=idle, P12=minimum power
-    ps = _safe(nvml.nvmlDeviceGetPerformanceState, h, default=-1)
-    s.pstate = f"P{ps}" if ps >= 0 else "?"
 
-    # Throttle reasons — bitmask telling us WHY the GPU isn't running at max clock.
-    # Critical for OC tuning: if SW_POWER_CAP is set, raise power limit.
-    # If SW_THERMAL, raise thermal limit or increase fan speed.
-    s.throttle_raw = _safe(nvml.nvmlDeviceGetCurrentClocksThrottleReasons, h, default=0)
-    s.throttle_reasons = decode_throttle_reasons(s.throttle_raw)
-
-    return s
+def snapshot_all() -> list[GpuSnapshot]:
+    """Snapshot all GPUs in the system.
 
+    With several GPUs the per-device snapshots run on a small thread pool —
+    NVML is thread-safe and its calls release the GIL, so wall time is
+    roughly the slowest GPU instead of the sum of all of them. The pool is
+    created on the first multi-GPU call and kept, so a polling loop doesn't
+    start and join threads every tick.
+    """
+    count = gpu_count()
+    if count <= 1:
+        return [snapshot(i) for i in range(count)]
+    # Open every handle and read the static fields up front so the
+    # workers never write either cache
+    for i in range(count):
+        _get_static(i)
+    global _pool
+    if _pool is None:
+        _pool = ThreadPoolExecutor(max_workers=min(count, 8), thread_name_prefix="nvml-poll")
+    return list(_pool.map(snapshot, range(count)))
+
+
+# Numeric GpuSnapshot fields → numpy dtype, for snapshot_all_soa()
+_SOA_FIELDS = (
+    ("index", "i4"),
+    ("clock_gpu", "i4"), ("clock_mem", "i4"), ("clock_sm", "i4"), ("clock_video", "i4"),
+    ("clock_gpu_max", "i4"), ("clock_mem_max", "i4"),
+    ("temp_gpu", "i4"), ("temp_gpu_max", "i4"),
+    ("fan_speed", "i4"),
+    ("power_draw", "f8"), ("power_limit", "f8"), ("power_default", "f8"),
+    ("power_min", "f8"), ("power_max", "f8"),
+    ("vram_total", "i8"), ("vram_used", "i8"), ("vram_free", "i8"),
+    ("util_gpu", "i4"), ("util_mem", "i4"),
+    ("throttle_raw", "i8"),
+    ("timestamp_ns", "i8"),
+)
+
+
+def snapshot_all_soa() -> dict:
+    """Snapshot all GPUs, returned column-wise: field name → numpy array.
+
+    One array per numeric GpuSnapshot field, element i = GPU i — the shape
+    vectorized post-processing (per-field means/peaks over a poll history,
+    np.column_stack for export) wants, without walking snapshot objects
+    field by field. Strings (name, pstate, throttle names) are left out;
+    use snapshot_all() when those are needed.
+    """
+    import numpy as np  # only this helper needs it — monitoring stays numpy-free
 
-def snapshot_all() -> list[GpuSnapshot]:
-    """Snapshot all GPUs in the system."""
-    return [snapshot(i) for i in range(gpu_count())]
+    snaps = snapshot_all()
+    return {
+        name: np.fromiter((getattr(s, name) for s in snaps), dtype=dt, count=len(snaps))
+        for name, dt in _SOA_FIELDS
+    }
 
 
 def poll(index: int = 0, interval: float = 1.0):
@@ -321,7 +593,146 @@ def poll(index: int = 0, interval: float = 1.0):
             print(snap.temp_gpu)
 
     Stop with Ctrl+C or break. Used by cli/monitor.py for continuous mode.
+
+    Snapshots are spaced on a monotonic deadline, so the period is
+    `interval` rather than interval + snapshot cost. If a snapshot (or the
+    consumer) overruns a whole period the schedule restarts from now
+    instead of firing back-to-back to catch up.
+    """
+    deadline = time.monotonic()
+    prev = None
+    while True:
+        prev = snapshot_delta(index, prev)
+        yield prev
+        deadline += interval
+        delay = deadline - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            deadline = time.monotonic()
+
+
+@dataclass(slots=True)
+class GpuSample:
+    """One driver-side sample from nvmlDeviceGetSamples.
+
+    timestamp_us is the driver's CPU timestamp in microseconds; value is in
+    the sample type's units (% for utilization, MHz for clocks, mW for power).
     """
+    timestamp_us: int
+    value: int | float
+
+
+def poll_samples(index: int = 0, sample_type: int | None = None, interval: float = 1.0):
+    """Generator yielding every sample the driver buffered, one GpuSample each.
+
+    The driver records some sensors on its own (GPU utilization by default,
+    or any NVML_*_SAMPLES type — clocks, power) many times a second. Each
+    tick fetches everything new since the last one in a single NVML call,
+    so a 1 s interval still yields the full-resolution history — far more
+    data per CPU second than a fast poll() loop. Runs forever; stop with
+    Ctrl+C or break.
+    """
+    if sample_type is None:
+        sample_type = nvml.NVML_GPU_UTILIZATION_SAMPLES
+    h = get_handle(index)
+    last_ts = 0
+    deadline = time.monotonic()
     while True:
-        yield snapshot(index)
-        time.sleep(interval)
+        try:
+            value_type, samples = nvml.nvmlDeviceGetSamples(h, sample_type, last_ts)
+        except nvml.NVMLError_NotFound:
+            samples = ()  # nothing new since last_ts
+        if samples:
+            attr = _VALUE_ATTRS[value_type]
+            for smp in samples:
+                if smp.timeStamp > last_ts:
+                    yield GpuSample(smp.timeStamp, getattr(smp.sampleValue, attr))
+            last_ts = max(last_ts, samples[-1].timeStamp)
+        deadline += interval
+        delay = deadline - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            deadline = time.monotonic()
+
+
+# ── Background poller ──
+# A GUI or overlay that wants "the current reading" many times a second
+# shouldn't wait on NVML each time. start_background_poller() runs one
+# daemon thread that snapshots the given GPUs on a fixed monotonic cadence
+# into a bounded per-GPU ring (deque(maxlen=history)). read_latest() and
+# read_history() serve from the ring with no NVML call. Opt-in only — the
+# CLI monitor polls inline. A thread rather than a sidecar process: NVML
+# calls release the GIL, and snapshots stay plain objects, not packed
+# shared-memory records.
+
+_ring_lock = threading.Lock()
+_rings: dict[int, deque] = {}               # GPU index → recent snapshots
+_poller_stop: threading.Event | None = None
+_poller_thread: threading.Thread | None = None
+
+
+def _poller_loop(indices: tuple[int, ...], interval: float, stop: threading.Event):
+    prev: dict[int, GpuSnapshot | None] = dict.fromkeys(indices)
+    deadline = time.monotonic()
+    while not stop.is_set():
+        for i in indices:
+            try:
+                s = prev[i] = snapshot_delta(i, prev[i])
+            except Exception:
+                continue  # NVML hiccup — keep the last good entry, try next tick
+            with _ring_lock:
+                _rings[i].append(s)
+        deadline += interval
+        delay = deadline - time.monotonic()
+        if delay <= 0:
+            deadline = time.monotonic()
+            delay = 0
+        stop.wait(delay)
+
+
+def start_background_poller(
+    indices: tuple[int, ...] = (0,), interval: float = 0.1, history: int = 4096,
+) -> None:
+    """Start (or restart) the background poller; keeps `history` snapshots per GPU."""
+    global _poller_stop, _poller_thread
+    stop_background_poller()
+    indices = tuple(indices)
+    for i in indices:
+        get_handle(i)  # init NVML + open handles on the caller's thread
+    with _ring_lock:
+        for i in indices:
+            _rings[i] = deque(_rings.get(i, ()), maxlen=history)
+    stop = threading.Event()
+    thread = threading.Thread(
+        target=_poller_loop, args=(indices, interval, stop),
+        name="kingai-nvml-poller", daemon=True,
+    )
+    thread.start()
+    _poller_stop, _poller_thread = stop, thread
+
+
+def stop_background_poller() -> None:
+    """Stop the background poller and wait for its thread (the history is kept)."""
+    global _poller_stop, _poller_thread
+    if _poller_stop is not None:
+        _poller_stop.set()
+        _poller_stop = None
+    if _poller_thread is not None:
+        _poller_thread.join()  # at most one in-flight tick
+        _poller_thread = None
+
+
+def read_latest(index: int = 0) -> GpuSnapshot:
+    """Newest background snapshot for index; takes a live one if none exists yet."""
+    with _ring_lock:
+        ring = _rings.get(index)
+        s = ring[-1] if ring else None
+    return s if s is not None else snapshot(index)
+
+
+def read_history(index: int = 0) -> list[GpuSnapshot]:
+    """All snapshots the background poller still holds for index, oldest first."""
+    with _ring_lock:
+        return list(_rings.get(index, ()))